@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+import click
+
+from .generate import AXES, generate as generate_spec
+from .suite import CASES, PACKAGE, compare, run as run_suite
+
+
+CONTEXT_SETTINGS = dict(
+    help_option_names=['-h', '--help'],
+)
+
+
+@click.group(context_settings=CONTEXT_SETTINGS)
+def main():
+    """Benchmarks of ramlfications"""
+
+
+@main.command(context_settings=CONTEXT_SETTINGS,
+              help="Run the benchmarks.")
+@click.option("--case", "cases", type=click.Choice(list(CASES) + [PACKAGE]),
+              multiple=True, help="Case to run (repeatable; default: all).")
+@click.option("--repeat", "-r", type=int, default=3,
+              help="Runs to take the fastest time of.")
+@click.option("--save", type=click.Path(), default=None,
+              help="Write the results to this JSON file.")
+@click.option("--baseline", type=click.Path(exists=True), default=None,
+              help="Fail on regressions against these saved results.")
+@click.option("--threshold", type=float, default=0.25,
+              help="Fraction a metric may exceed its baseline by.")
+def run(cases, repeat, save, baseline, threshold):
+    results = run_suite(cases, repeat)
+    for name, metrics in results.items():
+        click.echo("{0:<16}".format(name) + "  ".join(
+            "{0} {1:.4f}".format(metric, value)
+            for metric, value in metrics.items()))
+    if save:
+        with open(save, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare(results, json.load(f), threshold)
+        for name, metric, base, value in regressions:
+            click.secho("Regression: {0} {1} {2:.4f} -> {3:.4f}".format(
+                name, metric, base, value), fg="red", err=True)
+        if regressions:
+            raise SystemExit(1)
+
+
+def _axis_options(func):
+    for axis, default in reversed(list(AXES.items())):
+        func = click.option("--" + axis.replace("_", "-"), axis, type=int,
+                            default=default, show_default=True)(func)
+    return func
+
+
+@main.command(context_settings=CONTEXT_SETTINGS,
+              help="Write a generated spec to DIRECTORY.")
+@click.argument("directory", type=click.Path(file_okay=False))
+@_axis_options
+def generate(directory, **scale):
+    click.echo(generate_spec(directory, **scale))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+from ramlfications.utils.common import OrderedDict
+
+
+__all__ = ["AXES", "generate", "generate_files"]
+
+
+#: Scale axes of a generated spec and their default sizes
+AXES = OrderedDict([
+    # top-level resources
+    ("resources", 10),
+    # nested resources below each top-level resource
+    ("depth", 2),
+    # traits applied to each method
+    ("traits", 2),
+    # query parameters of each trait
+    ("trait_params", 3),
+    # resource types assigned to top-level resources, in turn
+    ("resource_types", 1),
+    # resource types each of those inherits through
+    ("type_depth", 1),
+    # top-level resources pulled in with ``!include``
+    ("includes", 0),
+    # data types, in a hierarchy where type ``n`` inherits from type
+    # ``(n - 1) // 2``; makes the spec RAML 1.0
+    ("data_types", 0),
+])
+
+ROOT_FILE = "api.raml"
+
+
+def _scale(scale):
+    unknown = set(scale) - set(AXES)
+    if unknown:
+        raise TypeError("Unknown axes: {0}".format(", ".join(sorted(unknown))))
+    sizes = OrderedDict(AXES)
+    sizes.update(scale)
+    return sizes
+
+
+def _named(raml_10, name, lines):
+    """Lines of a trait or resource type declaration."""
+    if raml_10:
+        head = ["  {0}:".format(name)]
+        return head + ["    " + line for line in lines]
+    head = ["  - {0}:".format(name)]
+    return head + ["      " + line for line in lines]
+
+
+def _traits(sizes, raml_10):
+    lines = ["traits:"]
+    for t in range(sizes["traits"]):
+        body = ["queryParameters:"]
+        for p in range(sizes["trait_params"]):
+            body += [
+                "  t{0}p{1}:".format(t, p),
+                "    type: integer",
+                "    minimum: 0",
+                "    maximum: 1000",
+                "    description: Parameter {0} of trait {1}".format(p, t),
+            ]
+        lines += _named(raml_10, "trait{0}".format(t), body)
+    return lines
+
+
+def _type_name(number, depth):
+    """Name of resource type ``number`` at ``depth`` of its inheritance."""
+    if number:
+        return "type{0}_{1}".format(number, depth)
+    return "type{0}".format(depth)
+
+
+def _resource_types(sizes, raml_10):
+    lines = ["resourceTypes:"]
+    for n in range(max(sizes["resource_types"], 1)):
+        for d in range(max(sizes["type_depth"], 1)):
+            body = []
+            if d:
+                body.append("type: {0}".format(_type_name(n, d - 1)))
+            body += [
+                "description: Resource type {0}".format(d),
+                "get?:",
+                "  headers:",
+                "    X-Type{0}:".format(d),
+                "      type: string",
+                "  responses:",
+                "    200:",
+                "      description: OK",
+            ]
+            lines += _named(raml_10, _type_name(n, d), body)
+    return lines
+
+
+def _data_types(sizes):
+    lines = ["types:"]
+    for d in range(sizes["data_types"]):
+        lines.append("  Type{0}:".format(d))
+        lines.append("    type: {0}".format(
+            "Type{0}".format((d - 1) // 2) if d else "object"))
+        lines += [
+            "    properties:",
+            "      field{0}:".format(d),
+            "        type: string",
+            "        required: true",
+            "        maxLength: 64",
+        ]
+    return lines
+
+
+def _methods(sizes, indent, data_type):
+    pad = " " * indent
+    traits = ", ".join("trait{0}".format(t) for t in range(sizes["traits"]))
+    lines = [pad + "get:", pad + "  description: Get it"]
+    if traits:
+        lines.append(pad + "  is: [{0}]".format(traits))
+    lines += [pad + "post:", pad + "  body:",
+              pad + "    application/json:"]
+    if data_type:
+        lines.append(pad + "      type: {0}".format(data_type))
+    else:
+        lines.append(pad + '      example: {"name": "example"}')
+    return lines
+
+
+def _resource(sizes, number, data_type):
+    """Lines of the body of top-level resource ``number``."""
+    type_name = _type_name(number % max(sizes["resource_types"], 1),
+                           max(sizes["type_depth"], 1) - 1)
+    lines = ["  type: {0}".format(type_name)]
+    lines += _methods(sizes, 2, data_type)
+    for d in range(sizes["depth"]):
+        pad = "  " * (d + 1)
+        lines += [
+            pad + "/{{id{0}}}:".format(d),
+            pad + "  uriParameters:",
+            pad + "    id{0}:".format(d),
+            pad + "      type: string",
+            pad + "      description: Level {0} of resource {1}".format(
+                d, number),
+        ]
+        lines += _methods(sizes, 2 * (d + 1) + 2, data_type)
+    return lines
+
+
+def generate_files(**scale):
+    """
+    Return the files of a spec scaled by ``scale``, see :py:data:`AXES`.
+
+    :returns: ``dict`` of the file names, relative to the spec's \
+        directory, and their contents; the RAML file to parse is \
+        ``api.raml``
+    """
+    sizes = _scale(scale)
+    raml_10 = bool(sizes["data_types"])
+    data_type = None
+    if raml_10:
+        data_type = "Type{0}".format(sizes["data_types"] - 1)
+
+    files = {}
+    lines = [
+        "#%RAML {0}".format("1.0" if raml_10 else "0.8"),
+        "title: Benchmark API",
+        "version: v1",
+        "baseUri: https://api.example.com/{version}",
+        "mediaType: application/json",
+    ]
+    if raml_10:
+        lines += _data_types(sizes)
+    if sizes["traits"]:
+        lines += _traits(sizes, raml_10)
+    lines += _resource_types(sizes, raml_10)
+    for r in range(sizes["resources"]):
+        body = _resource(sizes, r, data_type)
+        if r < sizes["includes"]:
+            name = os.path.join("resources", "r{0}.raml".format(r))
+            files[name] = "\n".join(line[2:] for line in body) + "\n"
+            lines.append("/r{0}: !include {1}".format(r, name))
+        else:
+            lines.append("/r{0}:".format(r))
+            lines += body
+    files[ROOT_FILE] = "\n".join(lines) + "\n"
+    return files
+
+
+def generate(directory, **scale):
+    """
+    Write a spec scaled by ``scale`` (see :py:data:`AXES`) to
+    ``directory``.
+
+    :returns: path of the RAML file to parse
+    """
+    for name, text in generate_files(**scale).items():
+        path = os.path.join(directory, name)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(text)
+    return os.path.join(directory, ROOT_FILE)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import ramlfications
+from ramlfications.config import setup_config
+from ramlfications.parser import parse_raml
+from ramlfications.utils import load_file
+from ramlfications.utils.common import OrderedDict
+from ramlfications.validate.payload import compile_data_type
+
+from .generate import generate
+
+
+__all__ = ["CASES", "PACKAGE", "compare", "run"]
+
+
+#: Specs to benchmark: each scales one axis of
+#: :py:data:`.generate.AXES` well past its default
+CASES = OrderedDict([
+    ("default", {}),
+    ("resources", {"resources": 200}),
+    ("depth", {"depth": 12}),
+    ("traits", {"traits": 12}),
+    ("trait_params", {"trait_params": 30}),
+    ("resource_types", {"resource_types": 50}),
+    ("type_depth", {"type_depth": 10}),
+    ("includes", {"resources": 50, "includes": 50}),
+    ("data_types", {"data_types": 50}),
+])
+
+#: Name of the results of :py:func:`measure_package`
+PACKAGE = "package"
+
+#: Modules whose import time :py:func:`measure_package` measures: the
+#: package, and what parsing imports
+IMPORTED = ("ramlfications", "ramlfications.parser")
+
+#: Config file the benchmarks parse with: validating, any version
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config.ini")
+
+#: Payloads validated by the ``payload`` metrics of each case
+PAYLOADS = 2000
+
+
+def config():
+    """Configuration the benchmarks parse with, see :py:data:`CONFIG_FILE`."""
+    return setup_config(CONFIG_FILE)
+
+
+def best_time(func, repeat):
+    """Fastest of ``repeat`` runs of ``func``, in seconds."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_memory(func):
+    """Peak memory allocated while running ``func``, in MiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def _payload_seconds(api, repeat):
+    """Seconds taken to validate :py:data:`PAYLOADS` request payloads."""
+    if api.types:
+        data_type = api.types[-1]
+        check = compile_data_type(data_type)
+        payload = dict((name, "value") for name in data_type.properties)
+    else:
+        resource = api.resources.filter_by(method="get")[-1]
+        query = dict((p.name, "10") for p in resource.query_params)
+        uri = dict((p.name, "id") for p in resource.uri_params)
+        request = {"uri": uri, "query": query,
+                   "headers": {"X-Type0": "x"}}
+
+        def check(request):
+            return resource.validate_request(request)
+        payload = request
+
+    def validate_payloads():
+        for _ in range(PAYLOADS):
+            assert not check(payload)
+    return best_time(validate_payloads, repeat)
+
+
+def measure(raml_file, config_file=CONFIG_FILE, repeat=3):
+    """
+    Measure parsing, validating and validating payloads with a spec.
+
+    :returns: ``dict`` of the metrics: ``parse`` and ``validate`` \
+        (:py:func:`ramlfications.validate` with ``fast=True``) seconds, \
+        ``parse_peak`` MiB and ``payload`` seconds
+    """
+    conf = setup_config(config_file)
+
+    def parse():
+        return parse_raml(load_file(raml_file), conf)
+
+    def validate():
+        ramlfications.validate(raml_file, config_file, fast=True)
+
+    return OrderedDict([
+        ("parse", best_time(parse, repeat)),
+        ("validate", best_time(validate, repeat)),
+        ("parse_peak", peak_memory(parse)),
+        ("payload", _payload_seconds(parse(), repeat)),
+    ])
+
+
+def _import_seconds(module):
+    """
+    Seconds importing ``module`` takes in a new interpreter, as reported
+    by ``-X importtime``.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(ramlfications.__file__)),
+    )
+    for line in proc.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 10 ** 6
+
+
+def _package_size():
+    """KiB of the Python source files installed with ramlfications."""
+    size = 0
+    package = os.path.dirname(ramlfications.__file__)
+    for directory, _, file_names in os.walk(package):
+        size += sum(os.path.getsize(os.path.join(directory, f))
+                    for f in file_names if f.endswith(".py"))
+    return size / 2 ** 10
+
+
+def measure_package(repeat=3):
+    """
+    Measure what installing and importing ramlfications costs.
+
+    :returns: ``dict`` of the metrics: ``import`` and ``import_parser`` \
+        seconds, the fastest of ``repeat`` imports of each of \
+        :py:data:`IMPORTED`, and ``source_size`` KiB
+    """
+    metrics = OrderedDict()
+    for module in IMPORTED:
+        name = "import" + module[len("ramlfications"):].replace(".", "_")
+        metrics[name] = min(_import_seconds(module) for _ in range(repeat))
+    metrics["source_size"] = _package_size()
+    return metrics
+
+
+def run(cases=None, repeat=3):
+    """
+    Run the benchmarks of ``cases`` (names of :py:data:`CASES` or
+    :py:data:`PACKAGE`, all of them by default).
+
+    :returns: ``dict`` of each case's metrics, see :py:func:`measure` \
+        and :py:func:`measure_package`
+    """
+    results = OrderedDict()
+    for name in cases or list(CASES) + [PACKAGE]:
+        if name == PACKAGE:
+            results[name] = measure_package(repeat)
+            continue
+        directory = tempfile.mkdtemp(prefix="ramlfications-bench-")
+        try:
+            raml_file = generate(directory, **CASES[name])
+            results[name] = measure(raml_file, repeat=repeat)
+        finally:
+            shutil.rmtree(directory)
+    return results
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    Compare ``results`` to those of a previous :py:func:`run`.
+
+    :param float threshold: fraction by which a metric may exceed its \
+        baseline before it counts as a regression
+    :returns: list of ``(case, metric, baseline, value)`` of the \
+        regressions
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(name, {}).get(metric)
+            if base is not None and value > base * (1 + threshold):
+                regressions.append((name, metric, base, value))
+    return regressions
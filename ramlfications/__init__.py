@@ -3,10 +3,11 @@
 
 from __future__ import absolute_import, division, print_function
 
-from ramlfications.config import setup_config
-from ramlfications.parser import parse_raml
+import importlib
 
-from ramlfications.utils import load_file, load_string
+# The ``validate`` subpackage is light; import it before the ``validate``
+# helper below so that a later import of it does not replace the helper.
+import ramlfications.validate  # NOQA
 
 
 __author__ = "Lynn Root"
@@ -18,33 +19,66 @@ __uri__ = "https://ramlfications.readthedocs.io"
 __description__ = "A Python RAML parser"
 
 
-def load(raml_file):
+# Loading the parser pulls in all the models, so it is deferred until the
+# first parse, keeping ``import ramlfications`` cheap.
+_LAZY_ATTRS = {
+    "setup_config": "ramlfications.config",
+    "parse_raml": "ramlfications.parser",
+    "load_file": "ramlfications.utils",
+    "load_string": "ramlfications.utils",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name])
+        return getattr(module, name)
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def _guard(limits):
+    if limits is None:
+        return None
+    return limits.guard()
+
+
+def load(raml_file, limits=None):
     """
     Module helper function to load a RAML File using \
     :py:class:`.loader.RAMLLoader`.
 
     :param str raml_file: String path to RAML file
+    :param Limits limits: Limits on loading (see \
+        :py:class:`.limits.Limits`); the defaults if ``None``.
     :return: loaded RAML
     :rtype: dict
     :raises LoadRAMLError: If error occurred trying to load the RAML file
+    :raises LimitExceededError: If a limit was exceeded.
     """
-    return load_file(raml_file)
+    from ramlfications.utils import load_file
+    return load_file(raml_file, _guard(limits))
 
 
-def loads(raml_string):
+def loads(raml_string, limits=None):
     """
     Module helper function to load a RAML File using \
     :py:class:`.loader.RAMLLoader`.
 
     :param str raml_string: String of RAML data
+    :param Limits limits: Limits on loading (see \
+        :py:class:`.limits.Limits`); the defaults if ``None``.
     :return: loaded RAML
     :rtype: dict
     :raises LoadRAMLError: If error occurred trying to load the RAML file
+    :raises LimitExceededError: If a limit was exceeded.
     """
-    return load_string(raml_string)
+    from ramlfications.utils import load_string
+    return load_string(raml_string, _guard(limits))
 
 
-def parse(raml, config_file=None):
+def parse(raml, config_file=None, limits=None, memory=None, keep_raw=True,
+          weak_refs=False, gc_mode=None):
     """
     Module helper function to parse a RAML File.  First loads the RAML file
     with :py:class:`.loader.RAMLLoader` then parses with
@@ -54,10 +88,30 @@ def parse(raml, config_file=None):
     :param raml: Either string path to the RAML file, a file object, or \
         a string representation of RAML.
     :param str config_file:  String path to desired config file, if any.
+    :param Limits limits: Limits on loading and parsing (see \
+        :py:class:`.limits.Limits`); those of the config file if ``None``.
+    :param MemoryReport memory: Filled in with the memory each stage \
+        of the parse allocated and the parsed API retains, if given \
+        (see :py:class:`.memory.MemoryReport`); tracing it slows the \
+        parse down.
+    :param bool keep_raw: Keep the loaded RAML data in the ``raw`` of \
+        each node, parameter and body, and in the root's ``raml_obj``; \
+        if ``False``, it is released once parsed, which saves a quarter \
+        to a third of the memory the parsed API takes (see \
+        :py:func:`.parser.pipeline.release_raw`).
+    :param bool weak_refs: Make the ``root`` of each node a weak \
+        reference, so that the parsed API has no reference cycles and is \
+        freed as soon as it is not used anymore, instead of by the cyclic \
+        garbage collector; keep a reference to the API while using its \
+        nodes (see :py:func:`.parser.pipeline.weaken_references`).
+    :param str gc_mode: ``"disable"`` to turn the cyclic garbage \
+        collector off while parsing, ``"freeze"`` to also freeze what is \
+        left afterwards (see :py:func:`gc.freeze`), or ``None``.
     :return: parsed API
     :rtype: RAMLRoot
     :raises LoadRAMLError: If error occurred trying to load the RAML file
         (see :py:class:`.loader.RAMLLoader`)
+    :raises LimitExceededError: If a limit was exceeded.
     :raises InvalidRootNodeError: API metadata is invalid according to RAML \
         `specification <http://raml.org/spec.html>`_.
     :raises InvalidResourceNodeError: API resource endpoint is invalid \
@@ -65,12 +119,59 @@ def parse(raml, config_file=None):
     :raises InvalidParameterError: Named parameter is invalid \
         according to RAML `specification <http://raml.org/spec.html>`_.
     """
-    loader = load(raml)
+    from ramlfications.config import setup_config
+    from ramlfications.parser import parse_raml
+    from ramlfications.utils import load_file
+
+    config = setup_config(config_file)
+    guard = (limits or config["limits"]).guard()
+    if memory is not None:
+        from ramlfications.parser.pipeline import ParsePipeline
+
+        # loading is a stage of its own in the report
+        return memory.run(ParsePipeline(raml, config, guard,
+                                        keep_raw=keep_raw,
+                                        weak_refs=weak_refs,
+                                        gc_mode=gc_mode))
+    loader = load_file(raml, guard)
+    return parse_raml(loader, config, guard, keep_raw=keep_raw,
+                      weak_refs=weak_refs, gc_mode=gc_mode)
+
+
+def iter_resources(raml, config_file=None, limits=None):
+    """
+    Module helper function to parse a RAML File resource by resource:
+    a generator of the :py:class:`.resources.ResourceNode` objects of
+    the API, in document order, see :py:func:`.parser.iter_resources`.
+
+    Unlike :py:func:`parse`, resources are yielded as soon as they are
+    parsed and are not kept afterwards.
+
+    :param raml: Either string path to the RAML file, a file object, or \
+        a string representation of RAML.
+    :param str config_file:  String path to desired config file, if any.
+    :param Limits limits: Limits on loading and parsing (see \
+        :py:class:`.limits.Limits`); those of the config file if ``None``.
+    :return: generator of resource nodes
+    :raises LoadRAMLError: If error occurred trying to load the RAML file
+        (see :py:class:`.loader.RAMLLoader`)
+    :raises LimitExceededError: If a limit was exceeded.
+    :raises InvalidRAMLError: RAML file is invalid according to RAML \
+        `specification <http://raml.org/spec.html>`_; for invalid \
+        resources, once all resources were yielded.
+    """
+    from ramlfications.config import setup_config
+    from ramlfications.parser import iter_resources as _iter_resources
+    from ramlfications.utils import load_file
+
     config = setup_config(config_file)
-    return parse_raml(loader, config)
+    guard = (limits or config["limits"]).guard()
+    loader = load_file(raml, guard)
+    return _iter_resources(loader, config, guard)
 
 
-def validate(raml, config_file=None):
+def validate(raml, config_file=None, limits=None, fast=False,
+             fail_fast=None):
     """
     Module helper function to validate a RAML File.  First loads \
     the RAML file \
@@ -80,9 +181,17 @@ def validate(raml, config_file=None):
     :param str raml: Either string path to the RAML file, a file object, or
         a string representation of RAML.
     :param str config_file:  String path to desired config file, if any.
+    :param Limits limits: Limits on loading and parsing (see \
+        :py:class:`.limits.Limits`); those of the config file if ``None``.
+    :param bool fast: Validate the loaded RAML without parsing it into \
+        nodes (see :py:func:`.validate.raw.validate_raw`); same errors, \
+        in a fraction of the time and memory.
+    :param fail_fast: Stop at the first error if ``True``, or at that \
+        many errors if a number, instead of validating the whole file.
     :return: No return value if successful
     :raises LoadRAMLError: If error occurred trying to load the RAML file
         (see :py:class:`.loader.RAMLLoader`)
+    :raises LimitExceededError: If a limit was exceeded.
     :raises InvalidRootNodeError: API metadata is invalid according to RAML \
         `specification <http://raml.org/spec.html>`_.
     :raises InvalidResourceNodeError: API resource endpoint is invalid \
@@ -92,7 +201,92 @@ def validate(raml, config_file=None):
     :raises InvalidRAMLError: RAML file is invalid according to RAML \
         `specification <http://raml.org/spec.html>`_.
     """
-    loader = load(raml)
+    from ramlfications.config import setup_config
+    from ramlfications.parser import parse_raml
+    from ramlfications.utils import load_file
+
     config = setup_config(config_file)
     config["validate"] = True
-    parse_raml(loader, config)
+    guard = (limits or config["limits"]).guard()
+    loader = load_file(raml, guard)
+    if fast:
+        from ramlfications.errors import InvalidRAMLError
+        from ramlfications.validate.raw import validate_raw
+
+        errors = validate_raw(loader, config, guard, fail_fast)
+        if errors:
+            raise InvalidRAMLError(errors)
+        return
+    parse_raml(loader, config, guard, fail_fast)
+
+
+def compile_raml(raml, output, config_file=None):
+    """
+    Module helper function to parse a RAML File and write the parsed API
+    to a compiled RAML file, which :py:func:`load_compiled` loads without
+    going through loading, parsing and validation again.
+
+    :param raml: Either string path to the RAML file, a file object, or \
+        a string representation of RAML.
+    :param output: String path or binary file object to write to.
+    :param str config_file:  String path to desired config file, if any.
+    :raises LoadRAMLError: If error occurred trying to load the RAML file
+        (see :py:class:`.loader.RAMLLoader`)
+    :raises InvalidRAMLError: RAML file is invalid according to RAML \
+        `specification <http://raml.org/spec.html>`_.
+    """
+    from ramlfications.compiled import dump_compiled
+
+    dump_compiled(parse(raml, config_file), output)
+
+
+def load_compiled(compiled):
+    """
+    Module helper function to load a parsed API from a compiled RAML file
+    written by :py:func:`compile_raml`.
+
+    :param compiled: String path or binary file object of the compiled \
+        RAML file.
+    :return: parsed API
+    :rtype: RAMLRoot
+    :raises LoadRAMLError: If the file is not a compiled RAML file, or was
+        compiled by another version of ``ramlfications``.
+    """
+    from ramlfications.compiled import load_compiled
+
+    return load_compiled(compiled)
+
+
+def map_raml(raml, output, config_file=None):
+    """
+    Module helper function to parse a RAML File and write its resources
+    to a read-only API file for :py:func:`load_mapped`.
+
+    :param raml: Either string path to the RAML file, a file object, or \
+        a string representation of RAML.
+    :param output: String path or binary file object to write to.
+    :param str config_file:  String path to desired config file, if any.
+    :raises LoadRAMLError: If error occurred trying to load the RAML file
+        (see :py:class:`.loader.RAMLLoader`)
+    :raises InvalidRAMLError: RAML file is invalid according to RAML \
+        `specification <http://raml.org/spec.html>`_.
+    """
+    from ramlfications.mapped import dump_mapped
+
+    dump_mapped(parse(raml, config_file), output)
+
+
+def load_mapped(path):
+    """
+    Module helper function to memory-map a read-only API file written by
+    :py:func:`map_raml`.  Processes mapping the same file share one copy
+    of it in memory.
+
+    :param str path: String path of the API file.
+    :return: read-only view of the API
+    :rtype: MappedAPI
+    :raises LoadRAMLError: If the file is not a mapped API file.
+    """
+    from ramlfications.mapped import load_mapped
+
+    return load_mapped(path)
@@ -4,14 +4,18 @@
 
 from __future__ import absolute_import, division, print_function
 
+import json
+
 import click
 
+from .batch import GRAPH_FILE, IncludeGraph, validate_files
 from .tree import tree as ttree
 from .errors import InvalidRAMLError
 from .utils import update_mime_types as umt
 from .utils import load_file
 
-from ramlfications import validate as vvalidate
+from ramlfications import compile_raml as ccompile
+from ramlfications import map_raml as cmap
 
 
 #: Global Click defaults
@@ -27,20 +31,54 @@ def main():
 
 
 @main.command(context_settings=CONTEXT_SETTINGS,
-              help="Validate a RAML file.")
-@click.argument("ramlfile", type=click.Path(exists=True))
+              help=("Validate RAML files, and the *.raml files in "
+                    "directories."))
+@click.argument("paths", nargs=-1, required=True,
+                type=click.Path(exists=True))
 @click.option("--config", "-c", type=click.Path(exists=True),
               help="Additionally supported items beyond RAML spec.")
-def validate(ramlfile, config):
-    """Validate a given RAML file."""
-    try:
-        vvalidate(ramlfile, config)
-        click.secho("Success! Valid RAML file: {0}".format(ramlfile),
-                    fg="green")
-
-    except InvalidRAMLError as e:
-        msg = "Error validating file {0}: \n{1}".format(ramlfile, e)
-        click.secho(msg, fg="red", err=True)
+@click.option("--fast", default=False, is_flag=True,
+              help="Validate without building the API's objects.")
+@click.option("--fail-fast", "-x", default=False, is_flag=True,
+              help="Stop at the first error.")
+@click.option("--max-errors", type=int, default=None,
+              help="Stop after this many errors.")
+@click.option("--jobs", "-j", type=int, default=1,
+              help="Files to validate in parallel (0: one per CPU).")
+@click.option("--json", "as_json", default=False, is_flag=True,
+              help="Print a JSON object per file.")
+@click.option("--changed", type=click.Path(), multiple=True,
+              help=("Only validate the RAML files including this file "
+                    "(repeatable)."))
+@click.option("--graph", type=click.Path(), default=None,
+              help=("Include graph file to read and update (default with "
+                    "--changed: {0}).".format(GRAPH_FILE)))
+def validate(paths, config, fast, fail_fast, max_errors, jobs, as_json,
+             changed, graph):
+    """Validate the given RAML files."""
+    if changed and graph is None:
+        graph = GRAPH_FILE
+    include_graph = IncludeGraph(graph) if graph else None
+    results = validate_files(paths, config, jobs=jobs, fast=fast,
+                             fail_fast=max_errors or fail_fast,
+                             changed=changed or None, graph=include_graph)
+    failed = False
+    for result in results:
+        failed = failed or not result.valid
+        if as_json:
+            click.echo(json.dumps(result.to_dict()))
+        elif result.valid:
+            click.secho("Success! Valid RAML file: {0}".format(
+                result.raml_file), fg="green")
+        else:
+            errors = "\n".join("\t{0}: {1}".format(*error)
+                               for error in result.errors)
+            msg = "Error validating file {0}: \n\n{1}".format(
+                result.raml_file, errors)
+            click.secho(msg, fg="red", err=True)
+    if include_graph is not None:
+        include_graph.save()
+    if failed:
         raise SystemExit(1)
 
 
@@ -70,6 +108,73 @@ def tree(ramlfile, color, output, verbose, validate, config):
         raise SystemExit(1)
 
 
+@main.command(context_settings=CONTEXT_SETTINGS,
+              help="Compile a RAML file for fast loading.")
+@click.argument("ramlfile", type=click.Path(exists=True))
+@click.option("-o", "--output", type=click.Path(), default=None,
+              help=("Compiled file to write (default: RAMLFILE + 'c', or "
+                    "RAMLFILE + '.map' with --mapped)."))
+@click.option("--config", "-c", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+@click.option("--mapped", is_flag=True, default=False,
+              help=("Write a read-only API file for "
+                    "'ramlfications.load_mapped' instead."))
+def compile(ramlfile, output, config, mapped):
+    """Parse a RAML file and save it for ``ramlfications.load_compiled``."""
+    try:
+        if mapped:
+            output = output or ramlfile + ".map"
+            cmap(ramlfile, output, config)
+        else:
+            output = output or ramlfile + "c"
+            ccompile(ramlfile, output, config)
+        click.secho("Compiled {0} to {1}".format(ramlfile, output),
+                    fg="green")
+    except InvalidRAMLError as e:
+        msg = "Error validating file {0}: \n{1}".format(ramlfile, e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(1)
+
+
+@main.command(context_settings=CONTEXT_SETTINGS,
+              help="Show what parsing a RAML file takes.")
+@click.argument("ramlfile", type=click.Path(exists=True))
+@click.option("--config", "-c", type=click.Path(exists=True),
+              help="Additionally supported items beyond RAML spec.")
+@click.option("--memory", is_flag=True, default=False,
+              help=("Report the memory each stage allocates and each "
+                    "model class retains."))
+@click.option("--no-raw", is_flag=True, default=False,
+              help="Release the loaded RAML data once parsed.")
+def stats(ramlfile, config, memory, no_raw):
+    """Print the time, and memory, each stage of parsing takes."""
+    from .config import setup_config
+    from .memory import MemoryReport
+    from .parser.pipeline import ParsePipeline
+
+    pipeline = ParsePipeline(ramlfile, setup_config(config),
+                             keep_raw=not no_raw)
+    report = MemoryReport() if memory else None
+    try:
+        api = report.run(pipeline) if memory else pipeline.run()
+    except InvalidRAMLError as e:
+        msg = "Error validating file {0}: \n{1}".format(ramlfile, e)
+        click.secho(msg, fg="red", err=True)
+        raise SystemExit(1)
+
+    click.echo("{0:<24}{1:>14}".format("Stage", "Seconds"))
+    for name, seconds in pipeline.timings.items():
+        click.echo("{0:<24}{1:>14.3f}".format(name, seconds))
+    click.echo("")
+    for name in ("resources", "traits", "resource_types", "types",
+                 "security_schemes"):
+        click.echo("{0:<24}{1:>14}".format(
+            name, len(getattr(api, name, None) or [])))
+    if memory:
+        click.echo("")
+        click.echo(report.format())
+
+
 @main.command(context_settings=CONTEXT_SETTINGS,
               help="Update RAMLfications' supported MIME types from IANA.")
 def update():
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import io
+import json
+import os
+import re
+import threading
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+from six import string_types
+from six.moves.urllib.parse import unquote, urljoin, urlsplit
+
+from .errors import LoadRAMLError
+from .limits import Limits, read_limited
+from .loader import JSON_REF_RE, RAMLLoader
+
+
+__all__ = ["load", "loads", "parse"]
+
+
+#: Number of threads of the default executor
+MAX_WORKERS = 4
+
+INCLUDE_RE = re.compile(r"!include\s+([^\s#]+)")
+YAML_EXTENSIONS = (".yaml", ".yml", ".raml")
+
+# ``parse_raml`` toggles ``attr``'s global validator switch, so parses
+# can not overlap; loading can.
+_PARSE_LOCK = threading.Lock()
+
+# Parse jobs of each event loop run in a thread one at a time, so that
+# jobs waiting for ``_PARSE_LOCK`` don't take up the threads file I/O
+# runs in; they wait on the event loop instead.
+_LOOP_LOCKS = weakref.WeakKeyDictionary()
+
+_executor = []
+
+
+def _default_executor():
+    if not _executor:
+        _executor.append(ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="ramlfications-aio"))
+    return _executor[0]
+
+
+#####
+# Prefetching included files
+#####
+def _read_text(file_name, size=-1):
+    try:
+        with io.open(file_name, "r", encoding="UTF-8") as f:
+            return read_limited(f, size)
+    except (IOError, OSError):
+        # left for the loader to report
+        return None
+
+
+def _references(file_name, text, root=False):
+    """
+    Absolute paths of the files ``!include`` d or locally ``$ref`` ed by
+    ``text``, the content of ``file_name``.  Commented out or quoted
+    includes may be picked up too; they are merely read for nothing.
+    """
+    base_dir = os.path.dirname(file_name)
+    ext = os.path.splitext(file_name)[1]
+    if root or ext in YAML_EXTENSIONS:
+        return [os.path.abspath(os.path.join(base_dir, ref))
+                for ref in INCLUDE_RE.findall(text)]
+    if ext == ".json":
+        base_uri = "file:" + base_dir + "/"
+        refs = []
+        for ref in JSON_REF_RE.findall(text):
+            uri = urlsplit(urljoin(base_uri, ref))
+            if uri.scheme == "file":
+                refs.append(os.path.abspath(unquote(uri.path)))
+        return refs
+    return []
+
+
+async def _prefetch(raml_file, executor, text=None, limits=None):
+    """
+    Read ``raml_file`` and every file it includes, level by level, the
+    files of a level concurrently.  The number and size of the files
+    read are bounded by ``limits``.
+
+    :returns: file contents by absolute path
+    :rtype: dict
+    """
+    loop = asyncio.get_running_loop()
+    guard = (limits or Limits()).guard()
+    files = {}
+    if text is None:
+        pending = [raml_file]
+    else:
+        files[raml_file] = text
+        guard.add_document(text, raml_file)
+        pending = _references(raml_file, text, root=True)
+    while pending:
+        paths = [p for p in dict.fromkeys(pending) if p not in files]
+        for path in paths:
+            if path != raml_file:
+                guard.add_include(path, [])
+        size = guard.read_size()
+        texts = await asyncio.gather(*[
+            loop.run_in_executor(executor, _read_text, p, size)
+            for p in paths])
+        pending = []
+        for path, text in zip(paths, texts):
+            files[path] = text
+            if text is not None:
+                guard.add_document(text, path)
+                pending.extend(_references(path, text, path == raml_file))
+    return files
+
+
+class _PrefetchedLoader(RAMLLoader):
+    """
+    :py:class:`.loader.RAMLLoader` reading included files from memory.
+
+    :param dict files: file contents by absolute path, as returned by
+        :py:func:`_prefetch`; files missing from it are read from disk
+    :param LimitGuard guard: enforces the limits on loading
+    :param threading.Event cancelled: set to stop loading
+    """
+    def __init__(self, files, guard=None, cancelled=None):
+        super(_PrefetchedLoader, self).__init__(guard)
+        self.files = files
+        self.cancelled = cancelled
+
+    def _check_cancelled(self):
+        if self.cancelled is not None and self.cancelled.is_set():
+            raise LoadRAMLError("Loading RAML was cancelled.")
+
+    def _read(self, file_name):
+        self._check_cancelled()
+        text = self.files.get(os.path.abspath(file_name))
+        if text is None:
+            return super(_PrefetchedLoader, self)._read(file_name)
+        return text
+
+    def _load_json_ref(self, uri, **kwargs):
+        self._check_cancelled()
+        parts = urlsplit(uri)
+        if parts.scheme == "file":
+            text = self.files.get(os.path.abspath(unquote(parts.path)))
+            if text is not None:
+                return json.loads(text, **kwargs)
+        return super(_PrefetchedLoader, self)._load_json_ref(uri, **kwargs)
+
+
+#####
+# Executor jobs; module-level so process pools can run them too
+#####
+def _load_prefetched(raml_file, files, limits=None, cancelled=None,
+                     guard=None):
+    if guard is None and limits is not None:
+        guard = limits.guard()
+    stream = io.StringIO(files[raml_file])
+    # the loader resolves includes relative to the name of the stream
+    stream.name = raml_file
+    try:
+        return _PrefetchedLoader(files, guard, cancelled).load(stream)
+    except IOError as e:
+        raise LoadRAMLError(e)
+
+
+def _parse_prefetched(raml_file, files, config, limits=None,
+                      cancelled=None):
+    from .parser import parse_raml
+
+    guard = (limits or config["limits"]).guard()
+    loaded = _load_prefetched(raml_file, files, cancelled=cancelled,
+                              guard=guard)
+    with _PARSE_LOCK:
+        if cancelled is not None and cancelled.is_set():
+            raise LoadRAMLError("Parsing RAML was cancelled.")
+        return parse_raml(loaded, config, guard)
+
+
+#####
+# Coroutines
+#####
+async def _files(raml, executor, limits):
+    """Returns ``(raml_file, files)`` to pass to the executor jobs."""
+    if raml is None:
+        raise LoadRAMLError("RAML file can not be 'None'.")
+    if isinstance(raml, bytes):
+        raml = raml.decode("UTF-8")
+    if isinstance(raml, string_types):
+        raml_file = os.path.abspath(raml)
+        files = await _prefetch(raml_file, executor, limits=limits)
+        if files[raml_file] is None:
+            msg = "No such RAML file: '{0}'".format(raml_file)
+            raise LoadRAMLError(msg)
+        return raml_file, files
+    if hasattr(raml, "read"):
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(executor, raml.read)
+        name = getattr(raml, "name", None)
+        raml_file = os.path.abspath(name) if name else os.path.abspath(
+            "<file>")
+        return raml_file, await _prefetch(raml_file, executor, text, limits)
+    msg = ("Can not load object '{0}': Not a basestring type or "
+           "file object".format(raml))
+    raise LoadRAMLError(msg)
+
+
+def _loop_lock():
+    """The ``asyncio.Lock`` of the running event loop for parse jobs."""
+    loop = asyncio.get_running_loop()
+    lock = _LOOP_LOCKS.get(loop)
+    if lock is None:
+        lock = _LOOP_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+def _release_later(loop, lock):
+    def release(_):
+        try:
+            loop.call_soon_threadsafe(lock.release)
+        except RuntimeError:
+            # the event loop was closed; so is its lock
+            pass
+    return release
+
+
+async def _run(executor, job, *args, serialize=False):
+    """
+    Run ``job`` in ``executor``.  If the awaiting task is cancelled, a
+    job running in a thread is asked to stop at its next include or
+    before parsing.
+
+    :param bool serialize: run in a thread only once the jobs submitted \
+        with it before in the running event loop ended
+    """
+    cancelled = None
+    lock = None
+    if isinstance(executor, ThreadPoolExecutor):
+        cancelled = threading.Event()
+        if serialize:
+            lock = _loop_lock()
+    if lock is not None:
+        await lock.acquire()
+        try:
+            future = executor.submit(job, *args, cancelled=cancelled)
+        except BaseException:
+            lock.release()
+            raise
+        # held until the job ends, even if the awaiting task is cancelled
+        future.add_done_callback(
+            _release_later(asyncio.get_running_loop(), lock))
+    else:
+        future = executor.submit(job, *args, cancelled=cancelled)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if cancelled is not None:
+            cancelled.set()
+        raise
+
+
+async def _with_timeout(coro, timeout):
+    if timeout is None:
+        return await coro
+    return await asyncio.wait_for(coro, timeout)
+
+
+def _limits(limits, timeout):
+    """
+    ``limits``, with a timeout no longer than ``timeout``: a job then
+    stops by itself once the awaiting coroutine timed out.
+    """
+    limits = limits or Limits()
+    if timeout is not None and (limits.timeout is None or
+                                limits.timeout > timeout):
+        limits = attr.evolve(limits, timeout=timeout)
+    return limits
+
+
+async def load(raml_file, executor=None, timeout=None, limits=None):
+    """
+    Coroutine loading a RAML file like :py:func:`ramlfications.load`,
+    without blocking the event loop: the RAML file and the files it
+    includes (``!include`` and local JSON ``$ref``) are read
+    concurrently in ``executor``, where they are then loaded.
+
+    :param raml_file: String path to the RAML file, or a file object.
+    :param executor: :py:class:`concurrent.futures.Executor` to run file \
+        I/O and loading in; defaults to a shared pool of \
+        :py:data:`MAX_WORKERS` threads.
+    :param float timeout: Seconds to wait for, or ``None``.
+    :param Limits limits: Limits on loading (see \
+        :py:class:`.limits.Limits`); the defaults if ``None``.
+    :return: loaded RAML
+    :rtype: dict
+    :raises LoadRAMLError: If error occurred trying to load the RAML file
+    :raises LimitExceededError: If a limit was exceeded.
+    :raises asyncio.TimeoutError: If ``timeout`` expired.
+    """
+    executor = executor or _default_executor()
+    limits = _limits(limits, timeout)
+
+    async def _load():
+        raml_path, files = await _files(raml_file, executor, limits)
+        return await _run(executor, _load_prefetched, raml_path, files,
+                          limits)
+    return await _with_timeout(_load(), timeout)
+
+
+async def loads(raml_string, executor=None, timeout=None, limits=None):
+    """
+    Coroutine loading a string of RAML data like
+    :py:func:`ramlfications.loads`; see :py:func:`load`.
+    """
+    executor = executor or _default_executor()
+    limits = _limits(limits, timeout)
+
+    async def _loads():
+        # includes are relative to the working directory
+        raml_path = os.path.abspath("<string>")
+        files = await _prefetch(raml_path, executor, raml_string, limits)
+        return await _run(executor, _load_prefetched, raml_path, files,
+                          limits)
+    return await _with_timeout(_loads(), timeout)
+
+
+async def parse(raml, config_file=None, executor=None, timeout=None,
+                limits=None):
+    """
+    Coroutine parsing a RAML file like :py:func:`ramlfications.parse`,
+    without blocking the event loop.
+
+    Files are read as by :py:func:`load`; loading and parsing then run
+    in ``executor``.  Parses are serialized within a process: pass a
+    :py:class:`concurrent.futures.ProcessPoolExecutor` to parse several
+    RAML files in parallel.  In a thread pool, a parse waiting for
+    another one waits on the event loop, not in a thread: it leaves the
+    other threads to file I/O.
+
+    ``timeout`` also caps the ``timeout`` of the limits, so a parse
+    that timed out stops by itself at its next include or resource.  On
+    cancellation, a parse running in a thread is stopped at its next
+    include or before it starts parsing; one that already started runs
+    to completion in the background.
+
+    :param raml: String path to the RAML file, or a file object.
+    :param str config_file:  String path to desired config file, if any.
+    :param executor: :py:class:`concurrent.futures.Executor` to run file \
+        I/O and parsing in; defaults to a shared pool of \
+        :py:data:`MAX_WORKERS` threads.
+    :param float timeout: Seconds to wait for, or ``None``.
+    :param Limits limits: Limits on loading and parsing (see \
+        :py:class:`.limits.Limits`); those of the config file if ``None``.
+    :return: parsed API
+    :rtype: RAMLRoot
+    :raises LoadRAMLError: If error occurred trying to load the RAML file
+    :raises LimitExceededError: If a limit was exceeded.
+    :raises InvalidRAMLError: RAML file is invalid according to RAML \
+        `specification <http://raml.org/spec.html>`_.
+    :raises asyncio.TimeoutError: If ``timeout`` expired.
+    """
+    from .config import setup_config
+
+    executor = executor or _default_executor()
+
+    async def _parse():
+        loop = asyncio.get_running_loop()
+        config = await loop.run_in_executor(executor, setup_config,
+                                            config_file)
+        parse_limits = _limits(limits or config["limits"], timeout)
+        raml_path, files = await _files(raml, executor, parse_limits)
+        return await _run(executor, _parse_prefetched, raml_path, files,
+                          config, parse_limits, serialize=True)
+    return await _with_timeout(_parse(), timeout)
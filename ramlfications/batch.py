@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import attr
+
+from .errors import InvalidRAMLError, LoadRAMLError
+
+
+__all__ = ["IncludeGraph", "ValidationResult", "find_raml_files",
+           "validate_files"]
+
+
+RAML_EXTENSION = ".raml"
+
+#: Default file :py:class:`IncludeGraph` is saved in
+GRAPH_FILE = ".ramlfications-includes.json"
+
+
+@attr.s
+class ValidationResult(object):
+    """
+    Result of validating one RAML file with :py:func:`validate_files`.
+
+    :param str raml_file: path of the RAML file
+    :param list errors: ``(error type name, message)`` pairs of the \
+        errors found, empty if the file is valid
+    :param list dependencies: absolute paths of the RAML file and of \
+        the files it includes, directly or not
+    """
+    raml_file = attr.ib()
+    errors = attr.ib(default=attr.Factory(list))
+    dependencies = attr.ib(default=attr.Factory(list))
+
+    @property
+    def valid(self):
+        return not self.errors
+
+    def to_dict(self):
+        """Return the result as a dict, e.g. to dump as JSON."""
+        return {
+            "file": self.raml_file,
+            "valid": self.valid,
+            "errors": [{"type": t, "message": m} for t, m in self.errors],
+        }
+
+
+def find_raml_files(paths):
+    """
+    Return the RAML files of ``paths``: files as they are, and the
+    ``*.raml`` files in directories and their subdirectories, sorted.
+    A file is returned once, in the place it is first found.
+
+    :param list paths: paths of files and directories
+    """
+    found = []
+    seen = set()
+
+    def add(path):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            found.append(path)
+
+    for path in paths:
+        if not os.path.isdir(path):
+            add(path)
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.endswith(RAML_EXTENSION):
+                    add(os.path.join(dirpath, name))
+    return found
+
+
+class IncludeGraph(object):
+    """
+    The files each validated RAML file is made of, kept between runs in
+    a JSON file to find the RAML files a change affects without loading
+    them.
+
+    Paths are saved relative to the JSON file, so the file stays valid
+    in another checkout of the same tree.
+
+    :param str path: JSON file to load the graph from, if it exists, \
+        and to save it to
+    """
+    def __init__(self, path=GRAPH_FILE):
+        self.path = path
+        #: absolute path of each RAML file to those of its dependencies
+        self.dependencies = {}
+        self._base = os.path.dirname(os.path.abspath(path))
+        try:
+            with open(path) as graph_file:
+                saved = json.load(graph_file)
+        except (IOError, ValueError):
+            # no graph yet, or a broken one: every file is affected
+            return
+        for raml_file, deps in saved.get("dependencies", {}).items():
+            self.dependencies[self._absolute(raml_file)] = [
+                self._absolute(d) for d in deps]
+
+    def _absolute(self, path):
+        return os.path.normpath(os.path.join(self._base, path))
+
+    def update(self, raml_file, dependencies):
+        """
+        Record the ``dependencies`` of ``raml_file``; ``None`` removes
+        it from the graph, making it affected by any change.
+        """
+        raml_file = os.path.abspath(raml_file)
+        if dependencies is None:
+            self.dependencies.pop(raml_file, None)
+        else:
+            self.dependencies[raml_file] = list(dependencies)
+
+    def affected(self, raml_files, changed):
+        """
+        Return the RAML files of ``raml_files`` which one of the
+        ``changed`` files is part of, and those not in the graph yet.
+
+        :param list raml_files: RAML files to choose from
+        :param list changed: paths of the changed (or removed) files
+        """
+        changed = set(os.path.abspath(f) for f in changed)
+        affected = []
+        for raml_file in raml_files:
+            deps = self.dependencies.get(os.path.abspath(raml_file))
+            if deps is None or changed.intersection(deps):
+                affected.append(raml_file)
+        return affected
+
+    def save(self):
+        """Write the graph to :py:attr:`path`, without removed files."""
+        saved = dict(
+            (os.path.relpath(raml_file, self._base),
+             [os.path.relpath(d, self._base) for d in deps])
+            for raml_file, deps in self.dependencies.items()
+            if os.path.exists(raml_file)
+        )
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as graph_file:
+            json.dump({"dependencies": saved}, graph_file, indent=1,
+                      sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+#####
+# Pool jobs; module-level so process pools can run them
+#####
+_worker_config = {}
+
+
+def _init_worker(config):
+    # the config is loaded once and handed to each worker, not per file
+    _worker_config["config"] = config
+
+
+def _validate_file(raml_file, config=None, fast=False, fail_fast=None):
+    from .loader import RAMLLoader
+    from .parser import parse_raml
+    from .utils import _get_raml_object
+
+    config = config or _worker_config["config"]
+    loader = RAMLLoader(config["limits"].guard())
+    guard = loader.guard
+    try:
+        try:
+            with _get_raml_object(raml_file) as raml:
+                loaded = loader.load(raml)
+        except IOError as e:
+            raise LoadRAMLError(e)
+        if fast:
+            from .validate.raw import validate_raw
+
+            errors = validate_raw(loaded, config, guard, fail_fast)
+        else:
+            parse_raml(loaded, config, guard, fail_fast)
+            errors = []
+    except InvalidRAMLError as e:
+        errors = e.errors
+    except Exception as e:
+        # a file the parser fails on must not stop the other files
+        errors = [e]
+    # exceptions may not survive pickling, their descriptions do
+    errors = [(e.__class__.__name__, str(e)) for e in errors]
+    # what a failed load read is recorded too, so fixing it is a change
+    return ValidationResult(raml_file, errors,
+                            loader.dependencies(raml_file))
+
+
+def validate_files(paths, config_file=None, jobs=1, fast=False,
+                   fail_fast=None, changed=None, graph=None):
+    """
+    Validate the RAML files of ``paths`` (see :py:func:`find_raml_files`)
+    like :py:func:`ramlfications.validate`, yielding a
+    :py:class:`ValidationResult` per file as soon as it is validated.
+
+    With more than one job, the files are validated in a pool of
+    processes, and the results come in the order they finish in.
+    Errors loading or parsing a file are part of its result; they don't
+    stop the other files from being validated.
+
+    :param list paths: paths of RAML files and directories
+    :param str config_file: String path to desired config file, if any.
+    :param int jobs: number of processes to validate in; ``None`` or \
+        ``0`` for one per CPU, ``1`` to validate in this process.
+    :param bool fast: validate without building nodes, see \
+        :py:func:`ramlfications.validate`
+    :param fail_fast: stop validating a file at its first error if \
+        ``True``, or at that many errors if a number
+    :param list changed: paths of changed files: only validate the \
+        RAML files ``graph`` says are affected (see \
+        :py:meth:`IncludeGraph.affected`)
+    :param IncludeGraph graph: updated with the dependencies of each \
+        valid file; invalid files are removed from it, so that they are \
+        validated again until fixed.  The caller saves it.
+    """
+    raml_files = find_raml_files(paths)
+    if changed is not None:
+        raml_files = graph.affected(raml_files, changed)
+    for result in _validate_files(raml_files, config_file, jobs, fast,
+                                  fail_fast):
+        if graph is not None:
+            deps = result.dependencies if result.valid else None
+            graph.update(result.raml_file, deps)
+        yield result
+
+
+def _validate_files(raml_files, config_file, jobs, fast, fail_fast):
+    from .config import setup_config
+
+    config = setup_config(config_file)
+    config["validate"] = True
+    if jobs == 1 or len(raml_files) < 2:
+        for raml_file in raml_files:
+            yield _validate_file(raml_file, config, fast, fail_fast)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs or None,
+                             initializer=_init_worker,
+                             initargs=(config,)) as executor:
+        futures = [
+            executor.submit(_validate_file, raml_file, fast=fast,
+                            fail_fast=fail_fast)
+            for raml_file in raml_files
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import json
+import pickle
+import zlib
+
+from six import string_types
+
+from .errors import LoadRAMLError
+
+
+__all__ = ["dump_compiled", "dumps_compiled", "load_compiled",
+           "loads_compiled"]
+
+
+#: First line of a compiled RAML file, followed by the format version
+MAGIC = b"#%RAMLC "
+FORMAT_VERSION = 1
+PICKLE_PROTOCOL = 4
+
+# strings this short are cheaper to store inline than by reference
+_MIN_INTERNED_LENGTH = 3
+
+
+class _Pickler(pickle.Pickler):
+    """
+    Stores each distinct string once, in a table pickled ahead of the
+    model, and refers to it by index.  Equal strings thereby end up as
+    one object once loaded.
+    """
+    def __init__(self, *args, **kwargs):
+        pickle.Pickler.__init__(self, *args, **kwargs)
+        self.strings = []
+        self._index = {}
+
+    def persistent_id(self, obj):
+        if type(obj) is not str or len(obj) < _MIN_INTERNED_LENGTH:
+            return None
+        index = self._index.get(obj)
+        if index is None:
+            index = self._index[obj] = len(self.strings)
+            self.strings.append(obj)
+        return index
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, fp, strings):
+        pickle.Unpickler.__init__(self, fp)
+        self.strings = strings
+
+    def persistent_load(self, index):
+        return self.strings[index]
+
+
+def _version():
+    from . import __version__
+    return __version__
+
+
+def dumps_compiled(root):
+    """
+    Serialize a parsed RAML root (see :py:func:`ramlfications.parse`)
+    into the compiled format.
+
+    :param root: parsed RAML root node
+    :returns: compiled RAML file content
+    :rtype: bytes
+    """
+    model = io.BytesIO()
+    pickler = _Pickler(model, PICKLE_PROTOCOL)
+    pickler.dump(root)
+    strings = pickle.dumps(pickler.strings, PICKLE_PROTOCOL)
+
+    header = json.dumps({
+        "ramlfications": _version(),
+        "raml_version": root.raml_version,
+        "title": getattr(root, "title", None),
+    }, sort_keys=True)
+    return b"".join([
+        MAGIC, str(FORMAT_VERSION).encode("ascii"), b"\n",
+        header.encode("utf-8"), b"\n",
+        zlib.compress(strings + model.getvalue()),
+    ])
+
+
+def dump_compiled(root, output):
+    """
+    Write a parsed RAML root to a compiled RAML file.
+
+    :param root: parsed RAML root node
+    :param output: path or binary file object to write to
+    """
+    data = dumps_compiled(root)
+    if isinstance(output, string_types):
+        with open(output, "wb") as f:
+            f.write(data)
+    else:
+        output.write(data)
+
+
+def loads_compiled(data):
+    """
+    Load a parsed RAML root from compiled RAML file content, as written
+    by :py:func:`dumps_compiled`.  Nothing is loaded, resolved nor
+    validated again.
+
+    Compiled files are pickles: only load files from trusted sources.
+
+    :param bytes data: compiled RAML file content
+    :returns: parsed RAML root node
+    :raises LoadRAMLError: if ``data`` is not compiled RAML, or was \
+        compiled by another format or ``ramlfications`` version
+    """
+    if not data.startswith(MAGIC):
+        raise LoadRAMLError("Not a compiled RAML file.")
+    try:
+        version, header, payload = data[len(MAGIC):].split(b"\n", 2)
+        version = int(version)
+        header = json.loads(header.decode("utf-8"))
+    except ValueError:
+        raise LoadRAMLError("Corrupt compiled RAML file header.")
+    if version != FORMAT_VERSION:
+        msg = ("Unsupported compiled RAML format version {0}; expected "
+               "{1}.".format(version, FORMAT_VERSION))
+        raise LoadRAMLError(msg)
+    if header.get("ramlfications") != _version():
+        # the models are stored as-is, so they must match the code
+        msg = ("RAML file was compiled with ramlfications {0}, running {1}; "
+               "compile it again.".format(header.get("ramlfications"),
+                                          _version()))
+        raise LoadRAMLError(msg)
+
+    try:
+        stream = io.BytesIO(zlib.decompress(payload))
+        strings = pickle.load(stream)
+        return _Unpickler(stream, strings).load()
+    except (zlib.error, pickle.UnpicklingError, EOFError) as e:
+        raise LoadRAMLError("Corrupt compiled RAML file: {0}".format(e))
+
+
+def load_compiled(compiled):
+    """
+    Load a parsed RAML root from a compiled RAML file, see
+    :py:func:`loads_compiled`.
+
+    :param compiled: path or binary file object of the compiled RAML file
+    :returns: parsed RAML root node
+    :raises LoadRAMLError: if the file can not be read or loaded
+    """
+    if isinstance(compiled, string_types):
+        try:
+            with open(compiled, "rb") as f:
+                data = f.read()
+        except IOError as e:
+            raise LoadRAMLError(e)
+    else:
+        data = compiled.read()
+    return loads_compiled(data)
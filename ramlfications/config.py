@@ -3,21 +3,36 @@
 
 from __future__ import absolute_import, division, print_function
 
-import json
 import os
 
 from six import iterkeys
 from six.moves import configparser
-from six.moves import BaseHTTPServer as httpserver  # NOQA
+from six.moves import http_client
 
 
-def _load_media_types():
-    current_dir = os.path.dirname(os.path.realpath(__file__))
-    data_dir = os.path.join(current_dir, "data")
-    media_types_file = os.path.join(data_dir, "supported_mime_types.json")
+from .limits import Limits
+from .mime_types import default_registry
 
-    with open(media_types_file, "r") as f:
-        return json.load(f)
+
+_MEDIA_TYPES = []
+
+
+def media_types():
+    """
+    Supported IANA MIME media types as a sorted list, see
+    :py:func:`.mime_types.default_registry`.
+    """
+    if not _MEDIA_TYPES:
+        _MEDIA_TYPES.extend(sorted(default_registry()))
+    return _MEDIA_TYPES
+
+
+def __getattr__(name):
+    # ``MEDIA_TYPES`` is loaded lazily, see ``media_types``
+    if name == "MEDIA_TYPES":
+        return media_types()
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name))
 
 
 HTTP_METHODS = [
@@ -28,7 +43,6 @@ HTTP_OPTIONAL = [m + "?" for m in HTTP_METHODS].extend(HTTP_METHODS)
 
 RAML_VERSIONS = ["0.8"]
 PROTOCOLS = ["HTTP", "HTTPS"]
-MEDIA_TYPES = _load_media_types()
 AUTH_SCHEMES = [
     "oauth_1_0", "oauth_2_0",
     "basic", "basic_auth", "basicAuth", "basicAuthentication",
@@ -36,7 +50,7 @@ AUTH_SCHEMES = [
     "digest", "digest_auth", "digestAuth", "digestAuthentication",
     "digest_authentication", "http_digest"
 ]
-HTTP_RESP_CODES = list(iterkeys(httpserver.BaseHTTPRequestHandler.responses))
+HTTP_RESP_CODES = list(iterkeys(http_client.responses))
 PRIM_TYPES = ["string", "integer", "number", "boolean", "date", "file"]
 
 CONFIG_VARS = [
@@ -66,6 +80,7 @@ def add_custom_config(user_config, parser_config):
         user_config.get("main", "validate")
     pc["production"] = user_config.has_option("main", "production") and \
         user_config.get("main", "production")
+    pc["limits"] = Limits.from_config(user_config)
 
     return pc
 
@@ -80,12 +95,13 @@ def setup_config(config_file=None):
     parser_config = {
         "auth_schemes": AUTH_SCHEMES,
         "resp_codes": HTTP_RESP_CODES,
-        "media_types": MEDIA_TYPES,
+        "media_types": media_types(),
         "protocols": PROTOCOLS,
         "http_methods": HTTP_METHODS,
         "raml_versions": RAML_VERSIONS,
         "prim_types": PRIM_TYPES,
         "validate": True,
+        "limits": Limits(),
     }
 
     if config_file:
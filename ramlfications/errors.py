@@ -48,6 +48,9 @@ class InvalidParameterError(BaseRAMLParserError):
         super(InvalidParameterError, self).__init__(message)
         self.parameter = parameter
 
+    def __reduce__(self):
+        return self.__class__, (self.args[0], self.parameter)
+
 
 class InvalidSecuritySchemeError(BaseRAMLParserError):
     pass
@@ -61,6 +64,38 @@ class LoadRAMLError(BaseRAMLError):
     pass
 
 
+class LimitExceededError(LoadRAMLError):
+    """A limit of :py:class:`.limits.Limits` was exceeded."""
+
+
+class IncludeDepthError(LimitExceededError):
+    """``!include`` s are nested too deep, or cyclic."""
+
+
+class IncludeCountError(LimitExceededError):
+    """Too many files are included."""
+
+
+class DocumentSizeError(LimitExceededError):
+    """The RAML file and its includes are too large."""
+
+
+class ResourceDepthError(LimitExceededError):
+    """Resources are nested too deep."""
+
+
+class NodeCountError(LimitExceededError):
+    """There are too many resource nodes."""
+
+
+class AliasExpansionError(LimitExceededError):
+    """YAML aliases expand to too many nodes."""
+
+
+class ParseTimeoutError(LimitExceededError):
+    """Loading and parsing took too long."""
+
+
 #####
 # Update MIME Media Type Exception
 #####
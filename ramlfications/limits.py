@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import attr
+
+from .errors import (
+    AliasExpansionError, DocumentSizeError, IncludeCountError,
+    IncludeDepthError, NodeCountError, ParseTimeoutError, ResourceDepthError
+)
+
+
+__all__ = ["Limits", "LimitGuard", "config_guard", "read_limited"]
+
+
+#: Options of the ``[limits]`` config section, see :py:class:`Limits`
+LIMIT_OPTIONS = (
+    "max_include_depth", "max_includes", "max_document_size",
+    "max_resource_depth", "max_nodes", "max_alias_expansion", "timeout",
+)
+
+
+#: Characters :py:func:`read_limited` reads at a time
+READ_CHUNK = 1024 * 1024
+
+
+def read_limited(stream, size=-1):
+    """
+    Read ``size`` characters, or all if negative, from ``stream``.
+
+    Unlike ``stream.read(size)``, this reads in chunks, so a file far
+    smaller than ``size`` does not need a buffer of ``size``.
+    """
+    if size < 0:
+        return stream.read()
+    chunks = []
+    while size > 0:
+        chunk = stream.read(min(size, READ_CHUNK))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    if not chunks:
+        return stream.read(0)
+    return chunks[0][:0].join(chunks)
+
+
+@attr.s
+class Limits(object):
+    """
+    Bounds on the work done loading and parsing a RAML file, for RAML
+    files from untrusted sources.  ``None`` disables a limit.  The
+    defaults are far above what real APIs need.
+
+    Each limit raises its own :py:class:`.errors.LimitExceededError`
+    as soon as it is exceeded.
+
+    :param int max_include_depth: Nesting depth of ``!include`` s; \
+        an include cycle raises :py:class:`.errors.IncludeDepthError` \
+        right away.
+    :param int max_includes: Number of included files read.
+    :param int max_document_size: Characters read, RAML file and \
+        included files together.
+    :param int max_resource_depth: Nesting depth of resources; not \
+        limited by default, as resources are parsed without recursion.
+    :param int max_nodes: Number of resource nodes.
+    :param int max_alias_expansion: Number of YAML nodes referred to \
+        through aliases, counting the nodes of an aliased node each \
+        time it is referred to.
+    :param float timeout: Seconds loading and parsing may take.
+    """
+    max_include_depth   = attr.ib(default=32)
+    max_includes        = attr.ib(default=10000)
+    max_document_size   = attr.ib(default=64 * 1024 * 1024)
+    max_resource_depth  = attr.ib(default=None)
+    max_nodes           = attr.ib(default=100000)
+    max_alias_expansion = attr.ib(default=1000000)
+    timeout             = attr.ib(default=None)
+
+    @classmethod
+    def from_config(cls, user_config):
+        """
+        Limits set in the ``[limits]`` section of a config file, the
+        defaults otherwise; ``none`` disables a limit.
+
+        :param user_config: ``ConfigParser`` of the config file
+        """
+        kwargs = {}
+        if user_config.has_section("limits"):
+            for option, value in user_config.items("limits"):
+                if option not in LIMIT_OPTIONS:
+                    continue
+                value = value.strip()
+                if value.lower() == "none":
+                    kwargs[option] = None
+                elif option == "timeout":
+                    kwargs[option] = float(value)
+                else:
+                    kwargs[option] = int(value)
+        return cls(**kwargs)
+
+    def guard(self):
+        """A :py:class:`LimitGuard` to enforce the limits with."""
+        return LimitGuard(self)
+
+
+class LimitGuard(object):
+    """
+    Counts the work done loading and parsing one RAML file against
+    :py:class:`Limits`; the ``timeout`` runs from its creation.
+
+    :param Limits limits: limits to enforce
+    """
+    def __init__(self, limits):
+        self.limits = limits
+        self.includes = 0
+        self.document_size = 0
+        self.nodes = 0
+        self.alias_expansion = 0
+        self.deadline = None
+        if limits.timeout is not None:
+            self.deadline = time.monotonic() + limits.timeout
+
+    def check_time(self):
+        """
+        :raises ParseTimeoutError: if the timeout expired
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            msg = "Loading and parsing took over {0} seconds.".format(
+                self.limits.timeout)
+            raise ParseTimeoutError(msg)
+
+    def read_size(self):
+        """
+        Number of characters to read at most: one over what is left of
+        ``max_document_size``, or ``-1`` for all.
+        """
+        limit = self.limits.max_document_size
+        if limit is None:
+            return -1
+        return max(limit - self.document_size, 0) + 1
+
+    def read(self, stream):
+        """
+        Read at most :py:meth:`read_size` characters from ``stream``.
+        """
+        return read_limited(stream, self.read_size())
+
+    def add_document(self, text, file_name=None):
+        """
+        Count a RAML, YAML or JSON document read.
+
+        :raises DocumentSizeError: if over ``max_document_size``
+        """
+        self.check_time()
+        self.document_size += len(text)
+        limit = self.limits.max_document_size
+        if limit is not None and self.document_size > limit:
+            msg = "RAML documents are larger than {0} characters".format(
+                limit)
+            if file_name is not None:
+                msg += " (reading '{0}')".format(file_name)
+            raise DocumentSizeError(msg + ".")
+
+    def add_include(self, file_name, stack):
+        """
+        Count an included file.
+
+        :param str file_name: absolute path of the included file
+        :param list stack: absolute paths of the including files, \
+            outermost first
+        :raises IncludeDepthError: if ``file_name`` is in ``stack``, or \
+            ``stack`` is over ``max_include_depth``
+        :raises IncludeCountError: if over ``max_includes``
+        """
+        self.check_time()
+        if file_name in stack:
+            cycle = stack[stack.index(file_name):] + [file_name]
+            msg = "Cyclic include: {0}".format(" -> ".join(cycle))
+            raise IncludeDepthError(msg)
+        limit = self.limits.max_include_depth
+        if limit is not None and len(stack) > limit:
+            msg = "Includes are nested deeper than {0} ('{1}').".format(
+                limit, file_name)
+            raise IncludeDepthError(msg)
+        self.includes += 1
+        limit = self.limits.max_includes
+        if limit is not None and self.includes > limit:
+            msg = "More than {0} files are included ('{1}').".format(
+                limit, file_name)
+            raise IncludeCountError(msg)
+
+    def add_alias(self, size):
+        """
+        Count a YAML alias to a node of ``size`` nodes.
+
+        :raises AliasExpansionError: if over ``max_alias_expansion``
+        """
+        self.alias_expansion += size
+        limit = self.limits.max_alias_expansion
+        if limit is not None and self.alias_expansion > limit:
+            msg = "YAML aliases expand to more than {0} nodes.".format(limit)
+            raise AliasExpansionError(msg)
+
+    def add_node(self, depth, path=None):
+        """
+        Count a resource node, nested ``depth`` resources deep.
+
+        :raises ResourceDepthError: if over ``max_resource_depth``
+        :raises NodeCountError: if over ``max_nodes``
+        :raises ParseTimeoutError: if the timeout expired
+        """
+        self.check_time()
+        limit = self.limits.max_resource_depth
+        if limit is not None and depth > limit:
+            msg = "Resources are nested deeper than {0} ('{1}').".format(
+                limit, path)
+            raise ResourceDepthError(msg)
+        self.nodes += 1
+        limit = self.limits.max_nodes
+        if limit is not None and self.nodes > limit:
+            msg = "More than {0} resource nodes.".format(limit)
+            raise NodeCountError(msg)
+
+
+def config_guard(config):
+    """A new :py:class:`LimitGuard` for the limits of parser ``config``."""
+    return (config.get("limits") or Limits()).guard()
@@ -3,13 +3,17 @@
 
 from __future__ import absolute_import, division, print_function
 
+import io
 import os
-import jsonref
+import re
+
 import yaml
 
 from six import string_types
+from six.moves.urllib.parse import unquote, urljoin, urlsplit
 
 from .errors import LoadRAMLError
+from .limits import Limits
 from .utils.common import OrderedDict
 
 
@@ -20,14 +24,74 @@ RAMLHEADER = "#%RAML "
 SUPPORTED_FRAGMENT_TYPES = ("DataType",)
 RAML10_FRAGMENT_TYPES = ("DataType", "AnnotationType")
 
+JSON_REF_RE = re.compile(r'"\$ref"\s*:\s*"([^"#][^"]*)"')
 
-__all__ = ["RAMLLoader"]
+
+def _expanded_size(node, sizes):
+    """
+    Number of YAML nodes in ``node`` once its aliases are expanded;
+    ``sizes`` memoizes it by node ``id``.
+    """
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if id(current) in sizes:
+            stack.pop()
+            continue
+        if isinstance(current, yaml.MappingNode):
+            children = [n for pair in current.value for n in pair]
+        elif isinstance(current, yaml.SequenceNode):
+            children = current.value
+        else:
+            children = []
+        pending = [c for c in children if id(c) not in sizes]
+        if pending:
+            stack.extend(pending)
+            continue
+        sizes[id(current)] = 1 + sum(sizes[id(c)] for c in children)
+        stack.pop()
+    return sizes[id(node)]
 
 
 class RAMLLoader(object):
     """
     Extends YAML loader to load RAML files with ``!include`` tags.
+
+    While loading, every file pulled in through ``!include`` or a local
+    JSON ``$ref`` is recorded in :py:attr:`includes`, which maps the
+    absolute path of a file to the absolute paths of the files it
+    includes directly.  The graph is also attached to the loaded data
+    as ``_raml_includes``.
+
+    :param LimitGuard guard: enforces the limits on loading, see \
+        :py:class:`.limits.Limits`; defaults to the default limits.
     """
+    def __init__(self, guard=None):
+        self.includes = OrderedDict()
+        self.guard = guard or Limits().guard()
+        # absolute paths of the files being loaded, outermost first
+        self._include_stack = []
+
+    def _add_include(self, parent, file_name):
+        parent = os.path.abspath(parent)
+        file_name = os.path.abspath(file_name)
+        deps = self.includes.setdefault(parent, [])
+        if file_name not in deps:
+            deps.append(file_name)
+        return file_name not in self.includes
+
+    def _read(self, file_name):
+        """
+        Returns the content of an included file.
+        """
+        with open(file_name) as inputfile:
+            return self.guard.read(inputfile)
+
+    def _read_include(self, file_name):
+        text = self._read(file_name)
+        self.guard.add_document(text, file_name)
+        return text
+
     def _yaml_include(self, loader, node):
         """
         Adds the ability to follow ``!include`` directives within
@@ -36,17 +100,25 @@ class RAMLLoader(object):
         # Get the path out of the yaml file
         file_name = os.path.join(os.path.dirname(loader.name), node.value)
         file_ext = os.path.splitext(file_name)[1]
+        self._add_include(loader.name, file_name)
+        self.guard.add_include(os.path.abspath(file_name),
+                               self._include_stack)
         parsable_ext = [".yaml", ".yml", ".raml", ".json"]
 
         if file_ext not in parsable_ext:
-            with open(file_name) as inputfile:
-                return inputfile.read()
+            return self._read_include(file_name)
 
         if file_ext == ".json":
             return self._parse_json(file_name, os.path.dirname(file_name))
 
-        with open(file_name) as inputfile:
-            return yaml.load(inputfile, self._ordered_loader)
+        # keep the file name for the includes of the included file
+        stream = io.StringIO(self._read_include(file_name))
+        stream.name = file_name
+        self._include_stack.append(os.path.abspath(file_name))
+        try:
+            return yaml.load(stream, self._ordered_loader)
+        finally:
+            self._include_stack.pop()
 
     def _parse_json(self, jsonfile, base_path):
         """
@@ -58,16 +130,53 @@ class RAMLLoader(object):
             base_path = base_path + "/"
         base_path = "file:" + base_path
 
-        with open(jsonfile, "r") as f:
-            schema = jsonref.load(f, base_uri=base_path, jsonschema=True)
+        import jsonref
+
+        data = self._read_include(jsonfile)
+        schema = jsonref.loads(data, base_uri=base_path, jsonschema=True,
+                               loader=self._load_json_ref)
+        self._json_includes(jsonfile, data, base_path)
         return schema
 
+    def _load_json_ref(self, uri, **kwargs):
+        """
+        Loads the document referenced by a JSON ``$ref``.
+        """
+        import jsonref
+        return jsonref.jsonloader(uri, **kwargs)
+
+    def _json_includes(self, jsonfile, data, base_path):
+        """
+        Records the local files referenced by ``$ref`` in JSON ``data``;
+        refs are resolved lazily by ``jsonref`` so they can not be
+        recorded when resolved.
+        """
+        for ref in JSON_REF_RE.findall(data):
+            uri = urlsplit(urljoin(base_path, ref))
+            if uri.scheme != "file":
+                continue
+            file_name = unquote(uri.path)
+            if self._add_include(jsonfile, file_name) and \
+                    os.path.isfile(file_name):
+                self.guard.add_include(file_name, [])
+                nested = self._read_include(file_name)
+                base = "file:" + os.path.dirname(file_name) + "/"
+                self._json_includes(file_name, nested, base)
+
     def _ordered_load(self, stream, loader=yaml.SafeLoader):
         """
         Preserves order set in RAML file.
         """
+        guard = self.guard
+
         class OrderedLoader(loader):
-            pass
+            def compose_node(self, parent, index):
+                if not self.check_event(yaml.AliasEvent):
+                    return loader.compose_node(self, parent, index)
+                node = loader.compose_node(self, parent, index)
+                sizes = self.__dict__.setdefault("_expanded_sizes", {})
+                guard.add_alias(_expanded_size(node, sizes))
+                return node
 
         def construct_mapping(loader, node):
             loader.flatten_mapping(node)
@@ -120,9 +229,20 @@ class RAMLLoader(object):
         :rtype: ``dict``
 
         """
+        name = None
+        if not isinstance(raml, string_types):
+            name = getattr(raml, "name", None)
+            raml = self.guard.read(raml)
+        self.guard.add_document(raml, name)
         raml_version, _raml_fragment_type = self._parse_raml_header(raml)
+
+        stream = io.StringIO(raml)
+        if name is not None:
+            # includes are relative to the RAML file
+            stream.name = name
+        self._include_stack = [os.path.abspath(name or "<string>")]
         try:
-            ret = self._ordered_load(raml, yaml.SafeLoader)
+            ret = self._ordered_load(stream, yaml.SafeLoader)
         except yaml.parser.ParserError as e:
             msg = "Error parsing RAML: {0}".format(e)
             raise LoadRAMLError(msg)
@@ -134,4 +254,19 @@ class RAMLLoader(object):
             ret = OrderedDict()
         ret._raml_version = raml_version
         ret._raml_fragment_type = _raml_fragment_type
+        ret._raml_includes = self.includes
         return ret
+
+    def dependencies(self, raml_file):
+        """
+        Return the absolute paths of ``raml_file`` and of every file it
+        includes, directly or not, as recorded by the last :py:meth:`load`.
+        """
+        seen = OrderedDict()
+        stack = [os.path.abspath(raml_file)]
+        while stack:
+            file_name = stack.pop()
+            if file_name not in seen:
+                seen[file_name] = None
+                stack.extend(reversed(self.includes.get(file_name, [])))
+        return list(seen)
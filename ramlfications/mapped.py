@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import mmap
+import struct
+
+from six import string_types
+
+from .errors import LoadRAMLError
+from .models.examples import Example
+
+
+__all__ = ["MappedAPI", "dump_mapped", "load_mapped"]
+
+
+#####
+# File layout, all integers little-endian:
+#
+#   header   magic, format version, number of resources, index offset
+#   records  one per resource, then one for the root
+#   index    (offset, length) of every resource record, then of the root
+#
+# A record starts with the number of fields and an (offset, length) pair
+# per field, relative to the record, followed by the fields' values as
+# UTF-8 JSON.  Fields are decoded one at a time, on access.
+#####
+MAGIC = b"RAMLMAP\x00"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sIIQ")
+_ENTRY = struct.Struct("<QI")
+_COUNT = struct.Struct("<I")
+_FIELD = struct.Struct("<II")
+
+ROOT_FIELDS = (
+    "title", "version", "raml_version", "base_uri", "base_uri_params",
+    "uri_params", "protocols", "media_type", "secured_by", "documentation",
+)
+RESOURCE_FIELDS = (
+    "name", "path", "method", "display_name", "description",
+    "absolute_uri", "protocols", "parent", "is_", "type", "secured_by",
+    "media_type", "uri_params", "base_uri_params", "query_params",
+    "form_params", "headers", "body", "responses",
+)
+PARAMETER_FIELDS = (
+    "name", "display_name", "description", "type", "required", "default",
+    "enum", "pattern", "minimum", "maximum", "min_length", "max_length",
+    "example", "examples", "repeat",
+)
+BODY_FIELDS = ("mime_type", "type", "schema", "example", "form_params")
+EXAMPLE_FIELDS = ("name", "display_name", "description", "value", "strict")
+RESPONSE_FIELDS = ("code", "method", "description", "headers", "body")
+
+
+#####
+# Writing
+#####
+def _raw_content(value):
+    # BaseContent, or ``None``
+    return getattr(value, "raw", value) or None
+
+
+def _json_default(value):
+    # jsonref proxies and compiled patterns
+    subject = getattr(value, "__subject__", None)
+    if subject is not None:
+        return subject
+    pattern = getattr(value, "pattern", None)
+    if isinstance(pattern, string_types):
+        return pattern
+    if isinstance(value, Example):
+        return _example(value)
+    raise TypeError(
+        "{0!r} can not be written to a mapped API".format(value))
+
+
+def _example(example):
+    values = dict((f, getattr(example, f)) for f in EXAMPLE_FIELDS)
+    values["description"] = _raw_content(example.description)
+    return values
+
+
+def _examples(examples):
+    if examples is None:
+        return None
+    return [_example(e) for e in examples]
+
+
+def _parameter(param):
+    values = {}
+    for field in PARAMETER_FIELDS:
+        if field == "description":
+            values[field] = _raw_content(getattr(param, "description", None))
+        elif field == "examples":
+            values[field] = _examples(getattr(param, "examples", None))
+        else:
+            values[field] = getattr(param, field, None)
+    if values["pattern"] is not None and not isinstance(
+            values["pattern"], string_types):
+        values["pattern"] = values["pattern"].pattern
+    return values
+
+
+def _parameters(params):
+    if params is None:
+        return None
+    return [_parameter(p) for p in params]
+
+
+def _body(body):
+    values = dict((f, getattr(body, f, None)) for f in BODY_FIELDS)
+    values["form_params"] = _parameters(body.form_params)
+    return values
+
+
+def _bodies(bodies):
+    if bodies is None:
+        return None
+    return [_body(b) for b in bodies]
+
+
+def _responses(responses):
+    if responses is None:
+        return None
+    return [{
+        "code": r.code,
+        "method": r.method,
+        "description": _raw_content(r.description),
+        "headers": _parameters(r.headers),
+        "body": _bodies(r.body),
+    } for r in responses]
+
+
+def _resource_values(resource, positions):
+    parent = resource.parent
+    return {
+        "name": resource.name,
+        "path": resource.path,
+        "method": resource.method,
+        "display_name": resource.display_name,
+        "description": _raw_content(resource.description),
+        "absolute_uri": resource.absolute_uri,
+        "protocols": resource.protocols,
+        "parent": None if parent is None else positions.get(id(parent)),
+        "is_": resource.is_,
+        "type": resource.type,
+        "secured_by": resource.secured_by,
+        "media_type": resource.media_type,
+        "uri_params": _parameters(resource.uri_params),
+        "base_uri_params": _parameters(resource.base_uri_params),
+        "query_params": _parameters(resource.query_params),
+        "form_params": _parameters(resource.form_params),
+        "headers": _parameters(resource.headers),
+        "body": _bodies(resource.body),
+        "responses": _responses(resource.responses),
+    }
+
+
+def _root_values(root):
+    docs = None
+    if root.documentation:
+        docs = [{"title": _raw_content(d.title),
+                 "content": _raw_content(d.content)}
+                for d in root.documentation]
+    return {
+        "title": root.title,
+        "version": root.version,
+        "raml_version": root.raml_version,
+        "base_uri": root.base_uri,
+        "base_uri_params": _parameters(root.base_uri_params),
+        "uri_params": _parameters(root.uri_params),
+        "protocols": root.protocols,
+        "media_type": root.media_type,
+        "secured_by": root.secured_by,
+        "documentation": docs,
+    }
+
+
+def _record(fields, values):
+    encoded = [
+        json.dumps(values[f], default=_json_default,
+                   separators=(",", ":")).encode("utf-8")
+        for f in fields
+    ]
+    offset = _COUNT.size + _FIELD.size * len(fields)
+    table = [_COUNT.pack(len(fields))]
+    for data in encoded:
+        table.append(_FIELD.pack(offset, len(data)))
+        offset += len(data)
+    return b"".join(table + encoded)
+
+
+def dump_mapped(root, output):
+    """
+    Write the resources of a parsed RAML root, with their parameters,
+    bodies and responses, to a file to be memory-mapped by
+    :py:func:`load_mapped`.
+
+    Traits, resource types, security schemes and data types are not
+    written; resources only refer to them by name.
+
+    :param root: parsed RAML root node
+    :param output: path or binary file object to write to
+    """
+    resources = list(root.resources or [])
+    positions = dict((id(r), i) for i, r in enumerate(resources))
+    records = [_record(RESOURCE_FIELDS, _resource_values(r, positions))
+               for r in resources]
+    records.append(_record(ROOT_FIELDS, _root_values(root)))
+
+    offset = _HEADER.size
+    index = []
+    for record in records:
+        index.append(_ENTRY.pack(offset, len(record)))
+        offset += len(record)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(resources), offset)
+    data = b"".join([header] + records + index)
+
+    if isinstance(output, string_types):
+        with open(output, "wb") as f:
+            f.write(data)
+    else:
+        output.write(data)
+
+
+#####
+# Reading
+#####
+class MappedNode(object):
+    """
+    Read-only view of a parameter, body or response of a memory-mapped
+    API; its fields are plain attributes.  RAML 1.0 examples are
+    ``dict`` s of the fields in :py:data:`EXAMPLE_FIELDS`.
+    """
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+    def __repr__(self):
+        for field in ("name", "mime_type", "code", "title"):
+            name = self.__dict__.get(field)
+            if name is not None:
+                break
+        return "{0}({1!r})".format(self.__class__.__name__, name)
+
+
+# fields holding lists of parameters, bodies or responses, which are
+# read as MappedNode s; other fields hold plain JSON values
+_NODE_FIELDS = frozenset([
+    "base_uri_params", "uri_params", "query_params", "form_params",
+    "headers", "body", "responses", "documentation",
+])
+
+
+def _nodes(values):
+    if values is None:
+        return None
+    nodes = []
+    for value in values:
+        for field in _NODE_FIELDS.intersection(value):
+            value[field] = _nodes(value[field])
+        nodes.append(MappedNode(value))
+    return nodes
+
+
+class _MappedRecord(object):
+    __slots__ = ("_api", "_offset", "_fields")
+
+    def __init__(self, api, offset, fields):
+        self._api = api
+        self._offset = offset
+        self._fields = fields
+
+    def _field(self, name):
+        try:
+            position = self._fields.index(name)
+        except ValueError:
+            raise AttributeError(name)
+        buf = self._api._buf
+        start = self._offset + _COUNT.size + _FIELD.size * position
+        offset, length = _FIELD.unpack_from(buf, start)
+        start = self._offset + offset
+        value = json.loads(buf[start:start + length].decode("utf-8"))
+        if name in _NODE_FIELDS:
+            return _nodes(value)
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._field(name)
+
+
+class MappedResource(_MappedRecord):
+    """
+    Read-only, lazily decoded view of a resource of a memory-mapped API,
+    with the fields of :py:class:`.models.resources.ResourceNode` listed
+    in :py:data:`RESOURCE_FIELDS`.  ``description`` is the raw text.
+    """
+    __slots__ = ("_position",)
+
+    def __init__(self, api, position, offset):
+        super(MappedResource, self).__init__(api, offset, RESOURCE_FIELDS)
+        self._position = position
+
+    @property
+    def parent(self):
+        position = self._field("parent")
+        if position is None:
+            return None
+        return self._api.resources[position]
+
+    def __eq__(self, other):
+        return isinstance(other, MappedResource) and \
+            self._api is other._api and self._position == other._position
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self._api), self._position))
+
+    def __repr__(self):
+        return "MappedResource(method={0!r}, path={1!r})".format(
+            self.method, self.path)
+
+
+class MappedResources(object):
+    """Sequence of the :py:class:`MappedResource` s of an API."""
+    def __init__(self, api):
+        self._api = api
+
+    def __len__(self):
+        return self._api._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        offset, _ = _ENTRY.unpack_from(
+            self._api._buf, self._api._index + _ENTRY.size * position)
+        return MappedResource(self._api, position, offset)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def filter_by(self, **kwargs):
+        """
+        Resources whose fields equal the given values, e.g.
+        ``filter_by(path="/foo", method="get")``.
+        """
+        return [r for r in self
+                if all(getattr(r, k) == v for k, v in kwargs.items())]
+
+
+class MappedAPI(object):
+    """
+    Read-only view of a parsed API written by :py:func:`dump_mapped`.
+
+    The file is memory-mapped, and nothing but the header is read until
+    a field is accessed: processes mapping the same file (e.g. forked
+    workers) share a single copy of the model in memory.  Root fields
+    listed in :py:data:`ROOT_FIELDS` are attributes; resources are in
+    :py:attr:`resources`.
+
+    :param str path: path of the mapped API file
+    :raises LoadRAMLError: if the file is not a mapped API file
+    """
+    def __init__(self, path):
+        try:
+            with open(path, "rb") as f:
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError) as e:
+            raise LoadRAMLError(e)
+        if len(self._buf) < _HEADER.size:
+            raise LoadRAMLError("Not a mapped RAML API file.")
+        magic, version, count, index = _HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            raise LoadRAMLError("Not a mapped RAML API file.")
+        if version != FORMAT_VERSION:
+            msg = ("Unsupported mapped RAML API format version {0}; "
+                   "expected {1}.".format(version, FORMAT_VERSION))
+            raise LoadRAMLError(msg)
+        self._count = count
+        self._index = index
+        offset, _ = _ENTRY.unpack_from(self._buf, index + _ENTRY.size * count)
+        self._root = _MappedRecord(self, offset, ROOT_FIELDS)
+        self.resources = MappedResources(self)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._root, name)
+
+    def close(self):
+        """Unmap the file; the API can not be used afterwards."""
+        self._buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_mapped(path):
+    """
+    Memory-map an API file written by :py:func:`dump_mapped`.
+
+    :param str path: path of the mapped API file
+    :rtype: MappedAPI
+    :raises LoadRAMLError: if the file is not a mapped API file
+    """
+    return MappedAPI(path)
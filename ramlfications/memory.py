@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import os
+import sys
+import tracemalloc
+import types
+
+from collections import deque
+
+import attr
+
+from .utils.common import OrderedDict
+
+
+__all__ = ["MemoryReport", "PhaseMemory", "retained_sizes"]
+
+
+#: Fields whose values are counted apart from the node holding them
+FIELD_CATEGORIES = {
+    "raw": "raw",
+    "schema": "schemas",
+    "schemas": "schemas",
+    "config": "config",
+    "request_validator": "request validators",
+}
+
+#: Source files listed for each phase of a :py:class:`MemoryReport`
+TOP_FILES = 3
+
+# not part of a parsed API, but reachable from it
+_SKIPPED = (type, types.ModuleType, types.BuiltinFunctionType,
+            types.MethodType)
+
+
+def _is_model(obj):
+    return hasattr(type(obj), "__attrs_attrs__")
+
+
+def _referents(obj):
+    if isinstance(obj, types.FunctionType):
+        # what a closure holds, not the module globals it sees
+        return [r for r in (obj.__closure__, obj.__defaults__)
+                if r is not None]
+    return gc.get_referents(obj)
+
+
+def _fields(obj):
+    """Attribute names and values of a model instance."""
+    if hasattr(obj, "__dict__"):
+        return list(vars(obj).items())
+    return [(f.name, getattr(obj, f.name, None))
+            for f in attr.fields(type(obj))]
+
+
+def retained_sizes(obj):
+    """
+    Estimate the memory the objects reachable from ``obj``, e.g. a
+    parsed API, retain, by model class.
+
+    Objects are walked breadth first and counted once, under the
+    nearest model instance they are reached through; values of the
+    :py:data:`FIELD_CATEGORIES` fields, like the ``raw`` data of each
+    node, are counted under their category instead.  Objects shared by
+    several nodes are counted under the first one reached.
+
+    :returns: ``OrderedDict`` of each model class name or category to \
+        ``[number of instances, bytes]``, largest first
+    """
+    sizes = {}
+    seen = set()
+    queue = deque([(obj, None)])
+    while queue:
+        obj, category = queue.popleft()
+        if id(obj) in seen or isinstance(obj, _SKIPPED):
+            continue
+        seen.add(id(obj))
+        if _is_model(obj):
+            category = type(obj).__name__
+            counted = sizes.setdefault(category, [0, 0])
+            counted[0] += 1
+            counted[1] += sys.getsizeof(obj, 0)
+            if hasattr(obj, "__dict__"):
+                seen.add(id(obj.__dict__))
+                counted[1] += sys.getsizeof(obj.__dict__, 0)
+            for name, value in _fields(obj):
+                if value is None:
+                    # e.g. ``raw`` released, see ``keep_raw``
+                    continue
+                field_category = FIELD_CATEGORIES.get(name, category)
+                if field_category != category and id(value) not in seen:
+                    sizes.setdefault(field_category, [0, 0])[0] += 1
+                queue.append((value, field_category))
+            continue
+        counted = sizes.setdefault(category or type(obj).__name__, [0, 0])
+        counted[1] += sys.getsizeof(obj, 0)
+        for referent in _referents(obj):
+            queue.append((referent, category))
+    return OrderedDict(sorted(sizes.items(), key=lambda s: -s[1][1]))
+
+
+@attr.s
+class PhaseMemory(object):
+    """
+    Memory allocated by a stage of :py:class:`.parser.ParsePipeline`.
+
+    :param str name: name of the stage
+    :param int size: bytes the stage left allocated
+    :param int peak: most bytes allocated while the stage ran, over \
+        those allocated before it
+    :param list top: ``(source file, bytes)`` of the files the stage \
+        left the most bytes allocated by
+    """
+    name = attr.ib()
+    size = attr.ib()
+    peak = attr.ib()
+    top  = attr.ib(default=attr.Factory(list))
+
+
+def _mib(size):
+    return "{0:.2f} MiB".format(size / 2 ** 20)
+
+
+@attr.s
+class MemoryReport(object):
+    """
+    Memory a parse used: allocated by each stage, traced with
+    :py:mod:`tracemalloc`, and retained by the parsed API, see
+    :py:func:`retained_sizes`.  Pass one to :py:func:`ramlfications.parse`
+    to fill it in.
+
+    :param list phases: :py:class:`PhaseMemory` of each stage run
+    :param dict retained: ``[instances, bytes]`` retained by each model \
+        class, see :py:func:`retained_sizes`
+    """
+    phases   = attr.ib(default=attr.Factory(list))
+    retained = attr.ib(default=attr.Factory(OrderedDict))
+
+    def run(self, pipeline):
+        """
+        Run ``pipeline``, tracing the memory each stage allocates.
+
+        :param ParsePipeline pipeline: pipeline to run
+        :returns: what the pipeline returns
+        """
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        hook = pipeline.hook
+        state = {"size": tracemalloc.get_traced_memory()[0],
+                 "snapshot": self._snapshot()}
+        tracemalloc.reset_peak()
+
+        def phase(name, product, seconds):
+            size, peak = tracemalloc.get_traced_memory()
+            snapshot = self._snapshot()
+            top = [(stat.traceback[0].filename, stat.size_diff)
+                   for stat in snapshot.compare_to(state["snapshot"],
+                                                   "filename")
+                   if stat.size_diff > 0][:TOP_FILES]
+            self.phases.append(PhaseMemory(
+                name, size - state["size"], peak - state["size"], top))
+            if hook is not None:
+                hook(name, product, seconds)
+            # what it took to measure is not part of the next stage
+            state["snapshot"] = snapshot
+            state["size"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        pipeline.hook = phase
+        try:
+            api = pipeline.run()
+        finally:
+            pipeline.hook = hook
+            if not tracing:
+                tracemalloc.stop()
+        if api is not None:
+            self.retained = retained_sizes(api)
+        return api
+
+    @staticmethod
+    def _snapshot():
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def format(self):
+        """Return the report as text, e.g. to print."""
+        lines = ["{0:<24}{1:>14}{2:>14}".format("Stage", "Allocated",
+                                                "Peak")]
+        for phase in self.phases:
+            lines.append("{0:<24}{1:>14}{2:>14}".format(
+                phase.name, _mib(phase.size), _mib(phase.peak)))
+            for file_name, size in phase.top:
+                lines.append("    {0:<34}{1:>14}".format(
+                    _short_name(file_name), _mib(size)))
+        lines += ["", "{0:<24}{1:>14}{2:>14}".format(
+            "Retained by", "Instances", "Size")]
+        for category, (count, size) in self.retained.items():
+            lines.append("{0:<24}{1:>14}{2:>14}".format(
+                category, count, _mib(size)))
+        return "\n".join(lines)
+
+
+def _short_name(file_name):
+    """The file and its directory, e.g. ``attr/_make.py``."""
+    if not file_name:
+        return "<unknown>"
+    return os.path.join(*file_name.split(os.sep)[-2:])
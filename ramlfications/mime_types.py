@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+from io import open
+
+
+__all__ = ["MediaTypeRegistry", "default_registry", "structured_suffix"]
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+
+#: Sorted table of the supported IANA MIME media types, one per line;
+#: generated by :py:func:`.utils.update_mime_types`
+REGISTRY_FILE = os.path.join(DATA_DIR, "supported_mime_types.txt")
+
+#: Structured syntax suffixes (RFC 6839) of the media types for which
+#: RAML defines schemas
+STRUCTURED_SUFFIXES = frozenset(["json", "xml"])
+
+
+def structured_suffix(value):
+    """
+    Return the structured syntax suffix of MIME media type ``value``
+    (e.g. ``"json"`` for ``application/vnd.api+json``) if it is one of
+    :py:data:`STRUCTURED_SUFFIXES`, else ``None``.
+    """
+    subtype, plus, suffix = value.rpartition("+")
+    if not plus or "/" not in subtype or subtype.endswith("/"):
+        return None
+    suffix = suffix.lower()
+    if suffix in STRUCTURED_SUFFIXES:
+        return suffix
+    return None
+
+
+class MediaTypeRegistry(frozenset):
+    """
+    Immutable set of MIME media types.
+
+    ``in`` tests exact membership; :py:meth:`supports` also accepts any
+    type with a ``+json`` or ``+xml`` suffix under a known top-level type
+    (e.g. ``application/vnd.github.v3+json``).
+    """
+    @property
+    def top_level_types(self):
+        """Top-level types (``application``, ``text``, ...) in use."""
+        try:
+            return self._top_level_types
+        except AttributeError:
+            self._top_level_types = frozenset(
+                t.partition("/")[0] for t in self)
+            return self._top_level_types
+
+    def supports(self, value):
+        """
+        Return ``True`` if ``value`` is a registered type or has a
+        structured suffix under a registered top-level type.
+        """
+        if value in self:
+            return True
+        if structured_suffix(value) is None:
+            return False
+        return value.partition("/")[0] in self.top_level_types
+
+    @classmethod
+    def load(cls, path=REGISTRY_FILE):
+        """Load a registry saved with :py:meth:`save`."""
+        with open(path, "r", encoding="UTF-8") as f:
+            return cls(f.read().split())
+
+    def save(self, path=REGISTRY_FILE):
+        """Save the registry as a sorted table, one type per line."""
+        data = u"".join(t + u"\n" for t in sorted(self))
+        with open(path, "w", encoding="UTF-8") as f:
+            f.write(data)
+
+
+_DEFAULT = []
+
+
+def default_registry():
+    """The registry shipped with the package, loaded on first use."""
+    if not _DEFAULT:
+        _DEFAULT.append(MediaTypeRegistry.load())
+    return _DEFAULT[0]
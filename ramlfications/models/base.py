@@ -3,9 +3,9 @@
 
 from __future__ import absolute_import, division, print_function
 
-import attr
-import markdown2 as md
+import weakref
 
+import attr
 
 from ramlfications.validate import *  # NOQA
 
@@ -38,12 +38,68 @@ class BaseContent(object):
         Returns parsed Markdown into HTML
         """
         if self.data:
-            return md.markdown(self.data)
+            import markdown2
+            return markdown2.markdown(self.data)
 
     def __repr__(self):
         return self.raw
 
 
+#####
+# back references up the tree of nodes
+#####
+class BackReference(object):
+    """
+    Attribute of a node referring back up the tree, like its ``root``.
+
+    Set to a :py:func:`weakref.ref` (see :py:meth:`weaken`), it still
+    reads as the node referred to, but no longer keeps it alive: the
+    tree then has no reference cycles, and is freed as soon as it is
+    not used anymore, without waiting for the cyclic garbage collector.
+
+    :param str name: name of the attribute
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+        try:
+            value = inst.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if isinstance(value, weakref.ref):
+            value = value()
+            if value is None:
+                msg = ("The {0} of this {1} was freed: keep a reference "
+                       "to the parsed API.".format(
+                           self.name, type(inst).__name__))
+                raise ReferenceError(msg)
+        return value
+
+    def __set__(self, inst, value):
+        inst.__dict__[self.name] = value
+
+    def weaken(self, inst):
+        """Make the reference of ``inst`` a weak one."""
+        value = inst.__dict__.get(self.name)
+        if value is not None and not isinstance(value, weakref.ref):
+            inst.__dict__[self.name] = weakref.ref(value)
+
+
+def strong_state(inst):
+    """
+    Pickle state of a node: its ``__dict__``, with the weak back
+    references resolved, as weak references can not be pickled.
+    """
+    state = inst.__dict__.copy()
+    for name, value in state.items():
+        if isinstance(value, weakref.ref):
+            state[name] = value()
+    return state
+
+
 #####
 # base object for RAML nodes (e.g. resources, data types, etc)
 #####
@@ -93,6 +149,13 @@ class BaseNode(object):
     def description(self):
         return BaseContent(self.desc)
 
+    def __getstate__(self):
+        return strong_state(self)
+
+
+# set after ``attr.s``, which would take it for a default value
+BaseNode.root = BackReference("root")
+
 
 #####
 # base objects for .parameters.py
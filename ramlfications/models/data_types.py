@@ -12,7 +12,7 @@ from ramlfications.utils.common import OrderedDict
 from ramlfications.validate import *  # NOQA
 from ramlfications.validate import defined_schema
 
-from .base import BaseContent
+from .base import BackReference, BaseContent, strong_state
 
 
 RAML_MAX_INT = 2147483647
@@ -95,6 +95,13 @@ class DataTypeAttrs(object):
     errors       = attr.ib(repr=False, cmp=False)
     config       = attr.ib(repr=False)
 
+    def __getstate__(self):
+        return strong_state(self)
+
+
+# set after ``attr.s``, which would take it for a default value
+DataTypeAttrs.root = BackReference("root")
+
 
 @attr.s
 class RAMLDataType(object):
@@ -130,6 +137,14 @@ class BaseDataType(DataTypeAttrs, RAMLDataType):
     """
     Base class for all data types.
     """
+    def compile_validator(self):
+        """
+        Compile this type into a payload validator, see
+        :py:func:`ramlfications.validate.payload.compile_data_type`.
+        """
+        # imported here since the payload module needs the type classes
+        from ramlfications.validate.payload import compile_data_type
+        return compile_data_type(self)
 
 
 @type_class("object")
@@ -5,7 +5,10 @@ from __future__ import absolute_import, division, print_function
 
 import attr
 
-from .base import BaseContent, BaseParameter, BaseParameterAttrs
+from .base import (
+    BaseContent, BaseParameter, BaseParameterAttrs, BaseParameterRaml08,
+    BaseParameterRaml10
+)
 from ramlfications.validate import *  # NOQA
 
 
@@ -145,3 +148,40 @@ class SecurityScheme(BaseParameterAttrs):
     described_by  = attr.ib(repr=False)
     desc          = attr.ib(repr=False)
     settings      = attr.ib(repr=False, validator=defined_sec_scheme_settings)
+
+
+#####
+# RAML version-specific parameter classes, e.g. ``QueryParameter08``:
+# built on first use, and looked up by name when unpickling.
+#####
+_VERSION_MIXINS = {"08": BaseParameterRaml08, "10": BaseParameterRaml10}
+_PARAMETER_BASES = dict((k.__name__, k) for k in (
+    URIParameter, QueryParameter, FormParameter, Header, Body, Response
+))
+_PARAMETER_CLASSES = {}
+
+
+def parameter_class(param_obj, raml_version):
+    """
+    Return ``param_obj`` (e.g. :py:class:`.QueryParameter`) mixed with the
+    attributes specific to ``raml_version``.
+
+    Classes are created once, so that equality provided by attr remains
+    useful.
+    """
+    suffix = "08" if raml_version == "0.8" else "10"
+    name = param_obj.__name__ + suffix
+    if name not in _PARAMETER_CLASSES:
+        klass = type(name, (_VERSION_MIXINS[suffix], param_obj),
+                     {"__module__": __name__})
+        _PARAMETER_CLASSES[name] = attr.s(klass)
+    return _PARAMETER_CLASSES[name]
+
+
+def __getattr__(name):
+    base, suffix = name[:-2], name[-2:]
+    if base in _PARAMETER_BASES and suffix in _VERSION_MIXINS:
+        version = "0.8" if suffix == "08" else "1.0"
+        return parameter_class(_PARAMETER_BASES[base], version)
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name))
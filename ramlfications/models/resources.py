@@ -35,6 +35,11 @@ class ResourceNode(BaseNode):
         the values are the parameters assigned (e.g. relevant OAuth 2 scopes).
     :param list security_schemes: A list of assigned \
         :py:class:`parameters.SecurityScheme` objects, or ``None``.
+    :param request_validator: Function checking a request ``dict`` \
+        against the resource's named parameters, see \
+        :py:func:`ramlfications.validate.payload.compile_request_validator`.
+    :param int depth: Nesting level of the resource: ``1`` for top-level \
+        resources, ``parent.depth + 1`` otherwise.
     """
     name             = attr.ib(repr=False)
     parent           = attr.ib(repr=False)
@@ -48,3 +53,26 @@ class ResourceNode(BaseNode):
     resource_type    = attr.ib(repr=False)
     secured_by       = attr.ib(repr=False)
     security_schemes = attr.ib(repr=False)
+    request_validator = attr.ib(repr=False, cmp=False, default=None)
+    depth            = attr.ib(repr=False, default=1)
+
+    def validate_request(self, request):
+        """
+        Check a request ``dict`` (with ``uri``, ``query``, ``headers`` \
+        and ``form`` mappings) against the resource's named parameters.
+
+        :returns: list of :py:class:`.errors.InvalidParameterError`
+        """
+        if self.request_validator is None:
+            from ramlfications.validate.payload import (
+                compile_request_validator
+            )
+            self.request_validator = compile_request_validator(self)
+        return self.request_validator(request)
+
+    def __getstate__(self):
+        # the compiled request validator is a closure; it is compiled
+        # again on first use after unpickling
+        state = super(ResourceNode, self).__getstate__()
+        state["request_validator"] = None
+        return state
@@ -6,50 +6,83 @@ from __future__ import absolute_import, division, print_function
 import attr
 
 from ramlfications.errors import InvalidRAMLError
-from ramlfications.errors import InvalidVersionError
 from ramlfications.utils.common import _get
 
 from .parser import RAMLParser
-from .types import create_root_data_type
-from .parser import RootParser
+from .incremental import IncrementalParser
+from .pipeline import ParsePipeline, _check_version
 
-__all__ = ["parse_raml"]
+__all__ = ["parse_raml", "iter_resources", "IncrementalParser",
+           "ParsePipeline"]
 
 
-def parse_raml(loaded_raml, config):
+def parse_raml(loaded_raml, config, guard=None, fail_fast=None,
+               keep_raw=True, weak_refs=False, gc_mode=None):
     """
-    Parse loaded RAML file into RAML/Python objects.
+    Parse loaded RAML file into RAML/Python objects, see
+    :py:class:`.pipeline.ParsePipeline`.
 
     :param RAMLDict loaded_raml: OrderedDict of loaded RAML file
+    :param LimitGuard guard: enforces the limits on parsing, e.g. the \
+        guard the file was loaded with; defaults to a new guard of the \
+        limits of ``config``
+    :param fail_fast: abort at the first validation error if ``True``, \
+        or at that many errors if a number
+    :param bool keep_raw: keep the loaded RAML data in the nodes' \
+        ``raw`` (see :py:func:`.pipeline.release_raw`)
+    :param bool weak_refs: make the nodes' ``root`` weak references \
+        (see :py:func:`.pipeline.weaken_references`)
+    :param str gc_mode: ``None``, ``"disable"`` or ``"freeze"``, see \
+        :py:class:`.pipeline.ParsePipeline`
     :returns: :py:class:`.raml.RootNodeAPI08` object.
     :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is invalid
+    :raises: :py:class:`.errors.LimitExceededError` when a limit is exceeded
     """
-    validate = str(_get(config, "validate")).lower() == 'true'
+    return ParsePipeline(loaded_raml, config, guard, fail_fast=fail_fast,
+                         keep_raw=keep_raw, weak_refs=weak_refs,
+                         gc_mode=gc_mode).run()
 
-    # Postpone validating the root node until the end; otherwise,
-    # we end up with duplicate validation exceptions.
-    attr.set_run_validators(False)
-    raml_versions = config['raml_versions']
-    if loaded_raml._raml_version not in raml_versions:
-        raise InvalidVersionError(
-            "RAML version not allowed in config {0}: allowed: {1}".format(
-                loaded_raml._raml_version, ", ".join(raml_versions)
-            ))
-    root_parser = RootParser(loaded_raml, config)
-    root = root_parser.create_node()
-    attr.set_run_validators(validate)
 
-    if loaded_raml._raml_fragment_type == 'Root':
-        parser = RAMLParser(loaded_raml, config)
-        root = parser.parse()
-        attr.set_run_validators(validate)
+def iter_resources(loaded_raml, config, guard=None):
+    """
+    Parse loaded RAML file like :py:func:`parse_raml`, but yield its
+    resource nodes one by one in document order instead of returning
+    the root.
 
-        if validate:
-            attr.validate(root)  # need to validate again for root node
+    The root node, with its traits, resource types and security
+    schemes, is parsed first; it is the ``root`` of every node, but its
+    ``resources`` stay ``None``.  Nodes are not kept once yielded, so
+    only the nodes on the path to the current one (its ``parent`` s)
+    stay alive.
+
+    :param RAMLDict loaded_raml: OrderedDict of loaded RAML file
+    :param LimitGuard guard: enforces the limits on parsing, see \
+        :py:func:`parse_raml`
+    :returns: generator of :py:class:`.resources.ResourceNode` objects
+    :raises: :py:class:`.errors.InvalidRAMLError` when the root node is \
+        invalid, before any resource is yielded, or when a resource is \
+        invalid, after the last one was yielded
+    """
+    _check_version(loaded_raml, config)
+    return _iter_resources(loaded_raml, config, guard)
 
-            if root.errors:
-                raise InvalidRAMLError(root.errors)
-        return root
 
-    if loaded_raml._raml_fragment_type == 'DataType':
-        return create_root_data_type(loaded_raml, root)
+def _iter_resources(loaded_raml, config, guard):
+    if loaded_raml._raml_fragment_type != "Root":
+        return
+    validate = str(_get(config, "validate")).lower() == 'true'
+    attr.set_run_validators(validate)
+
+    parser = RAMLParser(loaded_raml, config, guard)
+    root = parser.parse_root()
+    root.resources = None
+    if validate and root.errors:
+        raise InvalidRAMLError(root.errors)
+
+    for node in parser.iter_resources(root):
+        yield node
+        # another parse may have switched validators while suspended
+        attr.set_run_validators(validate)
+
+    if validate and root.errors:
+        raise InvalidRAMLError(root.errors)
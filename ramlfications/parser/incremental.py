@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import hashlib
+import os
+import re
+
+import attr
+from six import iteritems, string_types
+
+from ramlfications.errors import InvalidRAMLError, InvalidVersionError
+from ramlfications.limits import config_guard
+from ramlfications.utils import NodeList, load_file
+from ramlfications.utils.common import OrderedDict, _get
+
+from .parser import ResourceParser, RootParser, parsers
+
+
+__all__ = ["IncrementalParser"]
+
+
+#: Keys whose values name traits, resource types, security schemes or
+#: data types that the enclosing definition depends on.
+REFERENCE_KEYS = ("is", "type", "securedBy", "items")
+
+NAME_RE = re.compile(r"[^\s\[\]|(),]+")
+
+
+class _Entry(object):
+    """Parsed state of one trait, resource type, etc. or top-level resource"""
+    def __init__(self, fingerprint, refs):
+        self.fingerprint = fingerprint
+        self.refs = refs
+        self.nodes = []
+        self.errors = []
+
+
+class IncrementalParser(object):
+    """
+    Parses a RAML document and, after an edit, re-parses only what the
+    edit affected.
+
+    Top-level resources (with all their nested resources), traits,
+    resource types, security schemes and data types are tracked
+    separately.  On :py:meth:`update`, an item is rebuilt if its own
+    definition changed or if it uses a trait, resource type, security
+    scheme or data type that was rebuilt; everything else is moved over
+    from the previous root.  Changes to the root of the document itself
+    (e.g. ``baseUri``, ``schemas``, ``mediaType``) re-parse everything.
+
+    After an edit of files the document includes, :py:meth:`update_files`
+    loads the document again only if it includes one of them, as
+    recorded by the loader (``_raml_includes``).
+
+    Since unchanged nodes are moved to the new root, a root returned
+    earlier must not be used anymore after calling :py:meth:`update`.
+
+    :param dict config: parser configuration
+    """
+    def __init__(self, config):
+        self.config = config
+        self.root = None
+        #: names of the items rebuilt by the last parse, per RAML property
+        #: (``"resources"`` for top-level resources)
+        self.rebuilt = {}
+        self._root_print = None
+        self._errors = []
+        self._components = {}
+        self._resources = OrderedDict()
+        self._includes = {}
+
+    def parse(self, loaded_raml):
+        """
+        Parse ``loaded_raml`` from scratch.
+
+        :param RAMLDict loaded_raml: OrderedDict of loaded RAML file
+        :returns: :py:class:`.raml.RootNodeAPI08` object.
+        :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is \
+            invalid
+        """
+        self._root_print = None
+        self._components = {}
+        self._resources = OrderedDict()
+        return self.update(loaded_raml)
+
+    def update(self, loaded_raml):
+        """
+        Parse a new version of the previously parsed RAML file, reusing
+        the nodes of unaffected resources, traits, resource types, etc.
+
+        :param RAMLDict loaded_raml: OrderedDict of the edited RAML file
+        :returns: :py:class:`.raml.RootNodeAPI08` object.
+        :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is \
+            invalid
+        """
+        validate = str(_get(self.config, "validate")).lower() == 'true'
+        raml_versions = self.config['raml_versions']
+        if loaded_raml._raml_version not in raml_versions:
+            raise InvalidVersionError(
+                "RAML version not allowed in config {0}: allowed: {1}".format(
+                    loaded_raml._raml_version, ", ".join(raml_versions)
+                ))
+        if loaded_raml._raml_fragment_type != "Root":
+            from . import parse_raml
+            return parse_raml(loaded_raml, self.config)
+
+        # fingerprint everything before parsing, which may alter the data
+        root_print = _fingerprint(_root_section(loaded_raml))
+        components = OrderedDict(
+            (p.raml_property, _entries(loaded_raml, p.raml_property))
+            for p in parsers
+        )
+        resources = OrderedDict(
+            (k, _Entry(_fingerprint(v), _references(v)))
+            for k, v in iteritems(loaded_raml) if k.startswith("/")
+        )
+
+        if root_print != self._root_print:
+            self._components = {}
+            self._resources = OrderedDict()
+        changed = self._changed(components, resources)
+
+        # nodes of all versions share one errors list, so that moved
+        # nodes keep reporting to the current root
+        del self._errors[:]
+        attr.set_run_validators(validate)
+        root_parser = RootParser(loaded_raml, self.config)
+        root_parser.errors = self._errors
+        root = root_parser.create_node()
+
+        self.rebuilt = {}
+        for parser in parsers:
+            entries = components[parser.raml_property]
+            nodes = NodeList()
+            for name, entry in iteritems(entries):
+                if name in changed[parser.raml_property]:
+                    data = _subset(loaded_raml, parser.raml_property, name)
+                    self._build(entry, root, lambda: parser(
+                        data, root, self.config).create_nodes())
+                    self.rebuilt.setdefault(
+                        parser.raml_property, []).append(name)
+                else:
+                    self._reuse(entry, root,
+                                self._components[parser.raml_property][name])
+                nodes.extend(entry.nodes)
+            setattr(root, parser.root_property, nodes)
+
+        root.resources = NodeList()
+        for key, entry in iteritems(resources):
+            if key in changed["resources"]:
+                data = OrderedDict([(key, loaded_raml[key])])
+                self._build(entry, root, lambda: ResourceParser(
+                    data, root, self.config).create_nodes(nodes=NodeList()))
+                self.rebuilt.setdefault("resources", []).append(key)
+            else:
+                self._reuse(entry, root, self._resources[key])
+            root.resources.extend(entry.nodes)
+
+        self.root = root
+        self._root_print = root_print
+        self._components = components
+        self._resources = resources
+        self._includes = getattr(loaded_raml, "_raml_includes", None) or {}
+
+        if validate:
+            attr.validate(root)  # need to validate again for root node
+            if root.errors:
+                raise InvalidRAMLError(root.errors)
+        return root
+
+    def update_files(self, changed_files):
+        """
+        Parse the previously parsed RAML file again after ``changed_files``
+        were edited, if it includes any of them, directly or not.  Without
+        includes, the RAML file is not known: pass it to :py:meth:`update`.
+
+        The include graph records files, not the nodes they are included
+        in: the document is loaded again, and what the edit affected is
+        found by comparing it with the previous version, as by
+        :py:meth:`update`.
+
+        :param list changed_files: paths of the edited files
+        :returns: :py:class:`.raml.RootNodeAPI08` object, the previous \
+            one if the document includes none of ``changed_files``
+        :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is \
+            invalid
+        """
+        changed = set(os.path.abspath(f) for f in changed_files)
+        included = set()
+        for children in self._includes.values():
+            included.update(children)
+        # the one file including others that none includes
+        raml_files = [f for f in self._includes if f not in included]
+        if not changed & included.union(raml_files):
+            self.rebuilt = {}
+            return self.root
+        raml_file = raml_files[0]
+        loaded = load_file(raml_file, config_guard(self.config))
+        return self.update(loaded)
+
+    def _changed(self, components, resources):
+        """
+        Names of the items that need to be rebuilt, per RAML property,
+        including every item depending on a rebuilt item.
+        """
+        changed = {}
+        for prop, entries in iteritems(components):
+            previous = self._components.get(prop, {})
+            changed[prop] = set(
+                n for n, e in iteritems(entries)
+                if n not in previous or
+                previous[n].fingerprint != e.fingerprint
+            )
+            # removed items affect whatever still refers to them
+            changed[prop].update(n for n in previous if n not in entries)
+
+        names = set()
+        for prop_names in changed.values():
+            names.update(prop_names)
+        while True:
+            added = False
+            for prop, entries in iteritems(components):
+                for name, entry in iteritems(entries):
+                    if name not in changed[prop] and entry.refs & names:
+                        changed[prop].add(name)
+                        names.add(name)
+                        added = True
+            if not added:
+                break
+
+        changed["resources"] = set(
+            k for k, e in iteritems(resources)
+            if k not in self._resources or
+            self._resources[k].fingerprint != e.fingerprint or
+            e.refs & names
+        )
+        return changed
+
+    def _build(self, entry, root, create_nodes):
+        start = len(root.errors)
+        entry.nodes = list(create_nodes())
+        entry.errors = root.errors[start:]
+
+    def _reuse(self, entry, root, previous):
+        entry.nodes = previous.nodes
+        entry.errors = previous.errors
+        for node in entry.nodes:
+            node.root = root
+        root.errors.extend(entry.errors)
+
+
+#####
+# Private, module-level helper functions
+#####
+def _fingerprint(data):
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+
+
+def _root_section(loaded_raml):
+    properties = set(p.raml_property for p in parsers)
+    section = [(k, v) for k, v in iteritems(loaded_raml)
+               if k not in properties and not k.startswith("/")]
+    return loaded_raml._raml_version, section
+
+
+def _items(loaded_raml, raml_property):
+    data = loaded_raml.get(raml_property) or []
+    if isinstance(data, dict):
+        # RAML 1.0 uses a map
+        return list(iteritems(data))
+    # RAML 0.8 uses a list of maps
+    items = []
+    for d in data:
+        items.extend(iteritems(d))
+    return items
+
+
+def _entries(loaded_raml, raml_property):
+    return OrderedDict(
+        (name, _Entry(_fingerprint(value), _references(value)))
+        for name, value in _items(loaded_raml, raml_property)
+    )
+
+
+def _subset(loaded_raml, raml_property, name):
+    """Loaded RAML with only the given item of ``raml_property``."""
+    data = loaded_raml.get(raml_property)
+    if isinstance(data, dict):
+        return {raml_property: OrderedDict([(name, data[name])])}
+    for d in data:
+        if name in d:
+            return {raml_property: [OrderedDict([(name, d[name])])]}
+
+
+def _names(value, names):
+    if isinstance(value, string_types):
+        names.update(NAME_RE.findall(value))
+    elif isinstance(value, dict):
+        for k, v in iteritems(value):
+            _names(k, names)
+            if isinstance(v, (dict, list)):
+                _references(v, names)
+    elif isinstance(value, list):
+        for v in value:
+            _names(v, names)
+
+
+def _references(data, names=None):
+    """
+    Names of traits, resource types, etc. that ``data`` refers to, or
+    may refer to: an over-estimate only causes extra rebuilding.
+    """
+    if names is None:
+        names = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for k, v in iteritems(value):
+                if k in REFERENCE_KEYS:
+                    _names(v, names)
+                if isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return names
@@ -3,15 +3,10 @@
 
 from __future__ import absolute_import, division, print_function
 
-import attr
 from six import iteritems, itervalues, string_types
 
-from ramlfications.config import MEDIA_TYPES
-from ramlfications.models.base import (
-    BaseParameterRaml08, BaseParameterRaml10
-)
 from ramlfications.models.parameters import (
-    Body, Header, Response, URIParameter
+    Body, Header, Response, URIParameter, parameter_class
 )
 from ramlfications.utils import load_schema, NodeList
 from ramlfications.utils.common import _get, substitute_parameters
@@ -20,18 +15,11 @@ from ramlfications.utils.parameter import (
 )
 from ramlfications.utils.parser import get_data_type_obj_by_name
 from ramlfications.utils.examples import parse_examples
+from ramlfications.validate.utils import get_context
 
 
 class BaseParameterParser(object):
 
-    # We keep a cache of concrete classes created when we mix in the
-    # RAML-version-specific specialization below so general equality
-    # support provided by the attr package remains useful.
-    #
-    # Creating a new class every time through breaks that.
-    #
-    _classes = {}
-
     def create_base_param_obj(self, attribute_data, param_obj,
                               config, errors, root, **kw):
         """
@@ -96,24 +84,7 @@ class BaseParameterParser(object):
                 kwargs.update(parse_examples(raml_version, value))
 
             # build object class based off of raml version
-            ParamObj = param_obj
-            mixin = BaseParameterRaml10
-            suffix = "10"
-            if raml_version == "0.8":
-                mixin = BaseParameterRaml08
-                suffix = "08"
-
-            key = param_obj, mixin
-
-            if key in self._classes:
-                ParamObj = self._classes[key]
-            else:
-                @attr.s
-                class ParamObj(mixin, param_obj):
-                    pass
-
-                ParamObj.__name__ = param_obj.__name__ + suffix
-                self._classes[key] = ParamObj
+            ParamObj = parameter_class(param_obj, raml_version)
 
             item = ParamObj(**kwargs)
             objects.append(item)
@@ -290,7 +261,7 @@ class ResponseParser(BaseParameterParser, BodyParserMixin):
         body_list = []
         no_mime_body_data = {}
         for key, spec in list(iteritems(body)):
-            if key not in MEDIA_TYPES:
+            if not get_context(self.root.config).media_types.supports(key):
                 # if a root mediaType was defined, the response body
                 # may omit the mime_type definition
                 if key in ('schema', 'example'):
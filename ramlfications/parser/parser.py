@@ -12,11 +12,13 @@ from ramlfications.models import (
     RAML_VERSION_LOOKUP, ResourceTypeNode, ResourceNode,
     SecuritySchemeNode, TraitNode
 )
+from ramlfications.limits import config_guard
 from ramlfications.models.root import Documentation
 from ramlfications.utils import load_schema, NodeList
 from ramlfications.utils.common import _map_attr
 from ramlfications.utils.parser import sort_uri_params
 from ramlfications.utils.types import parse_type
+from ramlfications.validate.payload import compile_request_validator
 
 from .base import BaseParser, BaseNodeParser
 from .mixins import NodeMixin
@@ -38,23 +40,41 @@ class RAMLParser(object):
 
     :param dict data: raw RAML data
     :param dict config: parser configuration
+    :param LimitGuard guard: enforces the limits on parsing, see \
+        :py:class:`.limits.Limits`; defaults to the limits of ``config``
 
     :ret: A `RootNodeAPI` object
     """
-    def __init__(self, data, config):
+    def __init__(self, data, config, guard=None):
         self.data = data
         self.config = config
+        self.guard = guard
 
-    def parse(self):
+    def parse_root(self):
+        """
+        Parse the root node with its traits, resource types, security
+        schemes, etc. but without its resources.
+        """
         root_parser = RootParser(self.data, self.config)
         root = root_parser.create_node()
         for p in parsers:
             parser = p(self.data, root, self.config)
             nodes = parser.create_nodes()
             setattr(root, p.root_property, nodes)
+        return root
 
-        resource_parser = ResourceParser(self.data, root, self.config)
-        root.resources = resource_parser.create_nodes(nodes=NodeList())
+    def iter_resources(self, root):
+        """
+        Generator of the resource nodes of ``root`` (see
+        :py:meth:`parse_root`), in document order.
+        """
+        resource_parser = ResourceParser(self.data, root, self.config,
+                                         self.guard)
+        return resource_parser.iter_nodes()
+
+    def parse(self):
+        root = self.parse_root()
+        root.resources = NodeList(self.iter_resources(root))
         return root
 
 
@@ -407,12 +427,14 @@ class ResourceParser(BaseNodeParser, NodeMixin):
     """
     Parses raw RAML data to create `ResourceTypeNode` objects, if any.
     """
-    def __init__(self, data, root, config):
+    def __init__(self, data, root, config, guard=None):
         super(ResourceParser, self).__init__(data, root, config)
+        self.guard = guard or config_guard(config)
         self.resolve_from = [
             "method", "resource", "types", "traits", "parent", "root"
         ]
         self.parent = None
+        self.depth = 1
         self.child_data = {}
         self.method_data = {}
         self.protos = None
@@ -448,6 +470,7 @@ class ResourceParser(BaseNodeParser, NodeMixin):
         node["path"] = self.path
         node["method"] = self.method
         node["parent"] = self.parent
+        node["depth"] = self.depth
 
         node["display_name"] = self.display_name()
         node["absolute_uri"] = abs_uri
@@ -468,6 +491,8 @@ class ResourceParser(BaseNodeParser, NodeMixin):
         return node
 
     def create_node(self):
+        # not the data of the method of the previous resource parsed
+        self.method_data = {}
         if self.method is not None:
             self.method_data = self.child_data.get(self.method, {})
 
@@ -489,26 +514,44 @@ class ResourceParser(BaseNodeParser, NodeMixin):
 
         node = self.create_node_dict()
 
-        return ResourceNode(**node)
-
-    def create_nodes(self, nodes, parent=None):
-        for k, v in list(iteritems(self.data)):
-            if k.startswith("/"):
-                self.parent = parent
-
-                self.name = k
-                self.child_data = v
-                self.data = self.child_data
-                methods = [m for m in self.avail if m in list(iterkeys(v))]
-                if methods:
-                    for m in methods:
-                        self.method = m
-                        child = self.create_node()
-                        nodes.append(child)
-                else:
-                    self.method = None
-                    child = self.create_node()
-                    nodes.append(child)
-                nodes = self.create_nodes(nodes, child)
+        resource = ResourceNode(**node)
+        resource.request_validator = compile_request_validator(resource)
+        return resource
 
+    def create_nodes(self, nodes, parent=None, depth=1):
+        nodes.extend(self.iter_nodes(parent, depth))
         return nodes
+
+    def iter_nodes(self, parent=None, depth=1):
+        """
+        Generator of resource nodes in document order.  Only the nodes
+        on the path to the current one are referenced.
+        """
+        # Depth-first, with an explicit stack of the resources left to
+        # visit at each level rather than recursion, so that nesting is
+        # not bound by the recursion limit.
+        stack = [(iter(list(iteritems(self.data))), parent, depth)]
+        while stack:
+            items, parent, depth = stack[-1]
+            for k, v in items:
+                if k.startswith("/"):
+                    break
+            else:
+                stack.pop()
+                continue
+
+            path = getattr(parent, "path", "") + k
+            self.guard.add_node(depth, path)
+            self.parent = parent
+            self.depth = depth
+
+            self.name = k
+            self.child_data = v
+            self.data = self.child_data
+            methods = [m for m in self.avail if m in list(iterkeys(v))]
+            for m in methods or [None]:
+                self.method = m
+                child = self.create_node()
+                yield child
+            # children hang off the last node created for the resource
+            stack.append((iter(list(iteritems(v))), child, depth + 1))
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import gc
+import time
+
+import attr
+
+from ramlfications.errors import InvalidRAMLError, InvalidVersionError
+from ramlfications.limits import config_guard
+from ramlfications.models.base import BackReference
+from ramlfications.models.data_types import DataTypeAttrs
+from ramlfications.utils import NodeList
+from ramlfications.utils.common import OrderedDict, _get
+from ramlfications.validate.decorators import error_list
+
+from .parser import ResourceParser, RootParser, parsers
+from .types import create_root_data_type
+
+
+__all__ = ["ParsePipeline", "release_raw", "weaken_references"]
+
+
+#: Values of ``gc_mode``, see :py:class:`ParsePipeline`
+GC_MODES = (None, "disable", "freeze")
+
+#: ``raw`` keys data types keep after :py:func:`release_raw`: payload
+#: validators read the inline facets of properties from them
+DATA_TYPE_RAW_KEYS = ("properties",)
+
+
+def _check_version(loaded_raml, config):
+    raml_versions = config['raml_versions']
+    if loaded_raml._raml_version not in raml_versions:
+        raise InvalidVersionError(
+            "RAML version not allowed in config {0}: allowed: {1}".format(
+                loaded_raml._raml_version, ", ".join(raml_versions)
+            ))
+
+
+def _released(obj):
+    if isinstance(obj, DataTypeAttrs) and isinstance(obj.raw, dict):
+        kept = [(k, obj.raw[k]) for k in DATA_TYPE_RAW_KEYS if k in obj.raw]
+        return OrderedDict(kept) or None
+    return None
+
+
+def _models(api):
+    """The models (``attr.s`` instances) of a parsed ``api``, once each."""
+    seen = set()
+    pending = [api]
+    while pending:
+        obj = pending.pop()
+        is_model = hasattr(type(obj), "__attrs_attrs__")
+        if not is_model and not isinstance(obj, (dict, list, tuple)):
+            continue
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, dict):
+            pending.extend(obj.values())
+            continue
+        if not is_model:
+            pending.extend(obj)
+            continue
+        yield obj
+        for field in attr.fields(type(obj)):
+            if field.name not in ("raw", "raml_obj", "config"):
+                pending.append(getattr(obj, field.name, None))
+
+
+def release_raw(api):
+    """
+    Drop the loaded RAML data a parsed ``api`` keeps: the ``raw`` data
+    of its nodes, parameters, bodies, responses and data types, and the
+    root's ``raml_obj``, which are parts of the whole loaded document.
+    The released attributes are ``None``; what the models parsed from
+    them is kept.
+
+    :param api: parsed root node or data type
+    """
+    for model in _models(api):
+        names = attr.fields_dict(type(model))
+        if "raw" in names:
+            model.raw = _released(model)
+        if "raml_obj" in names:
+            model.raml_obj = None
+
+
+def weaken_references(api):
+    """
+    Make the ``root`` of each node of a parsed ``api`` a weak reference
+    (see :py:class:`.models.base.BackReference`), so that ``api`` has no
+    reference cycles and is freed as soon as it is not used anymore.
+    Reading the ``root`` of a node once ``api`` was freed raises
+    :py:exc:`ReferenceError`.
+
+    :param api: parsed root node or data type
+    """
+    for model in _models(api):
+        for name in dir(type(model)):
+            reference = getattr(type(model), name, None)
+            if isinstance(reference, BackReference):
+                reference.weaken(model)
+
+
+class ParsePipeline(object):
+    """
+    Parses a RAML file in stages, each run at most once and on demand;
+    its product is kept and passed on to the next stage:
+
+    ``load``
+        the loaded RAML (see :py:class:`.loader.RAMLLoader`)
+    ``root``
+        the root node
+    ``components``
+        the root node with its data types, traits, resource types and
+        security schemes
+    ``resources``
+        the :py:class:`.NodeList` of resource nodes, also set as the
+        root's ``resources``
+    ``validate``
+        the root node, once its resources are checked too
+
+    Asking for a stage runs the stages before it first, if they did not
+    run yet.  The seconds each stage took are in :py:attr:`timings`.
+
+    :param raml: String path to the RAML file, a file object, or \
+        already loaded RAML, which is then the product of ``load``.
+    :param dict config: parser configuration
+    :param LimitGuard guard: enforces the limits on loading and \
+        parsing; defaults to the limits of ``config``
+    :param callable hook: called with the name, product and duration \
+        of each stage once it ran
+    :param fail_fast: abort at the first validation error if ``True``, \
+        or at that many errors if a number, instead of parsing the whole \
+        file first
+    :param bool keep_raw: keep the loaded RAML data in the nodes' \
+        ``raw`` once parsed; if ``False``, :py:meth:`run` releases it \
+        (see :py:func:`release_raw`)
+    :param bool weak_refs: make the nodes' ``root`` weak references once \
+        parsed, see :py:func:`weaken_references`
+    :param str gc_mode: ``"disable"`` to turn the cyclic garbage \
+        collector off while :py:meth:`run` parses, or ``"freeze"`` to \
+        also move what is left afterwards out of its reach \
+        (:py:func:`gc.freeze`), making later collections faster; \
+        ``None`` leaves it alone
+    """
+    STAGES = ("load", "root", "components", "resources", "validate")
+
+    def __init__(self, raml, config, guard=None, hook=None, fail_fast=None,
+                 keep_raw=True, weak_refs=False, gc_mode=None):
+        if gc_mode not in GC_MODES:
+            raise ValueError("Unknown gc_mode: {0!r}".format(gc_mode))
+        self.raml = raml
+        self.config = config
+        self.guard = guard or config_guard(config)
+        self.hook = hook
+        self.fail_fast = fail_fast
+        self.keep_raw = keep_raw
+        self.weak_refs = weak_refs
+        self.gc_mode = gc_mode
+        self.validate = str(_get(config, "validate")).lower() == 'true'
+        #: seconds taken by each stage run, in order
+        self.timings = OrderedDict()
+        self._products = {}
+        if isinstance(raml, dict):
+            self._products["load"] = raml
+            self.timings["load"] = 0.0
+
+    def stage(self, name):
+        """
+        Return the product of stage ``name``, running it and the stages
+        before it if needed.
+        """
+        if name not in self._products:
+            position = self.STAGES.index(name)
+            if position:
+                self.stage(self.STAGES[position - 1])
+            start = time.time()
+            product = getattr(self, "_" + name)()
+            self.timings[name] = time.time() - start
+            self._products[name] = product
+            if self.hook is not None:
+                self.hook(name, product, self.timings[name])
+        return self._products[name]
+
+    def run(self):
+        """
+        Run all stages and return the parsed RAML file.
+
+        :returns: the validated root node, or the data type of a \
+            ``DataType`` fragment
+        :raises: :py:class:`.errors.InvalidRAMLError` when RAML file is \
+            invalid
+        """
+        collecting = gc.isenabled()
+        if self.gc_mode is not None:
+            gc.disable()
+        try:
+            api = self._run()
+        finally:
+            if collecting:
+                gc.enable()
+        if self.gc_mode == "freeze":
+            # what parsing left as garbage would be kept for good
+            gc.collect()
+            gc.freeze()
+        return api
+
+    def _run(self):
+        loaded = self.stage("load")
+        if loaded._raml_fragment_type == "DataType":
+            api = create_root_data_type(loaded, self.stage("root"))
+        elif loaded._raml_fragment_type == "Root":
+            api = self.stage("validate")
+        else:
+            return None
+        if not self.keep_raw:
+            release_raw(api)
+            # the pipeline's products are parts of the API too
+            self._products.pop("load", None)
+        if self.weak_refs:
+            weaken_references(api)
+        return api
+
+    #####
+    # Stages
+    #####
+    def _load(self):
+        from ramlfications.utils import load_file
+
+        return load_file(self.raml, self.guard)
+
+    def _root(self):
+        loaded = self._products["load"]
+        _check_version(loaded, self.config)
+        # fragments are not APIs: their root has no title, baseUri, etc.
+        fragment = loaded._raml_fragment_type != "Root"
+        attr.set_run_validators(self.validate and not fragment)
+        root_parser = RootParser(loaded, self.config)
+        root_parser.errors = error_list(self.fail_fast)
+        try:
+            return root_parser.create_node()
+        finally:
+            attr.set_run_validators(self.validate)
+
+    def _components(self):
+        loaded = self._products["load"]
+        root = self._products["root"]
+        attr.set_run_validators(self.validate)
+        for p in parsers:
+            nodes = p(loaded, root, self.config).create_nodes()
+            setattr(root, p.root_property, nodes)
+        return root
+
+    def _resources(self):
+        loaded = self._products["load"]
+        root = self._products["components"]
+        attr.set_run_validators(self.validate)
+        resource_parser = ResourceParser(loaded, root, self.config,
+                                         self.guard)
+        root.resources = NodeList(resource_parser.iter_nodes())
+        return root.resources
+
+    def _validate(self):
+        root = self._products["components"]
+        if self.validate:
+            # the other fields were validated when the root was built
+            field = attr.fields(type(root)).resources
+            field.validator(root, field, root.resources)
+            if root.errors:
+                raise InvalidRAMLError(root.errors)
+        return root
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import threading
+
+from .config import setup_config
+from .errors import LoadRAMLError
+from .limits import config_guard
+from .loader import RAMLLoader
+from .parser import parse_raml
+from .utils import _get_raml_object
+
+
+__all__ = ["RAMLReloader"]
+
+
+def _stat(file_name):
+    try:
+        st = os.stat(file_name)
+    except OSError:
+        return None
+    return st.st_mtime, st.st_size
+
+
+class RAMLReloader(object):
+    """
+    Keeps a parsed RAML file up to date with the files it is made of.
+
+    The RAML file and every file it includes (see
+    :py:attr:`.loader.RAMLLoader.includes`) are polled for changes to
+    their modification time or size; when one changed, the RAML file is
+    loaded and parsed again and the new root replaces :py:attr:`root` in
+    a single assignment, so readers never wait nor see a half-built
+    root.  A RAML file that fails to load or parse leaves the previous
+    root in place and is reported in :py:attr:`last_error`.
+
+    :param str raml_file: path to the RAML file
+    :param str config_file: path to the config file, if any
+    :param float interval: seconds between polls of the background thread
+    :param callable on_reload: called with the new root after each reload
+    :param bool weak_refs: parse with weak ``root`` references, so that \
+        a replaced root is freed as soon as it is not used anymore, \
+        without a pause of the cyclic garbage collector; see \
+        :py:func:`ramlfications.parse`
+    :param str gc_mode: ``None``, ``"disable"`` or ``"freeze"``, see \
+        :py:func:`ramlfications.parse`
+    :raises LoadRAMLError: if the RAML file can not be loaded initially
+    :raises InvalidRAMLError: if the RAML file is invalid initially
+    """
+    def __init__(self, raml_file, config_file=None, interval=1.0,
+                 on_reload=None, weak_refs=False, gc_mode=None):
+        self.raml_file = os.path.abspath(raml_file)
+        self.config = setup_config(config_file)
+        self.interval = interval
+        self.on_reload = on_reload
+        self.weak_refs = weak_refs
+        self.gc_mode = gc_mode
+        #: exception raised by the last reload, ``None`` if it succeeded
+        self.last_error = None
+        self._root = None
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.reload(raise_errors=True)
+
+    @property
+    def root(self):
+        """The most recently parsed root node."""
+        return self._root
+
+    @property
+    def files(self):
+        """Absolute paths of the watched files."""
+        return list(self._stats)
+
+    def changed(self):
+        """Return the watched files that changed since the last reload."""
+        return [f for f, stat in list(self._stats.items())
+                if _stat(f) != stat]
+
+    def check(self):
+        """
+        Reload if a watched file changed.
+
+        :returns: ``True`` if a new root was swapped in
+        """
+        if not self.changed():
+            return False
+        return self.reload()
+
+    def reload(self, raise_errors=False):
+        """
+        Load and parse the RAML file, and swap in the new root.
+
+        :param bool raise_errors: raise instead of recording errors in \
+            :py:attr:`last_error`
+        :returns: ``True`` if a new root was swapped in
+        """
+        with self._lock:
+            guard = config_guard(self.config)
+            loader = RAMLLoader(guard)
+            # stat before reading, so that edits made while loading are
+            # picked up by the next check
+            stats = {self.raml_file: _stat(self.raml_file)}
+            try:
+                try:
+                    with _get_raml_object(self.raml_file) as raml:
+                        loaded = loader.load(raml)
+                except IOError as e:
+                    raise LoadRAMLError(e)
+                root = parse_raml(loaded, self.config, guard,
+                                  weak_refs=self.weak_refs,
+                                  gc_mode=self.gc_mode)
+            except Exception as e:
+                self.last_error = e
+                if raise_errors:
+                    raise
+                return False
+            finally:
+                # also keep watching whatever a failed attempt read, so
+                # that fixing a broken include triggers another one
+                for file_name in loader.dependencies(self.raml_file):
+                    stats.setdefault(file_name, _stat(file_name))
+                self._stats = stats
+            self.last_error = None
+            self._root = root
+        if self.on_reload is not None:
+            self.on_reload(root)
+        return True
+
+    def start(self):
+        """Start polling for changes in a background (daemon) thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="RAMLReloader")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the background thread started by :py:meth:`start`."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -7,7 +7,6 @@ from ramlfications.utils.common import OrderedDict
 import sys
 
 from six import iteritems, itervalues
-from termcolor import colored
 
 from .config import setup_config
 from .parser import parse_raml
@@ -26,14 +25,6 @@ COLOR_MAP = {
 }
 
 
-def _get_node_level(node, count):
-    if node.parent:
-        count += 1
-        return _get_node_level(node.parent, count)
-    else:
-        return count
-
-
 def _get_tree(api):
     resources = OrderedDict()
     for r in api.resources:
@@ -47,13 +38,14 @@ def _get_tree(api):
 
 
 def _create_space(v):
-    space_count = _get_node_level(v, count=0)
-    space = "  " * space_count
+    space = "  " * (v.depth - 1)
     return space
 
 
 def _set_ansi(string, screen_color, line_color):
     if screen_color:
+        from termcolor import colored
+
         color, attr = COLOR_MAP[screen_color][line_color]
         if attr:
             return colored(string, color, attrs=[attr])
@@ -4,37 +4,37 @@
 from __future__ import absolute_import, division, print_function
 
 
+from importlib.util import find_spec
 from io import open
 import json
-import logging
 import os
 import sys
 
 import six
-import xmltodict
 
 from ramlfications.errors import MediaTypeError, LoadRAMLError
-from ramlfications.loader import RAMLLoader
+from ramlfications.mime_types import REGISTRY_FILE, MediaTypeRegistry
 from ramlfications.utils.nodelist import NodeList  # noqa
 
 
 PYVER = sys.version_info[:3]
 
+# The download libraries are only needed to update the MIME media types,
+# so they are imported on first use (see ``_requests_download`` and
+# ``_urllib_download``).
+requests = None
+urllib = None
+urllib_error = None
+
 if PYVER == (2, 7, 9) or PYVER == (3, 4, 3):  # NOCOV
-    import six.moves.urllib.request as urllib
-    import six.moves.urllib.error as urllib_error
     URLLIB = True
     SECURE_DOWNLOAD = True
+elif find_spec("requests") is not None:  # NOCOV
+    URLLIB = False
+    SECURE_DOWNLOAD = True
 else:
-    try:  # NOCOV
-        import requests
-        URLLIB = False
-        SECURE_DOWNLOAD = True
-    except ImportError:
-        import six.moves.urllib.request as urllib
-        import six.moves.urllib.error as urllib_error
-        URLLIB = True
-        SECURE_DOWNLOAD = False
+    URLLIB = True
+    SECURE_DOWNLOAD = False
 
 
 IANA_URL = "https://www.iana.org/assignments/media-types/media-types.xml"
@@ -54,6 +54,7 @@ def load_schema(data):
         pass
 
     try:
+        import xmltodict
         return xmltodict.parse(data)
     except Exception:  # GOTTA CATCH THEM ALL
         pass
@@ -63,6 +64,9 @@ def load_schema(data):
 
 def setup_logger(key):
     """General logger"""
+    # only needed to update the MIME media types
+    import logging
+
     log = logging.getLogger(__name__)
     log.setLevel(logging.DEBUG)
     console = logging.StreamHandler()
@@ -77,6 +81,9 @@ def setup_logger(key):
 
 def _requests_download(url):
     """Download a URL using ``requests`` library"""
+    global requests
+    if requests is None:
+        import requests
     try:
         response = requests.get(url)
         return response.text
@@ -87,6 +94,11 @@ def _requests_download(url):
 
 def _urllib_download(url):
     """Download a URL using ``urllib`` library"""
+    global urllib, urllib_error
+    if urllib is None:
+        import six.moves.urllib.request as urllib
+    if urllib_error is None:
+        import six.moves.urllib.error as urllib_error
     try:
         response = urllib.urlopen(url)
     except urllib_error.URLError as e:
@@ -116,6 +128,7 @@ def download_url(url):
 
 def _xml_to_dict(response_text):
     """Parse XML response from IANA into a Python ``dict``."""
+    import xmltodict
     try:
         return xmltodict.parse(response_text)
     except xmltodict.expat.ExpatError as e:
@@ -162,13 +175,11 @@ def _parse_xml_data(xml_data):
 
 
 def _save_updated_mime_types(output_file, mime_types):
-    """Save the updated MIME Media types within the package."""
-    # not sure why json.dump(mime_types) doesn't work, raises a TypeError
-    # saying it should be unicode. So loading in memory then making the
-    # str -> unicode
-    data = json.dumps(mime_types)
-    with open(output_file, "w", encoding="UTF-8") as f:
-        f.write(six.text_type(data))
+    """
+    Save the updated MIME Media types within the package, as a
+    :py:class:`.mime_types.MediaTypeRegistry` table.
+    """
+    MediaTypeRegistry(mime_types).save(output_file)
 
 
 def update_mime_types():
@@ -183,25 +194,24 @@ def update_mime_types():
     xml_data = _xml_to_dict(raw_data)
     mime_types = _parse_xml_data(xml_data)
 
-    current_dir = os.path.dirname(os.path.realpath(__file__))
-    data_dir = os.path.join(current_dir, "data")
-    output_file = os.path.join(data_dir, "supported_mime_types.json")
-
-    _save_updated_mime_types(output_file, mime_types)
+    _save_updated_mime_types(REGISTRY_FILE, mime_types)
 
     log.debug("Done! Supported IANA MIME media types have been updated.")
 
 
-def load_file(raml_file):
+def load_file(raml_file, guard=None):
+    # imported here: ``ramlfications.loader`` itself imports this package
+    from ramlfications.loader import RAMLLoader
     try:
         with _get_raml_object(raml_file) as raml:
-            return RAMLLoader().load(raml)
+            return RAMLLoader(guard).load(raml)
     except IOError as e:
         raise LoadRAMLError(e)
 
 
-def load_string(raml_str):
-    return RAMLLoader().load(raml_str)
+def load_string(raml_str, guard=None):
+    from ramlfications.loader import RAMLLoader
+    return RAMLLoader(guard).load(raml_str)
 
 
 def _get_raml_object(raml_file):
@@ -4,6 +4,7 @@
 from __future__ import absolute_import, division, print_function
 
 import re
+import weakref
 
 try:
     from collections import OrderedDict as PythonOrderedDict
@@ -73,6 +74,40 @@ def substitute_parameters(data, param_data):
     return json_data
 
 
+# RAML 0.8 traits and resource types by name, keyed by ``(id(raw), key)``
+# and dropped along with the loaded RAML they were computed from.
+_BY_NAME = {}
+
+
+def _by_name(items):
+    by_name = {}
+    for item in items:
+        by_name.setdefault(list(iterkeys(item))[0], []).append(item)
+    return by_name
+
+
+def declarations_by_name(root, key, items):
+    """
+    Return the RAML 0.8 traits/resource types (``key``) ``items``, a list
+    of one-item mappings declared in the root of ``root``, as a ``dict``
+    of each name to its declarations, computed once per document instead
+    of scanning the list for every node.
+    """
+    raw = root.raw
+    cache_key = (id(raw), key)
+    cached = _BY_NAME.get(cache_key)
+    if cached is not None and cached[0]() is raw and cached[1] is items:
+        return cached[2]
+    by_name = _by_name(items)
+    try:
+        ref = weakref.ref(raw, lambda _, k=cache_key: _BY_NAME.pop(k, None))
+    except TypeError:
+        # plain dicts can not be weakly referenced; don't cache
+        return by_name
+    _BY_NAME[cache_key] = (ref, items, by_name)
+    return by_name
+
+
 #####
 # Public helper functions for modules in ramlfications/utils
 #####
@@ -91,12 +126,12 @@ def get_inherited_trait_data(attr, traits, name, root):
             names.append(n)
 
     if root.raml_version == "0.8":
-        trait_raml = [t for t in traits if list(iterkeys(t))[0] in names]
+        by_name = declarations_by_name(root, "traits", traits)
     else:
-        trait_raml = [traits]
+        by_name = dict((n, [traits]) for n in names)
     trait_data = []
     for n in names:
-        for t in trait_raml:
+        for t in by_name.get(n, []):
             t_raml = _get(t, n, {})
             attribute_data = _get(t_raml, attr, {})
             trait_data.append({attr: attribute_data})
@@ -111,7 +146,10 @@ def merge_dicts(child, parent, path=[]):
         return child
     for key in parent:
         if key in child:
-            if isinstance(child[key], dict) and isinstance(parent[key], dict):
+            if child[key] is parent[key]:
+                pass  # merged before: inherited data is shared, not copied
+            elif isinstance(child[key], dict) and \
+                    isinstance(parent[key], dict):
                 merge_dicts(child[key], parent[key], path + [str(key)])
             elif child[key] == parent[key]:
                 pass  # same leaf value
@@ -161,11 +199,13 @@ def __get_inherited_res_type_data(attr, types, name, method, root):
     if isinstance(name, dict):
         name = list(iterkeys(name))[0]
     if root.raml_version == "0.8":
-        res_type_raml = [r for r in types if list(iterkeys(r))[0] == name]
+        by_name = declarations_by_name(root, "resourceTypes", types)
         # only need the first one
-        # TODO: clean me up
-        if res_type_raml:
-            res_type_raml = res_type_raml[0]
+        try:
+            res_type_raml = by_name.get(name, [None])[0]
+        except TypeError:
+            # not a name, e.g. a list of resource types (invalid RAML)
+            res_type_raml = None
     else:
         res_type_raml = types
     if attr == "uri_params":
@@ -45,7 +45,7 @@ def resolve_inherited_scalar(item, inherit_from=[], **kwargs):
     path = _get(kwargs, "resource_path")
     path_name = "<<resourcePathName>>"
     if path:
-        path_name = path.split("/")[-1]
+        path_name = path.rsplit("/", 1)[-1]
     else:
         path = "<<resourcePath>>"
     for obj_type in inherit_from:
@@ -67,13 +67,16 @@ def sort_uri_params(params, path):
         path = path[0]
 
     pattern = re.compile(r'\{(.*?)\}')
-    param_order = re.findall(pattern, path)
+    # position of each parameter's first appearance in the path
+    param_order = {}
+    for index, name in enumerate(re.findall(pattern, path)):
+        param_order.setdefault(name, index)
 
     media_type = None
     media_type_param = None
-    for p in params:
+    for index, p in enumerate(params):
         if p.name == "mediaTypeExtension":
-            media_type = params.index(p)
+            media_type = index
             break
 
     if media_type is not None:
@@ -85,8 +88,7 @@ def sort_uri_params(params, path):
         if p.name == "version":
             continue
         if p.name in param_order:
-            index = param_order.index(p.name)
-            to_sort.append((index, p))
+            to_sort.append((param_order[p.name], p))
 
     params = [p[1] for p in sorted(to_sort, key=lambda item: item[0])]
 
@@ -3,8 +3,6 @@
 
 from __future__ import absolute_import, division, print_function
 
-import inflect
-
 __all__ = ["pluralize", "singularize"]
 
 #####
@@ -14,12 +12,22 @@ __all__ = ["pluralize", "singularize"]
 # Add your function here, and add to the __all__ statement above^
 #####
 
-p = inflect.engine()
+_engine = None
+
+
+def _inflect():
+    # building an inflect engine is slow, so only do it when a RAML file
+    # actually uses one of the tag functions
+    global _engine
+    if _engine is None:
+        import inflect
+        _engine = inflect.engine()
+    return _engine
 
 
 def pluralize(input_str):
-    return p.plural(input_str)
+    return _inflect().plural(input_str)
 
 
 def singularize(input_str):
-    return p.singular_noun(input_str)
+    return _inflect().singular_noun(input_str)
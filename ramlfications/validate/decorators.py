@@ -4,7 +4,7 @@
 from __future__ import absolute_import, division, print_function
 
 
-from ramlfications.errors import BaseRAMLError
+from ramlfications.errors import BaseRAMLError, InvalidRAMLError
 
 
 # TODO: maybe move this to validate/utils.py
@@ -13,6 +13,40 @@ def collecterrors(func):
         try:
             func(inst, attr, value)
         except BaseRAMLError as e:
+            # the traceback's frames refer to the node: a reference cycle
+            # through the root's errors
+            e.__traceback__ = None
             inst.errors.append(e)
 
     return func_wrapper
+
+
+class ErrorList(list):
+    """
+    List of validation errors that raises
+    :py:class:`.errors.InvalidRAMLError` once it holds ``limit`` errors,
+    aborting the parse it collects the errors of.
+
+    :param int limit: number of errors to abort at
+    """
+    def __init__(self, limit):
+        super(ErrorList, self).__init__()
+        self.limit = limit
+
+    def append(self, error):
+        super(ErrorList, self).append(error)
+        if len(self) >= self.limit:
+            raise InvalidRAMLError(list(self))
+
+
+def error_list(fail_fast=None):
+    """
+    Return the list to collect the validation errors of a parse in.
+
+    :param fail_fast: ``True`` to abort at the first error, a number \
+        to abort at that many errors; ``None`` or ``False`` to collect \
+        all errors.
+    """
+    if fail_fast:
+        return ErrorList(int(fail_fast))
+    return []
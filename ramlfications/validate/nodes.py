@@ -8,6 +8,7 @@ from six import iterkeys, string_types
 from ramlfications.errors import *  # NOQA
 
 from .decorators import collecterrors
+from .utils import declared_names
 
 
 #####
@@ -59,12 +60,11 @@ def assigned_traits(inst, attr, value):
     represented in the RAML.
     """
     if value:
-        traits = inst.root.raw.get("traits", {})
-        if not traits:
+        if not inst.root.raw.get("traits", {}):
             msg = ("Trying to assign traits that are not defined"
                    "in the root of the API.")
             raise InvalidResourceNodeError(msg)
-        trait_names = [list(iterkeys(i))[0] for i in traits]
+        trait_names = declared_names(inst.root.raw, "traits")
         if not isinstance(value, list):
             msg = ("The assigned traits, '{0}', needs to be either an array "
                    "of strings or dictionaries mapping parameter values to "
@@ -112,8 +112,7 @@ def assigned_res_type(inst, attr, value):
             )
             raise InvalidResourceNodeError(msg)
 
-        res_types = inst.root.raw.get("resourceTypes", {})
-        res_type_names = [list(iterkeys(i))[0] for i in res_types]
+        res_type_names = declared_names(inst.root.raw, "resourceTypes")
         if isinstance(value, list):
             item = value[0]  # NOCOV
         elif isinstance(value, dict):
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function
 from ramlfications.errors import *  # NOQA
 
 from .decorators import collecterrors
-from .utils import validate_mime_type
+from .utils import FORM_MIME_TYPES, get_context
 
 
 #####
@@ -16,7 +16,7 @@ from .utils import validate_mime_type
 @collecterrors
 def header_type(inst, attr, value):
     """Supported header type"""
-    if value and value not in inst.config.get("prim_types"):
+    if value and value not in get_context(inst.config).prim_types:
         msg = "'{0}' is not a valid primative parameter type".format(value)
         raise InvalidParameterError(msg, "header")
 
@@ -24,11 +24,9 @@ def header_type(inst, attr, value):
 @collecterrors
 def body_mime_type(inst, attr, value):
     """Supported MIME media type for request/response"""
-    if value:
-        match = validate_mime_type(value)
-        if value not in inst.config.get("media_types") and not match:
-            msg = "Unsupported MIME Media Type: '{0}'.".format(value)
-            raise InvalidParameterError(msg, "body")
+    if value and not get_context(inst.config).supported_media_type(value):
+        msg = "Unsupported MIME Media Type: '{0}'.".format(value)
+        raise InvalidParameterError(msg, "body")
 
 
 @collecterrors
@@ -36,8 +34,7 @@ def body_schema(inst, attr, value):
     """
     Assert no ``schema`` is defined if body as a form-related MIME media type
     """
-    form_types = ["multipart/form-data", "application/x-www-form-urlencoded"]
-    if inst.mime_type in form_types and value:
+    if inst.mime_type in FORM_MIME_TYPES and value:
         msg = "Body must define formParameters, not schema/example."
         raise InvalidParameterError(msg, "body")
 
@@ -47,8 +44,7 @@ def body_example(inst, attr, value):
     """
     Assert no ``example`` is defined if body as a form-related MIME media type
     """
-    form_types = ["multipart/form-data", "application/x-www-form-urlencoded"]
-    if inst.mime_type in form_types and value:
+    if inst.mime_type in FORM_MIME_TYPES and value:
         msg = "Body must define formParameters, not schema/example."
         raise InvalidParameterError(msg, "body")
 
@@ -59,8 +55,7 @@ def body_form(inst, attr, value):
     Assert ``formParameters`` are defined if body has a form-related
     MIME type.
     """
-    form_types = ["multipart/form-data", "application/x-www-form-urlencoded"]
-    if inst.mime_type in form_types and not value:
+    if inst.mime_type in FORM_MIME_TYPES and not value:
         msg = "Body with mime_type '{0}' requires formParameters.".format(
             inst.mime_type)
         raise InvalidParameterError(msg, "body")
@@ -75,7 +70,7 @@ def response_code(inst, attr, value):
         msg = ("Response code '{0}' must be an integer representing an "
                "HTTP code.".format(value))
         raise InvalidParameterError(msg, "response")
-    if value not in inst.config.get("resp_codes"):
+    if value not in get_context(inst.config).resp_codes:
         msg = "'{0}' not a valid HTTP response code.".format(value)
         raise InvalidParameterError(msg, "response")
 
@@ -0,0 +1,858 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import re
+import sys
+from collections import namedtuple
+
+from six import integer_types, iteritems, string_types
+
+from ramlfications.errors import (
+    DataTypeValidationError, InvalidParameterError, UnknownDataTypeError
+)
+from ramlfications.models.data_types import (
+    RAML_MAX_INT, ArrayDataType, BooleanDataType, DateDataType,
+    FileDataType, IntegerDataType, NullDataType, NumberDataType,
+    ObjectDataType, StringDataType
+)
+from ramlfications.utils.parser import convert_camel_case
+
+
+__all__ = [
+    "BatchResult", "compile_data_type", "compile_request_validator",
+    "validate_batch"
+]
+
+
+#####
+# Public API
+#####
+def compile_data_type(data_type):
+    """
+    Compile a parsed data type into a payload validator.
+
+    All facets (patterns, bounds, enums, property maps) are resolved
+    once here; the returned function only runs the checks that apply.
+
+    :param BaseDataType data_type: parsed RAML data type, e.g. one of \
+        ``root.types``
+    :returns: function taking a payload and returning a list of \
+        :py:class:`.errors.DataTypeValidationError` (empty if valid)
+    :raises UnknownDataTypeError: if the type references an undefined type
+    """
+    check = _Compiler(data_type.root).compile(data_type)
+
+    def validate(value):
+        errors = []
+        check(value, "$", errors)
+        return errors
+
+    return validate
+
+
+#: Result of :py:func:`validate_batch`: ``fields`` names the bits of
+#: each entry in ``bitmap``; bit ``i`` is set if ``fields[i]`` failed.
+BatchResult = namedtuple("BatchResult", ["fields", "bitmap"])
+
+#: Name of the last bit in a :py:class:`BatchResult`, set for errors
+#: that concern the record as a whole (e.g. additional properties).
+RECORD_FIELD = "*"
+
+
+def validate_batch(data_type, batch):
+    """
+    Validate many payloads against one object data type, checking each
+    property column-wise rather than record by record.
+
+    Scalar properties (strings, numbers, integers, booleans with their
+    ``enum``, ``pattern``, length and bound facets) are checked a whole
+    column at a time; NumPy array columns are checked with array
+    operations.  Other properties fall back to the compiled checks of
+    :py:func:`compile_data_type` applied to each value of the column.
+
+    :param ObjectDataType data_type: parsed RAML object data type
+    :param batch: either an iterable of record ``dict`` s, or a columnar \
+        batch: a ``dict`` mapping property names to equal-length lists \
+        or NumPy arrays.  In a columnar batch, ``None`` marks a missing \
+        value.
+    :returns: :py:class:`BatchResult` with one ``int`` bitmap per record, \
+        ``0`` meaning the record is valid
+    """
+    compiler = _Compiler(data_type.root)
+    facets = _facets_from_type(data_type)
+    props = facets.get("properties", [])
+    fields = [p[0] for p in props] + [RECORD_FIELD]
+
+    if isinstance(batch, dict):
+        columns = batch
+        lengths = set(len(c) for c in columns.values())
+        if len(lengths) > 1:
+            raise ValueError("Columns of a batch must have equal length.")
+        count = lengths.pop() if lengths else 0
+        missing = None
+        record_fails = _columnar_record_failures(facets, columns, count)
+    else:
+        records = list(batch)
+        count = len(records)
+        missing = _MISSING
+        columns = {}
+        for name, _, _ in props:
+            columns[name] = [
+                r.get(name, _MISSING) if isinstance(r, dict) else _MISSING
+                for r in records
+            ]
+        record_fails = _record_failures(facets, records)
+
+    failures = []
+    for name, required, definition in props:
+        column = columns.get(name)
+        if column is None:
+            failures.append([required] * count)
+            continue
+        failures.append(_column_failures(
+            compiler, definition, required, column, missing))
+    failures.append(record_fails)
+    return BatchResult(fields, _bitmap(failures, count))
+
+
+#: Keys of a request ``dict`` and the resource attributes they check.
+REQUEST_PARAMS = (
+    ("uri", "uri_params"),
+    ("query", "query_params"),
+    ("headers", "headers"),
+    ("form", "form_params"),
+)
+
+
+def compile_request_validator(node):
+    """
+    Compile the named parameters of a resource into a request validator.
+
+    The returned function takes a request ``dict`` with optional
+    ``uri``, ``query``, ``headers`` and ``form`` mappings of parameter
+    name to value (a ``str`` as received over HTTP, an already typed
+    value, or a list for repeated parameters).  Header names are matched
+    case-insensitively.  Base URI parameters are not checked.
+
+    :param ResourceNode node: parsed resource
+    :returns: function taking a request ``dict`` and returning a list of \
+        :py:class:`.errors.InvalidParameterError` (empty if valid)
+    """
+    compiler = _Compiler(node.root)
+    sections = []
+    for key, attr_name in REQUEST_PARAMS:
+        params = _request_params(node, attr_name)
+        if params:
+            checks = tuple(
+                _compile_parameter(compiler, key, p) for p in params)
+            sections.append((key, key == "headers", checks))
+    sections = tuple(sections)
+
+    def validate(request):
+        errors = []
+        for key, is_header, checks in sections:
+            values = request.get(key) or {}
+            if is_header:
+                values = dict((k.lower(), v) for k, v in iteritems(values))
+            for check in checks:
+                check(values, errors)
+        return errors
+
+    return validate
+
+
+#####
+# Private, module-level helpers
+#####
+_MISSING = object()
+
+BUILTIN_TYPES = {
+    "any": "any",
+    "array": "array",
+    "boolean": "boolean",
+    "date-only": "string",
+    "datetime": "string",
+    "datetime-only": "string",
+    "date": "string",
+    "file": "any",
+    "integer": "integer",
+    "nil": "nil",
+    "null": "nil",
+    "number": "number",
+    "object": "object",
+    "string": "string",
+    "time-only": "string",
+}
+
+FACETS = (
+    "enum", "pattern", "min_length", "max_length", "minimum", "maximum",
+    "multiple_of", "items", "min_items", "max_items", "unique_items",
+    "properties", "min_properties", "max_properties",
+    "additional_properties",
+)
+
+
+def _error(errors, path, msg, value):
+    errors.append(DataTypeValidationError(
+        "{0}: {1}, but got: {2!r}".format(path, msg, value)))
+
+
+def _kind(data_type):
+    # subclasses before their parents
+    for klass, kind in ((IntegerDataType, "integer"),
+                        (NumberDataType, "number"),
+                        (StringDataType, "string"),
+                        (BooleanDataType, "boolean"),
+                        (ObjectDataType, "object"),
+                        (ArrayDataType, "array"),
+                        (NullDataType, "nil"),
+                        (DateDataType, "string"),
+                        (FileDataType, "any")):
+        if isinstance(data_type, klass):
+            return kind
+    return "any"
+
+
+def _facets_from_type(data_type):
+    facets = {}
+    for name in FACETS:
+        value = getattr(data_type, name, None)
+        if value is not None:
+            facets[name] = value
+    if "properties" in facets:
+        # ``Property`` only keeps the type name; keep the raw definition
+        # so inline facets (e.g. ``minLength``) are honored as well.
+        raw_props = (data_type.raw or {}).get("properties") or {}
+        facets["properties"] = [
+            _property(name, raw_props.get(name, prop.type))
+            for name, prop in iteritems(facets["properties"])
+        ]
+    return facets
+
+
+def _property(name, definition):
+    """
+    ``(name, required, definition)`` of an object property: required
+    unless its ``required`` facet, or else a name ending in ``?``, makes
+    it optional.  The ``?`` is not part of the name.
+    """
+    required = not name.endswith("?")
+    if not required:
+        name = name[:-1]
+    if isinstance(definition, dict):
+        required = definition.get("required", required)
+    return name, bool(required), definition
+
+
+def _declared_type(raw):
+    """
+    Type of an inline definition: without ``type``, an object if it has
+    ``properties``, else a string.
+    """
+    declared = raw.get("type")
+    if declared is None:
+        declared = "object" if "properties" in raw else "string"
+    return declared
+
+
+def _compile_pattern(pattern):
+    """
+    Compiled ``pattern``, or ``None`` if it is not a valid regular
+    expression: the pattern is then not checked, as parsing must not
+    fail on it.
+    """
+    if hasattr(pattern, "search"):
+        return pattern
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError):
+        return None
+
+
+def _facets_from_raw(raw):
+    facets = {}
+    for key, value in iteritems(raw):
+        key = convert_camel_case(key)
+        if key in FACETS and value is not None:
+            facets[key] = value
+    if "pattern" in facets:
+        facets["pattern"] = _compile_pattern(facets["pattern"])
+    if "properties" in facets:
+        facets["properties"] = [
+            _property(name, definition)
+            for name, definition in iteritems(facets["properties"])
+        ]
+    return facets
+
+
+def _all(checks):
+    checks = tuple(checks)
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value, path, errors):
+        for c in checks:
+            c(value, path, errors)
+    return check
+
+
+def _any(checks, expr):
+    checks = tuple(checks)
+
+    def check(value, path, errors):
+        for c in checks:
+            errs = []
+            c(value, path, errs)
+            if not errs:
+                return
+        _error(errors, path, "does not match any of '{0}'".format(expr),
+               value)
+    return check
+
+
+def _check_any(value, path, errors):
+    pass
+
+
+def _enum_check(enum, check_type):
+    try:
+        members = frozenset(enum)
+    except TypeError:
+        members = tuple(enum)
+    msg = "must be one of {0}".format(list(enum))
+
+    def check(value, path, errors):
+        if check_type(value, path, errors):
+            try:
+                ok = value in members
+            except TypeError:
+                ok = False
+            if not ok:
+                _error(errors, path, msg, value)
+    return check
+
+
+class _Compiler(object):
+    """
+    Builds a tree of closures from data types.  Named types are compiled
+    once per compiler, which also allows recursive type definitions.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.named = {}
+
+    def compile(self, data_type):
+        facets = _facets_from_type(data_type)
+        if data_type.name and data_type.name not in self.named:
+            return self._compile_named(
+                data_type.name, lambda: self.build(_kind(data_type), facets))
+        return self.build(_kind(data_type), facets)
+
+    def expression(self, expr):
+        """Compile a type expression: name, ``X[]``, ``A | B``, list, map"""
+        if isinstance(expr, dict):
+            return self._inline(expr)
+        if isinstance(expr, list):
+            return _all([self.expression(e) for e in expr])
+        if not isinstance(expr, string_types):
+            raise UnknownDataTypeError(
+                "'{0}' is not a valid type expression.".format(expr))
+        expr = expr.strip()
+        if "|" in expr:
+            return _any([self.expression(e) for e in expr.split("|")], expr)
+        if expr.startswith("(") and expr.endswith(")"):
+            return self.expression(expr[1:-1])
+        if expr.endswith("[]"):
+            return self.build("array", {"items": expr[:-2]})
+        if expr in BUILTIN_TYPES:
+            return self.build(BUILTIN_TYPES[expr], {})
+        return self._compile_named(expr, lambda: self.compile(
+            self._lookup(expr)))
+
+    def _lookup(self, name):
+        for t in getattr(self.root, "types", None) or []:
+            if t.name == name:
+                return t
+        msg = "'{0}' is not a supported or defined RAML Data Type.".format(
+            name)
+        raise UnknownDataTypeError(msg)
+
+    def _compile_named(self, name, build):
+        if name in self.named:
+            return self.named[name]
+        compiled = []
+
+        def forward(value, path, errors):
+            compiled[0](value, path, errors)
+
+        self.named[name] = forward
+        check = build()
+        compiled.append(check)
+        self.named[name] = check
+        return check
+
+    def _inline(self, raw):
+        declared = _declared_type(raw)
+        facets = _facets_from_raw(raw)
+        if isinstance(declared, string_types) and declared in BUILTIN_TYPES:
+            return self.build(BUILTIN_TYPES[declared], facets)
+        base = self.expression(declared)
+        if not facets:
+            return base
+        kind = "any"
+        if isinstance(declared, string_types) and "|" not in declared:
+            if declared.endswith("[]"):
+                kind = "array"
+            else:
+                kind = _kind(self._lookup(declared))
+        return _all([base, self.build(kind, facets)])
+
+    def build(self, kind, facets):
+        return getattr(self, "_build_" + kind)(facets)
+
+    def _build_any(self, facets):
+        return _check_any
+
+    def _build_nil(self, facets):
+        def check(value, path, errors):
+            if value is not None:
+                _error(errors, path, "expected nil", value)
+        return check
+
+    def _build_boolean(self, facets):
+        def check_type(value, path, errors):
+            if value is True or value is False:
+                return True
+            _error(errors, path, "expected a boolean", value)
+            return False
+
+        if "enum" in facets:
+            return _enum_check(facets["enum"], check_type)
+        return check_type
+
+    def _build_string(self, facets):
+        min_length = facets.get("min_length") or 0
+        max_length = facets.get("max_length", RAML_MAX_INT)
+        if max_length >= RAML_MAX_INT:
+            max_length = None
+        pattern = facets.get("pattern")
+        search = pattern.search if pattern is not None else None
+        pattern_msg = "must match pattern '{0}'".format(
+            getattr(pattern, "pattern", pattern))
+        min_msg = "must be at least {0} characters".format(min_length)
+        max_msg = "must be at most {0} characters".format(max_length)
+
+        def check_type(value, path, errors):
+            if not isinstance(value, string_types):
+                _error(errors, path, "expected a string", value)
+                return False
+            length = len(value)
+            if length < min_length:
+                _error(errors, path, min_msg, value)
+            elif max_length is not None and length > max_length:
+                _error(errors, path, max_msg, value)
+            if search is not None and search(value) is None:
+                _error(errors, path, pattern_msg, value)
+            return True
+
+        if "enum" in facets:
+            return _enum_check(facets["enum"], check_type)
+        return check_type
+
+    def _build_number(self, facets, integer=False):
+        minimum = facets.get("minimum")
+        maximum = facets.get("maximum")
+        multiple_of = facets.get("multiple_of")
+        kinds = integer_types if integer else integer_types + (float,)
+        type_msg = "expected an integer" if integer else "expected a number"
+        min_msg = "must be greater than or equal to {0}".format(minimum)
+        max_msg = "must be less than or equal to {0}".format(maximum)
+        mult_msg = "must be a multiple of {0}".format(multiple_of)
+
+        def check_type(value, path, errors):
+            if not isinstance(value, kinds) or isinstance(value, bool):
+                _error(errors, path, type_msg, value)
+                return False
+            if minimum is not None and value < minimum:
+                _error(errors, path, min_msg, value)
+            if maximum is not None and value > maximum:
+                _error(errors, path, max_msg, value)
+            if multiple_of and value % multiple_of:
+                _error(errors, path, mult_msg, value)
+            return True
+
+        if "enum" in facets:
+            return _enum_check(facets["enum"], check_type)
+        return check_type
+
+    def _build_integer(self, facets):
+        return self._build_number(facets, integer=True)
+
+    def _build_array(self, facets):
+        items = facets.get("items")
+        item_check = self.expression(items) if items is not None else None
+        min_items = facets.get("min_items") or 0
+        max_items = facets.get("max_items", RAML_MAX_INT)
+        if max_items >= RAML_MAX_INT:
+            max_items = None
+        unique = bool(facets.get("unique_items"))
+        min_msg = "must have at least {0} items".format(min_items)
+        max_msg = "must have at most {0} items".format(max_items)
+
+        def check(value, path, errors):
+            if not isinstance(value, (list, tuple)):
+                _error(errors, path, "expected an array", value)
+                return
+            count = len(value)
+            if count < min_items:
+                _error(errors, path, min_msg, value)
+            elif max_items is not None and count > max_items:
+                _error(errors, path, max_msg, value)
+            if unique:
+                try:
+                    dupes = len(set(value)) != count
+                except TypeError:
+                    dupes = any(v in value[:i] for i, v in enumerate(value))
+                if dupes:
+                    _error(errors, path, "items must be unique", value)
+            if item_check is not None:
+                for i, item in enumerate(value):
+                    item_check(item, "{0}[{1}]".format(path, i), errors)
+        return check
+
+    def _build_object(self, facets):
+        props = tuple(
+            (name, required, self.expression(definition))
+            for name, required, definition in facets.get("properties", [])
+        )
+        known = frozenset(p[0] for p in props)
+        closed = facets.get("additional_properties") is False
+        min_props = facets.get("min_properties") or 0
+        max_props = facets.get("max_properties")
+        min_msg = "must have at least {0} properties".format(min_props)
+        max_msg = "must have at most {0} properties".format(max_props)
+
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                _error(errors, path, "expected an object", value)
+                return
+            for name, required, prop_check in props:
+                if name in value:
+                    prop_check(value[name], path + "." + name, errors)
+                elif required:
+                    _error(errors, path + "." + name,
+                           "required property is missing", None)
+            if closed:
+                for name in value:
+                    if name not in known:
+                        _error(errors, path + "." + name,
+                               "additional property not allowed",
+                               value[name])
+            if min_props or max_props is not None:
+                count = len(value)
+                if count < min_props:
+                    _error(errors, path, min_msg, value)
+                elif max_props is not None and count > max_props:
+                    _error(errors, path, max_msg, value)
+        return check
+
+
+#####
+# Column-wise helpers for ``validate_batch``
+#####
+def _fails(check, value):
+    errors = []
+    check(value, "$", errors)
+    return bool(errors)
+
+
+def _record_failures(facets, records):
+    known = frozenset(p[0] for p in facets.get("properties", []))
+    closed = facets.get("additional_properties") is False
+    min_props = facets.get("min_properties") or 0
+    max_props = facets.get("max_properties")
+    if max_props is None:
+        max_props = RAML_MAX_INT
+
+    def fails(record):
+        if not isinstance(record, dict):
+            return True
+        if closed and not known.issuperset(record):
+            return True
+        return not min_props <= len(record) <= max_props
+    return [fails(r) for r in records]
+
+
+def _columnar_record_failures(facets, columns, count):
+    known = set(p[0] for p in facets.get("properties", []))
+    extra = [c for c in columns if c not in known]
+    fails = facets.get("additional_properties") is False and extra
+    return [bool(fails)] * count
+
+
+def _scalar_facets(compiler, definition):
+    """
+    Returns ``(kind, facets)`` if ``definition`` is a scalar that can be
+    checked column-wise, else ``None``.
+    """
+    if isinstance(definition, dict):
+        declared = _declared_type(definition)
+        facets = _facets_from_raw(definition)
+        if not isinstance(declared, string_types):
+            return None
+        if declared not in BUILTIN_TYPES:
+            if facets:
+                return None
+            return _scalar_facets(compiler, declared)
+        kind = BUILTIN_TYPES[declared]
+    elif not isinstance(definition, string_types):
+        return None
+    elif definition in BUILTIN_TYPES:
+        kind, facets = BUILTIN_TYPES[definition], {}
+    elif "|" in definition or definition.endswith("[]"):
+        return None
+    else:
+        data_type = compiler._lookup(definition)
+        kind, facets = _kind(data_type), _facets_from_type(data_type)
+    if kind not in ("string", "number", "integer", "boolean"):
+        return None
+    return kind, facets
+
+
+def _column_failures(compiler, definition, required, column, missing):
+    scalar = _scalar_facets(compiler, definition)
+    numpy = _numpy()
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        fails = None
+        if scalar is not None:
+            fails = _numpy_failures(scalar[0], scalar[1], column)
+        if fails is not None:
+            return fails
+        column = column.tolist()
+    if scalar is None:
+        check = compiler.expression(definition)
+        return [
+            required if v is missing else _fails(check, v) for v in column
+        ]
+    ok = _scalar_predicate(*scalar)
+    return [required if v is missing else not ok(v) for v in column]
+
+
+def _scalar_predicate(kind, facets):
+    """Returns a function answering whether a single value is valid."""
+    tests = []
+    if kind == "string":
+        tests.append(lambda v: isinstance(v, string_types))
+        min_length = facets.get("min_length") or 0
+        max_length = facets.get("max_length", RAML_MAX_INT)
+        if min_length or max_length < RAML_MAX_INT:
+            tests.append(lambda v: min_length <= len(v) <= max_length)
+        pattern = facets.get("pattern")
+        if pattern is not None:
+            search = pattern.search
+            tests.append(lambda v: search(v) is not None)
+    elif kind == "boolean":
+        tests.append(lambda v: v is True or v is False)
+    else:
+        kinds = integer_types
+        if kind == "number":
+            kinds = integer_types + (float,)
+        tests.append(
+            lambda v: isinstance(v, kinds) and not isinstance(v, bool))
+        minimum = facets.get("minimum")
+        if minimum is not None:
+            tests.append(lambda v: v >= minimum)
+        maximum = facets.get("maximum")
+        if maximum is not None:
+            tests.append(lambda v: v <= maximum)
+        multiple_of = facets.get("multiple_of")
+        if multiple_of:
+            tests.append(lambda v: not v % multiple_of)
+    enum = facets.get("enum")
+    if enum is not None:
+        try:
+            members = frozenset(enum)
+        except TypeError:
+            members = tuple(enum)
+        tests.append(lambda v: v in members)
+    tests = tuple(tests)
+
+    def ok(value):
+        for test in tests:
+            if not test(value):
+                return False
+        return True
+    return ok
+
+
+_NUMPY_KINDS = {
+    "boolean": "b",
+    "integer": "iu",
+    "number": "iuf",
+    "string": "U",
+}
+
+
+def _numpy_failures(kind, facets, column):
+    """
+    Vectorized checks for typed NumPy columns.  Returns ``None`` if the
+    column's dtype can not be checked this way (e.g. ``object``).
+    """
+    if column.dtype.kind not in _NUMPY_KINDS[kind]:
+        return None
+    numpy = _numpy()
+    fails = numpy.zeros(column.shape, dtype=bool)
+    if kind == "string":
+        min_length = facets.get("min_length") or 0
+        max_length = facets.get("max_length", RAML_MAX_INT)
+        if min_length or max_length < RAML_MAX_INT:
+            lengths = numpy.char.str_len(column)
+            fails |= (lengths < min_length) | (lengths > max_length)
+        pattern = facets.get("pattern")
+        if pattern is not None:
+            search = pattern.search
+            fails |= numpy.fromiter(
+                (search(v) is None for v in column.tolist()),
+                dtype=bool, count=len(column))
+    elif kind in ("integer", "number"):
+        minimum = facets.get("minimum")
+        if minimum is not None:
+            fails |= column < minimum
+        maximum = facets.get("maximum")
+        if maximum is not None:
+            fails |= column > maximum
+        multiple_of = facets.get("multiple_of")
+        if multiple_of:
+            fails |= numpy.mod(column, multiple_of) != 0
+    enum = facets.get("enum")
+    if enum is not None:
+        fails |= ~numpy.isin(column, list(enum))
+    return fails
+
+
+def _numpy():
+    # NumPy is optional, and only of use for columns that already are
+    # NumPy arrays: don't pay for importing it otherwise
+    return sys.modules.get("numpy")
+
+
+def _bitmap(failures, count):
+    numpy = _numpy()
+    if numpy is not None and len(failures) < 64 and any(
+            isinstance(f, numpy.ndarray) for f in failures):
+        bitmap = numpy.zeros(count, dtype=numpy.uint64)
+        for bit, fails in enumerate(failures):
+            fails = numpy.asarray(fails, dtype=bool)
+            bitmap[fails] |= numpy.uint64(1 << bit)
+        return bitmap.tolist()
+
+    bitmap = [0] * count
+    for bit, fails in enumerate(failures):
+        if not any(fails):
+            continue
+        flag = 1 << bit
+        for i, failed in enumerate(fails):
+            if failed:
+                bitmap[i] |= flag
+    return bitmap
+
+
+#####
+# Named parameter helpers for ``compile_request_validator``
+#####
+def _request_params(node, attr_name):
+    params = list(getattr(node, attr_name, None) or [])
+    if attr_name == "form_params":
+        # form parameters may be defined per form MIME type in the body
+        names = set(p.name for p in params)
+        for body in getattr(node, "body", None) or []:
+            for p in body.form_params or []:
+                if p.name not in names:
+                    names.add(p.name)
+                    params.append(p)
+    return params
+
+
+def _coerce_boolean(value):
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+def _coerce(kind):
+    """Returns a function converting HTTP strings to ``kind``."""
+    if kind == "integer":
+        convert = int
+    elif kind == "number":
+        convert = float
+    elif kind == "boolean":
+        return lambda v: _coerce_boolean(v) if isinstance(
+            v, string_types) else v
+    else:
+        return None
+
+    def coerce(value):
+        if isinstance(value, string_types):
+            try:
+                return convert(value)
+            except ValueError:
+                pass
+        return value
+    return coerce
+
+
+def _compile_parameter(compiler, key, param):
+    data_type = getattr(param, "data_type", None)
+    if data_type is not None:
+        kind = _kind(data_type)
+        try:
+            value_check = compiler.compile(data_type)
+        except UnknownDataTypeError:
+            # an invalid type definition is reported by spec validation;
+            # don't fail parsing because of it here
+            value_check = _check_any
+    else:
+        kind = BUILTIN_TYPES.get(param.type or "string", "any")
+        facets = {}
+        for name in ("enum", "min_length", "max_length", "minimum",
+                     "maximum"):
+            value = getattr(param, name, None)
+            if value is not None:
+                facets[name] = value
+        if param.pattern:
+            facets["pattern"] = _compile_pattern(param.pattern)
+        value_check = compiler.build(kind, facets)
+    coerce = _coerce(kind)
+    name = param.name
+    lookup = name.lower() if key == "headers" else name
+    path = "{0}.{1}".format(key, name)
+    required = bool(getattr(param, "required", False))
+    repeat = getattr(param, "repeat", None)
+
+    def check(values, errors):
+        value = values.get(lookup, _MISSING)
+        if value is _MISSING or value is None:
+            if required:
+                errors.append(InvalidParameterError(
+                    "{0}: required parameter is missing".format(path),
+                    name))
+            return
+        if isinstance(value, (list, tuple)):
+            if repeat is False and len(value) > 1:
+                errors.append(InvalidParameterError(
+                    "{0}: parameter can not be repeated, but got: "
+                    "{1!r}".format(path, value), name))
+                return
+            items = value
+        else:
+            items = (value,)
+        errs = []
+        for item in items:
+            if coerce is not None:
+                item = coerce(item)
+            value_check(item, path, errs)
+        for e in errs:
+            errors.append(InvalidParameterError(e.args[0], name))
+    return check
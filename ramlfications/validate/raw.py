@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+
+from __future__ import absolute_import, division, print_function
+
+import attr
+from six import iteritems, string_types
+
+from ramlfications.errors import (
+    InvalidRAMLStructureError, UnknownDataTypeError
+)
+from ramlfications.models import (
+    RAML_VERSION_LOOKUP, ResourceNode, ResourceTypeNode, SecuritySchemeNode
+)
+from ramlfications.models.data_types import (
+    RAML_DATA_TYPES, STANDARD_RAML_TYPES
+)
+from ramlfications.models.parameters import (
+    Body, Header, Response, URIParameter, parameter_class
+)
+from ramlfications.parser.parameters import ParameterParser, ResponseParser
+from ramlfications.parser.parser import (
+    DataTypeParser, ResourceParser, ResourceTypeParser, RootParser,
+    SecuritySchemeParser, TraitParser, parsers
+)
+from ramlfications.parser.pipeline import _check_version
+from ramlfications.utils import load_schema
+from ramlfications.utils.common import _get
+
+from .decorators import collecterrors, error_list
+from .utils import FORM_MIME_TYPES, get_context
+
+
+__all__ = ["validate_raw"]
+
+
+#####
+# Checking nodes without building them
+#####
+class _Stub(object):
+    """
+    Stands in for a node or parameter: holds the values its validators
+    read, without building the node.
+    """
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+_VALIDATORS = {}
+
+
+def _validators(cls):
+    """
+    Fields of ``cls`` checked by the validators of this package when an
+    instance is built, in order.
+    """
+    fields = _VALIDATORS.get(cls)
+    if fields is None:
+        fields = [f for f in attr.fields(cls) if f.init and getattr(
+            f.validator, "__module__", None) == collecterrors.__module__]
+        _VALIDATORS[cls] = fields
+    return fields
+
+
+def _check(cls, node):
+    """Run the validators of ``cls`` on ``node``, a :py:class:`_Stub`."""
+    for field in _validators(cls):
+        field.validator(node, field, getattr(node, field.name))
+
+
+def _check_examples(raml_version, data):
+    """
+    Raises like :py:func:`.utils.examples.parse_examples`, without
+    building the examples.
+    """
+    if raml_version == "0.8":
+        return
+    data = data or {}
+    if "examples" in data:
+        if "example" in data:
+            raise InvalidRAMLStructureError(
+                "example and examples cannot co-exist")
+        if not isinstance(data["examples"], dict):
+            raise InvalidRAMLStructureError("examples must be a map node")
+
+
+def _check_type(name, raw, root, declared):
+    """
+    Checks a data type like :py:func:`.utils.types.parse_type` builds
+    it.  ``declared`` maps the names of the data types checked so far
+    to their class.
+    """
+    declared_type = raw.get("type", "string")
+    if isinstance(declared_type, list):
+        declared_type = declared_type[0]
+    data_type_cls = RAML_DATA_TYPES.get(declared_type) or \
+        declared.get(declared_type)
+    if data_type_cls is None:
+        msg = ("'{0}' is not a supported or defined RAML Data "
+               "Type.".format(declared_type))
+        raise UnknownDataTypeError(msg)
+    declared.setdefault(name, data_type_cls)
+
+    if declared_type not in STANDARD_RAML_TYPES:
+        inherited = raw.get("type")
+        if not isinstance(inherited, list):
+            inherited = [inherited]
+        raw_types = root.raw.get("types", {})
+        for t in inherited:
+            # facets of ``raw`` win over inherited ones
+            merged = dict(raw_types.get(t) or {})
+            merged.update(raw)
+            raw = merged
+
+    _check_examples(root.raml_version, raw)
+    node = _Stub(
+        raw=raw,
+        errors=root.errors,
+        schema=raw.get("schema"),
+        discriminator_value=raw.get("discriminatorValue"),
+    )
+    _check(data_type_cls, node)
+
+
+#####
+# Parsers checking instead of building
+#####
+#: Facets of named parameters checked against their type
+_FACETS = (
+    ("min_length", "minLength"),
+    ("max_length", "maxLength"),
+    ("minimum", "minimum"),
+    ("maximum", "maximum"),
+    ("enum", "enum"),
+    ("pattern", "pattern"),
+)
+
+
+class _RawParameterMixin(object):
+    def create_base_param_obj(self, attribute_data, param_obj,
+                              config, errors, root, **kw):
+        if root is None:
+            raml_version = self.kwargs['data']._raml_version
+        else:
+            raml_version = root.raml_version
+        param_cls = parameter_class(param_obj, raml_version)
+        is_header = param_obj is Header
+
+        params = []
+        for key, value in list(iteritems(attribute_data)):
+            param = _Stub(
+                name=key,
+                type=_get(value, "type", "string"),
+                required=_get(value, "required",
+                              default=param_obj is URIParameter),
+                config=config,
+                errors=errors,
+            )
+            facets = False
+            for facet, raml_facet in _FACETS:
+                facet_value = _get(value, raml_facet)
+                setattr(param, facet, facet_value)
+                facets = facets or facet_value is not None
+            if raml_version != "0.8" or not isinstance(value, list):
+                _check_examples(raml_version, value)
+            # without facets, only the type of headers is checked
+            if facets or is_header:
+                _check(param_cls, param)
+            params.append(param)
+        return params or None
+
+    def parse_body(self, mime_type, data, root, method):
+        kwargs = dict(
+            data=data,
+            method=method,
+            root=root,
+            errs=root.errors,
+            conf=root.config
+        )
+        form_params = _RawParameterParser("formParameters", kwargs).parse()
+        schema = _get(data, "schema")
+        example = _get(data, "example")
+        if mime_type in FORM_MIME_TYPES:
+            # the only bodies whose schema and example are checked
+            schema = load_schema(schema)
+            example = load_schema(example)
+        body = _Stub(
+            mime_type=mime_type,
+            schema=schema,
+            example=example,
+            form_params=form_params,
+            config=root.config,
+            errors=root.errors
+        )
+        _check(Body, body)
+        return body
+
+
+class _RawParameterParser(_RawParameterMixin, ParameterParser):
+    def parse_responses(self, resolved):
+        method = _get(self.kwargs, "method")
+        return [_RawResponseParser(k, v, method, self.root).parse()
+                for k, v in list(iteritems(resolved))] or None
+
+
+class _RawResponseParser(_RawParameterMixin, ResponseParser):
+    def parse_response_body(self):
+        body = _get(self.data, "body", default={})
+        media_types = get_context(self.root.config).media_types
+        no_mime_body_data = {}
+        for key, spec in list(iteritems(body)):
+            if not media_types.supports(key):
+                if key in ('schema', 'example'):
+                    # loaded by ``parse_body`` if checked at all
+                    no_mime_body_data[key] = spec or {}
+            else:
+                self.parse_body(key, spec or body, self.root, self.method)
+        if no_mime_body_data:
+            self.parse_body(self.root.media_type, no_mime_body_data,
+                            self.root, self.method)
+
+    def parse(self):
+        self.parse_response_headers()
+        self.parse_response_body()
+        code = self.code
+        if isinstance(code, string_types):
+            try:
+                code = int(code)
+            except ValueError:
+                # reported by ``response_code``
+                pass
+        response = _Stub(code=code, config=self.root.config,
+                         errors=self.root.errors)
+        _check(Response, response)
+        return response
+
+
+class _RawParamsMixin(object):
+    def create_param_objects(self, param):
+        param_parser = _RawParameterParser(param, self.kw, self.resolve_from)
+        return param_parser.parse()
+
+
+class _RawNodeMixin(_RawParamsMixin):
+    #: Parameters of a node, in the order they are parsed
+    PARAMETERS = (
+        "headers", "body", "responses", "uriParameters",
+        "baseUriParameters", "queryParameters", "formParameters",
+    )
+
+    def create_node_dict(self):
+        # only what the validators read
+        for param in self.PARAMETERS:
+            self.create_param_objects(param)
+        return {
+            "name": self.name,
+            "root": self.root,
+            "errors": self.root.errors,
+        }
+
+
+class _RawRootParser(_RawParamsMixin, RootParser):
+    def create_node(self):
+        self.kw["data"] = self.data
+        self.kw["uri"] = self.uri
+        self.kw["method"] = None
+        self.kw["errs"] = self.errors
+        self.kw["conf"] = self.config
+
+        self.base = self.create_param_objects("baseUriParameters")
+        self.kw["base"] = self.base
+
+        root = _Stub(
+            raml_obj=self.data,
+            raw=self.data,
+            raml_version=self.data._raml_version,
+            title=self.data.get("title", ""),
+            version=self.data.get("version"),
+            protocols=self.protocols(),
+            base_uri=self.base_uri(),
+            base_uri_params=self.base,
+            uri_params=self.create_param_objects("uriParameters"),
+            media_type=self.media_type(),
+            documentation=self.docs(),
+            schemas=self.data.get("schemas"),
+            secured_by=self.data.get("securedBy"),
+            config=self.config,
+            errors=self.errors,
+        )
+        # fragments are not APIs: their root has no title, baseUri, etc.
+        if self.data._raml_fragment_type == "Root":
+            _check(RAML_VERSION_LOOKUP[root.raml_version], root)
+        return root
+
+
+class _RawDataTypeParser(DataTypeParser):
+    def __init__(self, data, root, config):
+        super(_RawDataTypeParser, self).__init__(data, root, config)
+        self.declared = {}
+
+    def create_node(self, name, raw):
+        if not isinstance(raw, dict):
+            raw = dict(type=raw)
+        _check_type(name, raw, self.root, self.declared)
+
+
+class _RawSecuritySchemeParser(_RawNodeMixin, SecuritySchemeParser):
+    def create_node(self):
+        self.kw["data"] = self.data
+        self.kw["method"] = self.method
+        self.kw["root"] = self.root
+
+        node = _Stub(settings=self.data.get("settings"),
+                     **self.create_node_dict())
+        _check(SecuritySchemeNode, node)
+        described_by = self.data.get("describedBy", {})
+        for obj, node_data in list(iteritems(described_by)):
+            self._set_property(node, obj, node_data)
+        return node
+
+
+class _RawTraitParser(_RawNodeMixin, TraitParser):
+    def create_node(self):
+        self.kw = dict(
+            data=self.data,
+            resource_data=self.data,
+            root=self.root,
+            conf=self.root.config,
+            errs=self.root.errors,
+        )
+        return _Stub(**self.create_node_dict())
+
+
+class _RawResourceTypeParser(_RawNodeMixin, ResourceTypeParser):
+    def create_node(self):
+        self.kw["data"] = self.method_data
+        self.kw["root"] = self.root
+        self.kw["method"] = self.method_()
+        self.kw["resource_data"] = self.data
+
+        self.is__ = self.is_()
+        self.type__ = self.type_()
+        self.kw["is_"] = self.is__
+        self.kw["type_"] = self.type__
+
+        node = _Stub(**self.create_node_dict())
+        node.is_ = self.is_()
+        node.type = self.type_()
+        node.display_name = self.display_name()
+        _check(ResourceTypeNode, node)
+        return node
+
+
+class _RawResourceParser(_RawNodeMixin, ResourceParser):
+    def create_node(self):
+        self.method_data = {}
+        if self.method is not None:
+            self.method_data = self.child_data.get(self.method, {})
+
+        self.path = self.resource_path()
+
+        self.kw["data"] = self.method_data
+        self.kw["root"] = self.root
+        self.kw["method"] = self.method
+        self.kw["parent_data"] = getattr(self.parent, "raw", {})
+        self.kw["resource_path"] = self.path
+        self.kw["resource_data"] = self.child_data
+
+        self.is__ = self.is_()
+        self.type__ = self.type_()
+        self.kw["is_"] = self.is__
+        self.kw["type_"] = self.type__
+
+        node = _Stub(**self.create_node_dict())
+        node.raw = self.child_data
+        node.path = self.path
+        node.method = self.method
+        node.display_name = self.display_name()
+        node.is_ = self.is__
+        node.type = self.type__
+        _check(ResourceNode, node)
+        return node
+
+
+#: Checking counterparts of :py:data:`.parser.parser.parsers`, in order
+_RAW_PARSERS = {
+    DataTypeParser: _RawDataTypeParser,
+    SecuritySchemeParser: _RawSecuritySchemeParser,
+    TraitParser: _RawTraitParser,
+    ResourceTypeParser: _RawResourceTypeParser,
+}
+
+
+def validate_raw(loaded_raml, config, guard=None, fail_fast=None):
+    """
+    Validate loaded RAML without parsing it into nodes.
+
+    Walks the loaded RAML the way :py:func:`.parser.parse_raml` does,
+    resolving what resources inherit from their resource types, traits,
+    parents and the root, and runs the same validators on the values
+    the nodes would be built from; no nodes, parameters, examples or
+    request validators are built.  The errors are those a parse would
+    raise, in the same order.
+
+    :param RAMLDict loaded_raml: OrderedDict of loaded RAML file
+    :param dict config: parser configuration
+    :param LimitGuard guard: enforces the limits on parsing, see \
+        :py:func:`.parser.parse_raml`
+    :param fail_fast: abort at the first error if ``True``, or at that \
+        many errors if a number, raising \
+        :py:class:`.errors.InvalidRAMLError` with them
+    :returns: list of validation errors, empty if the RAML is valid
+    :raises: :py:class:`.errors.InvalidVersionError` if the RAML \
+        version is not allowed in ``config``
+    :raises: :py:class:`.errors.LimitExceededError` when a limit is exceeded
+    """
+    _check_version(loaded_raml, config)
+    root_parser = _RawRootParser(loaded_raml, config)
+    root_parser.errors = error_list(fail_fast)
+    root = root_parser.create_node()
+    if loaded_raml._raml_fragment_type != "Root":
+        # like a parse, don't report the errors of fragments
+        _check_type(None, loaded_raml, root, {})
+        return []
+
+    for parser in parsers:
+        _RAW_PARSERS[parser](loaded_raml, root, config).create_nodes()
+
+    resource_parser = _RawResourceParser(loaded_raml, root, config, guard)
+    resources = 0
+    for _ in resource_parser.iter_nodes():
+        resources += 1
+    root_cls = RAML_VERSION_LOOKUP[loaded_raml._raml_version]
+    field = attr.fields(root_cls).resources
+    field.validator(root, field, resources)
+    return list(root.errors)
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function
 from ramlfications.errors import *  # NOQA
 
 from .decorators import collecterrors
-from .utils import validate_mime_type
+from .utils import get_context
 
 
 @collecterrors
@@ -63,8 +63,9 @@ def root_protocols(inst, attr, value):
     Only support HTTP/S plus what is defined in user-config
     """
     if value:
+        protocols = get_context(inst.config).protocols
         for p in value:
-            if p.upper() not in inst.config.get("protocols"):
+            if p.upper() not in protocols:
                 msg = ("'{0}' not a valid protocol for a RAML-defined "
                        "API.".format(p))
                 raise InvalidRootNodeError(msg)
@@ -107,11 +108,9 @@ def root_media_type(inst, attr, value):
     """
     Only support media types based on config and regex
     """
-    if value:
-        match = validate_mime_type(value)
-        if value not in inst.config.get("media_types") and not match:
-            msg = "Unsupported MIME Media Type: '{0}'.".format(value)
-            raise InvalidRootNodeError(msg)
+    if value and not get_context(inst.config).supported_media_type(value):
+        msg = "Unsupported MIME Media Type: '{0}'.".format(value)
+        raise InvalidRootNodeError(msg)
 
 
 @collecterrors
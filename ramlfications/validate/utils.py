@@ -4,12 +4,131 @@
 from __future__ import absolute_import, division, print_function
 
 import re
+import weakref
+
+from six import iterkeys
+
+from ramlfications.mime_types import MediaTypeRegistry
+from ramlfications.utils.common import OrderedDict
+
+
+#: MIME media types of bodies that must define ``formParameters``
+FORM_MIME_TYPES = frozenset([
+    "multipart/form-data", "application/x-www-form-urlencoded"
+])
+
+MIME_TYPE_RE = re.compile(r"application\/[A-Za-z.-0-1]*?(json|xml)")
 
 
 def validate_mime_type(value):
     """
     Assert a valid MIME media type for request/response body.
     """
-    regex_str = re.compile(r"application\/[A-Za-z.-0-1]*?(json|xml)")
-    match = re.search(regex_str, value)
-    return match
+    return MIME_TYPE_RE.search(value)
+
+
+class ValidationContext(object):
+    """
+    Lookup tables derived from a parser configuration, built once and
+    shared by every validator run against a configuration with the same
+    lookup lists.
+
+    :param dict config: parser configuration, see \
+        :py:func:`ramlfications.config.setup_config`
+    """
+    def __init__(self, config):
+        self.media_types = MediaTypeRegistry(config.get("media_types") or [])
+        self.resp_codes = frozenset(config.get("resp_codes") or [])
+        self.prim_types = frozenset(config.get("prim_types") or [])
+        self.protocols = frozenset(config.get("protocols") or [])
+
+    def supported_media_type(self, value):
+        """
+        Known to the config (including ``+json``/``+xml`` structured
+        suffixes), or a JSON/XML ``application`` type.
+        """
+        return self.media_types.supports(value) or \
+            bool(validate_mime_type(value))
+
+
+#: Lookup lists of a configuration a :py:class:`ValidationContext` is
+#: built from
+_LOOKUPS = ("media_types", "resp_codes", "prim_types", "protocols")
+
+# Contexts keyed by the contents of their lookup lists, so that the
+# configurations of different parses, e.g. each made by ``setup_config``,
+# share one; the 8 shared most recently are kept.
+_CONTEXTS = OrderedDict()
+# Contexts of the 8 configurations looked up last, keyed by
+# ``id(config)``: configuration dicts can not be weakly referenced, so
+# each entry holds its configuration, which keeps the id from being
+# reused while it is kept.
+_CONFIGS = OrderedDict()
+_MAX_CONTEXTS = 8
+
+
+def _sources(config):
+    return tuple(id(config.get(k)) for k in _LOOKUPS)
+
+
+def _contents(config):
+    return tuple(tuple(config.get(k) or ()) for k in _LOOKUPS)
+
+
+def _keep(cache, key, value):
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _MAX_CONTEXTS:
+        cache.popitem(last=False)
+
+
+def get_context(config):
+    """
+    Return the :py:class:`ValidationContext` for ``config``, building it
+    when no configuration with the same lookup lists was used recently.
+    """
+    sources = _sources(config)
+    cached = _CONFIGS.get(id(config))
+    if cached is not None and cached[0] is config and \
+            cached[1] == sources:
+        _CONFIGS.move_to_end(id(config))
+        return cached[2]
+    contents = _contents(config)
+    context = _CONTEXTS.get(contents)
+    if context is None:
+        context = ValidationContext(config)
+    _keep(_CONTEXTS, contents, context)
+    _keep(_CONFIGS, id(config), (config, sources, context))
+    return context
+
+
+# Names declared in the root of a RAML file, keyed by ``(id(raw), key)``
+# and dropped along with the loaded RAML they were computed from.
+_NAMES = {}
+
+
+def _declared(raw, key):
+    items = raw.get(key) or {}
+    if isinstance(items, dict):
+        # RAML 1.0 uses a map
+        return frozenset(iterkeys(items))
+    return frozenset(list(iterkeys(i))[0] for i in items)
+
+
+def declared_names(raw, key):
+    """
+    Return the names of the traits/resource types/etc. (``key``) declared
+    in the root of the loaded RAML ``raw``, computed once per document.
+    """
+    cache_key = (id(raw), key)
+    cached = _NAMES.get(cache_key)
+    if cached is not None and cached[0]() is raw:
+        return cached[1]
+    names = _declared(raw, key)
+    try:
+        ref = weakref.ref(raw, lambda _, k=cache_key: _NAMES.pop(k, None))
+    except TypeError:
+        # plain dicts can not be weakly referenced; don't cache
+        return names
+    _NAMES[cache_key] = (ref, names)
+    return names
@@ -113,10 +113,11 @@ setup(
         "Programming Language :: Python :: Implementation :: PyPy",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    package_data={"": ["data/supported_mime_types.json"]},
+    package_data={"": ["data/supported_mime_types.txt"]},
     install_requires=install_requires(),
     extras_require={
-        "all": ["requests[security]"]
+        "all": ["requests[security]", "numpy"],
+        "numpy": ["numpy"],
     },
     tests_require=[
         "pytest", "mock", "pytest-mock", "pytest-localserver"
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import gc
+import math
+import time
+import tracemalloc
+
+import attr
+import pytest
+
+from benchmarks.generate import generate
+from benchmarks.suite import config
+from ramlfications.parser import ParsePipeline
+from ramlfications.parser.parser import (
+    DataTypeParser, ResourceParser, ResourceTypeParser, TraitParser, parsers
+)
+from ramlfications.utils import load_file
+
+
+#: Spec sizes, as multiples of a component's base size
+FACTORS = (1, 4, 16)
+
+#: Slack on the growth exponent allowed for noise in the timings
+TOLERANCE = 0.2
+
+#: component, the axis grown, its base size, and the other axes
+COMPONENTS = [
+    (ResourceParser, "resources", 3, {}),
+    # looking up the traits each method is marked with
+    (ResourceParser, "traits", 10, {"resources": 1, "trait_params": 1}),
+    # parameter resolution: the query parameters of those traits
+    (ResourceParser, "trait_params", 8, {"resources": 2}),
+    (TraitParser, "traits", 8, {"resources": 1}),
+    (ResourceTypeParser, "resource_types", 4, {"resources": 1}),
+    (DataTypeParser, "data_types", 8, {"resources": 1}),
+]
+
+
+def _run_component(raml_file, parser):
+    """
+    Return a function running ``parser`` on freshly loaded ``raml_file``,
+    after what it depends on; parsers modify the loaded RAML.
+    """
+    conf = config()
+    loaded = load_file(raml_file)
+    pipeline = ParsePipeline(loaded, conf)
+    if parser is ResourceParser:
+        root = pipeline.stage("components")
+        return lambda: list(ResourceParser(loaded, root, conf).iter_nodes())
+
+    root = pipeline.stage("root")
+    attr.set_run_validators(True)
+    for other in parsers:
+        if other is parser:
+            break
+        setattr(root, other.root_property,
+                other(loaded, root, conf).create_nodes())
+    return lambda: parser(loaded, root, conf).create_nodes()
+
+
+def _seconds(raml_file, parser, repeat=3):
+    times = []
+    for _ in range(repeat):
+        run = _run_component(raml_file, parser)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _peak_bytes(raml_file, parser):
+    run = _run_component(raml_file, parser)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def growth_exponent(sizes, values):
+    """Slope of the least squares fit of ``values`` to ``sizes``, log-log."""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(v) for v in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) /
+            sum((x - mean_x) ** 2 for x in xs))
+
+
+def n_log_n_exponent(sizes):
+    """Growth exponent of ``n log n`` over ``sizes``."""
+    return growth_exponent(sizes, [s * math.log(s + 1) for s in sizes])
+
+
+def test_growth_exponent():
+    sizes = [10, 40, 160]
+    assert growth_exponent(sizes, [3 * s for s in sizes]) == \
+        pytest.approx(1)
+    assert growth_exponent(sizes, [s ** 2 for s in sizes]) == \
+        pytest.approx(2)
+    assert 1 < n_log_n_exponent(sizes) < 1.3
+
+
+@pytest.fixture(params=COMPONENTS,
+                ids=["{0}-{1}".format(c[0].__name__, c[1])
+                     for c in COMPONENTS])
+def scaled_specs(request, tmpdir):
+    parser, axis, base, scale = request.param
+    sizes = [base * f for f in FACTORS]
+    raml_files = []
+    for size in sizes:
+        directory = tmpdir.mkdir("{0}-{1}".format(axis, size))
+        raml_files.append(
+            generate(str(directory), **dict(scale, **{axis: size})))
+    return parser, sizes, raml_files
+
+
+@pytest.mark.timing
+def test_time_scaling(scaled_specs):
+    parser, sizes, raml_files = scaled_specs
+    seconds = [_seconds(f, parser) for f in raml_files]
+    exponent = growth_exponent(sizes, seconds)
+    assert exponent <= n_log_n_exponent(sizes) + TOLERANCE, seconds
+
+
+def test_memory_scaling(scaled_specs):
+    parser, sizes, raml_files = scaled_specs
+    peaks = [_peak_bytes(f, parser) for f in raml_files]
+    exponent = growth_exponent(sizes, peaks)
+    assert exponent <= n_log_n_exponent(sizes) + TOLERANCE, peaks
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+
+import pytest
+
+from ramlfications import parser as pw
+from ramlfications import tree
+from ramlfications.config import setup_config
+from ramlfications.limits import Limits
+from ramlfications.utils import load_file
+from ramlfications.utils.common import OrderedDict
+
+from tests.base import RAML_08
+
+
+def deep_raml(depth):
+    """
+    Loaded RAML of ``depth`` nested resources with a method each.  Built
+    directly: PyYAML composes nested mappings recursively, so it can not
+    load such a file.
+    """
+    loaded = OrderedDict([("title", "Deep API"),
+                          ("baseUri", "http://example.com")])
+    loaded._raml_version = "0.8"
+    loaded._raml_fragment_type = "Root"
+    data = loaded
+    for level in range(depth):
+        child = OrderedDict([("get", None)])
+        data["/r"] = child
+        data = child
+    return loaded
+
+
+def parse_deep(depth):
+    return pw.parse_raml(deep_raml(depth), setup_config())
+
+
+def test_depth():
+    raml_file = os.path.join(RAML_08, "simple-tree.raml")
+    config = setup_config(os.path.join(RAML_08, "test-config.ini"))
+    root = pw.parse_raml(load_file(raml_file), config)
+    for resource in root.resources:
+        if resource.parent is None:
+            assert resource.depth == 1
+        else:
+            assert resource.depth == resource.parent.depth + 1
+    assert max(r.depth for r in root.resources) > 1
+
+
+def test_default_limits():
+    config = setup_config()
+    assert config["limits"] == Limits()
+    root = pw.parse_raml(deep_raml(250), config)
+    assert root.resources[-1].depth == 250
+
+
+def test_deep_resources():
+    root = parse_deep(10000)
+    assert len(root.resources) == 10000
+    resource = root.resources[-1]
+    assert resource.depth == 10000
+    assert resource.path == "/r" * 10000
+    assert resource.parent.depth == 9999
+    assert resource.parent.path == "/r" * 9999
+    assert tree._create_space(resource) == "  " * 9999
+
+
+@pytest.mark.timing
+def test_deep_resources_time():
+    def timed(depth):
+        start = time.time()
+        parse_deep(depth)
+        return time.time() - start
+
+    timed(100)  # warm up
+    small = timed(2500)
+    large = timed(10000)
+    # 4 times as deep: 16 times as slow if quadratic
+    assert large < small * 8
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications.config import setup_config
+from ramlfications.errors import InvalidRAMLError
+from ramlfications.parser import parse_raml
+from ramlfications.parser.incremental import IncrementalParser
+from ramlfications.utils import load_file
+
+from tests.base import RAML_08
+
+
+RAML_FILE = os.path.join(RAML_08, "incremental.raml")
+
+
+def _load():
+    # parsing alters the loaded data, so every version is loaded afresh
+    return load_file(RAML_FILE)
+
+
+def _resources(root):
+    return dict(((r.path, r.method), r) for r in root.resources)
+
+
+@pytest.fixture
+def parser():
+    return IncrementalParser(setup_config(None))
+
+
+def test_parse_matches_parse_raml(parser):
+    root = parser.parse(_load())
+    expected = parse_raml(_load(), parser.config)
+    assert repr(root.resources) == repr(expected.resources)
+    assert repr(root.traits) == repr(expected.traits)
+    assert repr(root.resource_types) == repr(expected.resource_types)
+    for resource, other in zip(root.resources, expected.resources):
+        assert resource.absolute_uri == other.absolute_uri
+        assert resource.query_params == other.query_params
+    assert parser.rebuilt == {
+        "traits": ["paged", "filterable"],
+        "resourceTypes": ["collection"],
+        "resources": ["/books", "/authors", "/stores", "/status"],
+    }
+
+
+#: Fields of resource nodes compared with those of a full parse
+RESOURCE_FIELDS = (
+    "path", "method", "display_name", "description", "absolute_uri",
+    "headers", "body", "responses", "uri_params", "base_uri_params",
+    "query_params", "form_params", "is_", "type", "secured_by",
+)
+
+
+@pytest.mark.parametrize("name", ["github", "twitter"])
+def test_parse_matches_parse_raml_large(name):
+    raml_file = os.path.join(RAML_08, name + ".raml")
+    config = setup_config(os.path.join(RAML_08, name + "-config.ini"))
+    root = IncrementalParser(config).parse(load_file(raml_file))
+    expected = parse_raml(load_file(raml_file), config)
+    assert len(root.resources) == len(expected.resources)
+    for resource, other in zip(root.resources, expected.resources):
+        for field in RESOURCE_FIELDS:
+            assert repr(getattr(resource, field)) == \
+                repr(getattr(other, field)), (resource.path, field)
+
+
+def test_update_unchanged(parser):
+    first = _resources(parser.parse(_load()))
+    root = parser.update(_load())
+    assert parser.rebuilt == {}
+    for key, resource in _resources(root).items():
+        assert resource is first[key]
+        assert resource.root is root
+
+
+def test_update_resource(parser):
+    first = _resources(parser.parse(_load()))
+    data = _load()
+    data["/status"]["get"]["description"] = "Get the status"
+    root = parser.update(data)
+
+    assert parser.rebuilt == {"resources": ["/status"]}
+    status = root.resources.filter_by(path="/status").one()
+    assert status.description.raw == "Get the status"
+    for key, resource in _resources(root).items():
+        if key[0] != "/status":
+            assert resource is first[key]
+
+
+def test_update_trait_rebuilds_users(parser):
+    first = _resources(parser.parse(_load()))
+    data = _load()
+    data["traits"][0]["paged"]["queryParameters"]["page"]["minimum"] = 2
+    root = parser.update(data)
+
+    assert parser.rebuilt == {"traits": ["paged"], "resources": ["/books"]}
+    books = root.resources.filter_by(path="/books", method="get").one()
+    assert books is not first[("/books", "get")]
+    assert books.query_params[0].minimum == 2
+    assert books.traits[0] is root.traits.filter_by(name="paged").one()
+    # nested resources are rebuilt along with their top-level resource
+    book = root.resources.filter_by(path="/books/{bookId}").one()
+    assert book.parent is books
+    assert root.traits.filter_by(name="filterable").one() is \
+        _resources(root)[("/stores", "get")].traits[0]
+
+
+def test_update_resource_type(parser):
+    parser.parse(_load())
+    data = _load()
+    data["resourceTypes"][0]["collection"]["description"] = "Some <<resourcePathName>>"  # NOQA
+    root = parser.update(data)
+
+    assert parser.rebuilt == {
+        "resourceTypes": ["collection"], "resources": ["/authors"]
+    }
+    authors = root.resources.filter_by(path="/authors", method="get").one()
+    assert authors.resource_type is root.resource_types[0]
+
+
+def test_update_root_reparses_all(parser):
+    first = _resources(parser.parse(_load()))
+    data = _load()
+    data["baseUri"] = "https://api.example.org/{version}"
+    root = parser.update(data)
+
+    assert sorted(parser.rebuilt) == ["resourceTypes", "resources", "traits"]
+    for key, resource in _resources(root).items():
+        assert resource is not first[key]
+        assert resource.absolute_uri.startswith("https://api.example.org/v1")
+
+
+def test_update_keeps_errors_of_reused_resources(parser):
+    data = _load()
+    data["/status"]["get"]["responses"] = {999: {"description": "Oops"}}
+    with pytest.raises(InvalidRAMLError) as e:
+        parser.parse(data)
+    assert len(e.value.errors) == 1
+
+    data = _load()
+    data["/status"]["get"]["responses"] = {999: {"description": "Oops"}}
+    data["/stores"]["get"]["description"] = "Find stores"
+    with pytest.raises(InvalidRAMLError) as e:
+        parser.update(data)
+    assert parser.rebuilt == {"resources": ["/stores"]}
+    msg = "'999' not a valid HTTP response code."
+    assert [str(err) for err in e.value.errors] == [msg]
+
+    # fixing the resource clears the error
+    parser.update(_load())
+    assert parser.root.errors == []
+
+
+def test_update_files(tmpdir):
+    tmpdir.join("api.raml").write(
+        "#%RAML 0.8\n"
+        "title: Example API\n"
+        "baseUri: https://api.example.com\n"
+        "traits:\n"
+        "  - paged: !include paged.yaml\n"
+        "/books:\n"
+        "  get:\n"
+        "    is: [ paged ]\n"
+        "/status: !include status.yaml\n"
+        "/stores:\n"
+        "  get:\n")
+    paged = tmpdir.join("paged.yaml")
+    paged.write("queryParameters:\n  page:\n    type: integer\n")
+    tmpdir.join("status.yaml").write("get:\n  description: Status\n")
+    unrelated = tmpdir.join("unrelated.yaml")
+    unrelated.write("foo: bar\n")
+
+    parser = IncrementalParser(setup_config(None))
+    root = parser.parse(load_file(str(tmpdir.join("api.raml"))))
+    first = _resources(root)
+
+    assert parser.update_files([str(unrelated)]) is root
+    assert parser.rebuilt == {}
+
+    paged.write("queryParameters:\n  page:\n    type: string\n")
+    root = parser.update_files([str(paged)])
+    assert parser.rebuilt == {"traits": ["paged"], "resources": ["/books"]}
+    books = root.resources.filter_by(path="/books").one()
+    assert books.query_params[0].type == "string"
+    assert _resources(root)[("/status", "get")] is first[("/status", "get")]
@@ -2,4 +2,74 @@
 # Copyright (c) 2016 Spotify AB
 from __future__ import absolute_import, division, print_function
 
-# TODO
+import gc
+import os
+import weakref
+
+import pytest
+
+import ramlfications
+from ramlfications.config import setup_config
+from ramlfications.errors import InvalidRAMLError, InvalidVersionError
+from ramlfications.parser import iter_resources, parse_raml
+from ramlfications.utils import load_file
+
+from tests.base import RAML_08, VALIDATE_08
+
+
+@pytest.fixture(scope="session")
+def config():
+    return setup_config(os.path.join(RAML_08, "test-config.ini"))
+
+
+def test_iter_resources(config):
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    expected = parse_raml(load_file(raml_file), config)
+    resources = list(iter_resources(load_file(raml_file), config))
+
+    assert repr(resources) == repr(list(expected.resources))
+    root = resources[0].root
+    assert root.resources is None
+    assert root.title == expected.title
+    assert repr(root.traits) == repr(expected.traits)
+    for resource, other in zip(resources, expected.resources):
+        assert resource.root is root
+        assert resource.depth == other.depth
+        assert resource.absolute_uri == other.absolute_uri
+        assert repr(resource.query_params) == repr(other.query_params)
+        if other.parent is None:
+            assert resource.parent is None
+        else:
+            assert resource.parent.path == other.parent.path
+
+
+def test_iter_resources_lazily(config):
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    resources = iter_resources(load_file(raml_file), config)
+    ref = weakref.ref(next(resources))
+    # the rest of the first resource's subtree, then the next resource
+    node = next(resources)
+    while node.depth > 1:
+        node = next(resources)
+    gc.collect()
+    # neither the generator nor the next nodes keep it alive
+    assert ref() is None
+    assert len(list(resources)) > 1
+
+
+def test_iter_resources_helper():
+    raml_file = os.path.join(RAML_08, "simple-tree.raml")
+    paths = [r.path for r in ramlfications.iter_resources(raml_file)]
+    assert paths == [r.path for r in ramlfications.parse(raml_file).resources]
+
+
+def test_iter_resources_invalid(config):
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    config = dict(config, validate=True)
+    resources = iter_resources(load_file(raml_file), config)
+    with pytest.raises(InvalidRAMLError):
+        next(resources)
+
+    config = dict(config, raml_versions=["1.0"])
+    with pytest.raises(InvalidVersionError):
+        iter_resources(load_file(raml_file), config)
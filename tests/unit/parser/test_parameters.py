@@ -33,3 +33,26 @@ def test_create_response(api):
 #####
 # TODO: COMPLETE ME
 #####
+
+
+def test_structured_suffix_response_body(tmpdir):
+    # ``+json`` and ``+xml`` types are bodies, not unknown keys
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(
+        "#%RAML 0.8\n"
+        "title: Suffixes\n"
+        "baseUri: https://api.example.com\n"
+        "/widgets:\n"
+        "  get:\n"
+        "    responses:\n"
+        "      200:\n"
+        "        body:\n"
+        "          application/vnd.example.v3+json:\n"
+        "            example: '{\"id\": 1}'\n"
+        "          application/vnd.example+xml:\n"
+        "          application/vnd.example+zip:\n")
+    api = parse(str(raml_file), os.path.join(RAML_08, "test_config.ini"))
+    body = api.resources[0].responses[0].body
+    assert [b.mime_type for b in body] == [
+        "application/vnd.example.v3+json", "application/vnd.example+xml"]
+    assert body[0].example == {"id": 1}
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import gc
+import os
+import pickle
+import weakref
+
+import pytest
+
+from ramlfications.compiled import dumps_compiled, loads_compiled
+from ramlfications.config import setup_config
+from ramlfications.errors import InvalidRAMLError, InvalidRootNodeError
+from ramlfications.parser import ParsePipeline, parse_raml
+from ramlfications.parser import pipeline as pipeline_module
+from ramlfications.utils import load_file, load_string
+
+from tests.base import RAML_08, VALIDATE_08
+
+
+@pytest.fixture(scope="session")
+def config():
+    return setup_config(os.path.join(RAML_08, "test-config.ini"))
+
+
+@pytest.fixture
+def raml_file():
+    return os.path.join(RAML_08, "complete-valid-example.raml")
+
+
+def test_run(config, raml_file):
+    ran = []
+    pipeline = ParsePipeline(raml_file, config,
+                             hook=lambda *args: ran.append(args))
+    root = pipeline.run()
+    expected = parse_raml(load_file(raml_file), config)
+
+    assert repr(list(root.resources)) == repr(list(expected.resources))
+    assert repr(root.traits) == repr(expected.traits)
+    assert list(pipeline.timings) == list(ParsePipeline.STAGES)
+    assert [name for name, _, _ in ran] == list(ParsePipeline.STAGES)
+    assert all(seconds >= 0 for _, _, seconds in ran)
+    assert ran[-1][1] is root
+    assert ran[3][1] is root.resources
+
+
+def test_stages_run_once(config, raml_file, monkeypatch):
+    created = []
+    create_node = pipeline_module.RootParser.create_node
+
+    def counting_create_node(self):
+        created.append(self)
+        return create_node(self)
+    monkeypatch.setattr(pipeline_module.RootParser, "create_node",
+                        counting_create_node)
+
+    pipeline = ParsePipeline(load_file(raml_file), config)
+    root = pipeline.stage("components")
+    assert list(pipeline.timings) == ["load", "root", "components"]
+    assert pipeline.timings["load"] == 0.0
+    assert not hasattr(root, "resources")
+
+    assert pipeline.run() is root
+    assert pipeline.stage("root") is root
+    assert len(created) == 1
+
+
+def test_root_errors_not_duplicated(config):
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    config = dict(config, validate=True)
+    with pytest.raises(InvalidRAMLError) as e:
+        ParsePipeline(raml_file, config).run()
+    root_errors = [err for err in e.value.errors
+                   if isinstance(err, InvalidRootNodeError)]
+    assert len(root_errors) == 2
+    assert len(set(str(err) for err in root_errors)) == 2
+
+
+def test_root_parameters_validated(config):
+    raml = "\n".join([
+        "#%RAML 0.8",
+        "title: Example",
+        "baseUri: https://{domain}.example.com",
+        "baseUriParameters:",
+        "  domain:",
+        "    minimum: 2",
+        "/foo:",
+        "  get:",
+    ])
+    config = dict(config, validate=True)
+    with pytest.raises(InvalidRAMLError) as e:
+        ParsePipeline(load_string(raml), config).run()
+    msg = ("domain must be either a number or integer to have minimum "
+           "attribute set, not 'string'.")
+    assert msg in [str(err) for err in e.value.errors]
+
+
+@pytest.mark.parametrize("fail_fast,count", [(True, 1), (1, 1), (2, 2)])
+def test_fail_fast(config, fail_fast, count, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("parsed on")
+    monkeypatch.setattr(pipeline_module, "ResourceParser", fail)
+
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    config = dict(config, validate=True)
+    with pytest.raises(InvalidRAMLError) as e:
+        parse_raml(load_file(raml_file), config, fail_fast=fail_fast)
+    assert len(e.value.errors) == count
+
+
+def test_keep_raw(config, raml_file):
+    expected = parse_raml(load_file(raml_file), config)
+    root = parse_raml(load_file(raml_file), config, keep_raw=False)
+    assert root.raw is None
+    assert root.raml_obj is None
+
+    assert repr(list(root.resources)) == repr(list(expected.resources))
+    for resource, expected_resource in zip(root.resources,
+                                           expected.resources):
+        assert resource.raw is None
+        for param in resource.query_params or []:
+            assert param.raw is None
+        assert resource.query_params == expected_resource.query_params
+        assert resource.absolute_uri == expected_resource.absolute_uri
+    for node in root.traits + root.resource_types:
+        assert node.raw is None
+
+    resource = root.resources.filter_by(path="/widgets/{id}/gizmos",
+                                        method="get").one()
+    expected_resource = expected.resources.filter_by(
+        path=resource.path).one()
+    request = {"uri": {"id": "1"}, "query": {"limit": "-10"}}
+    errors = resource.validate_request(request)
+    assert errors
+    assert ([str(e) for e in errors] ==
+            [str(e) for e in expected_resource.validate_request(request)])
+
+
+def test_release_raw_shared(config):
+    # released once, though shared by the nodes inheriting it
+    root = ParsePipeline(
+        os.path.join(RAML_08, "resource_types.raml"), config,
+        keep_raw=False).run()
+    assert all(r.raw is None for r in root.resources)
+    pipeline_module.release_raw(root)
+    assert root.raw is None
+
+
+def _freed_without_gc(parse):
+    root = parse()
+    root.resources[-1].validate_request({})
+    ref = weakref.ref(root)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        del root
+        return ref() is None
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def test_weak_refs(config, raml_file):
+    root = ParsePipeline(raml_file, config, weak_refs=True).run()
+    resource = root.resources[-1]
+    assert resource.root is root
+    assert resource.parent.root is root
+    assert all(t.root is root for t in root.traits)
+
+    # weak references are resolved in pickles
+    assert loads_compiled(dumps_compiled(root)).resources[-1].path == \
+        resource.path
+
+    assert _freed_without_gc(
+        lambda: parse_raml(load_file(raml_file), config, weak_refs=True))
+    # as before by default: the root is part of reference cycles
+    assert not _freed_without_gc(
+        lambda: parse_raml(load_file(raml_file), config))
+
+
+def test_weak_refs_freed_root(config, raml_file):
+    root = ParsePipeline(raml_file, config, weak_refs=True).run()
+    resource = root.resources[0]
+    del root
+    gc.collect()
+    with pytest.raises(ReferenceError) as e:
+        resource.root
+    assert "ResourceNode" in str(e.value)
+    pickle.dumps(resource.parent)
+
+
+def test_errors_have_no_traceback():
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    with pytest.raises(InvalidRAMLError) as e:
+        ParsePipeline(raml_file, setup_config()).run()
+    assert all(error.__traceback__ is None for error in e.value.errors)
+
+
+@pytest.mark.parametrize("gc_mode", ["disable", "freeze"])
+def test_gc_mode(config, raml_file, monkeypatch, gc_mode):
+    frozen = []
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+    enabled = []
+    pipeline = ParsePipeline(
+        raml_file, config, gc_mode=gc_mode,
+        hook=lambda *args: enabled.append(gc.isenabled()))
+    assert pipeline.run().title == "Example Web API"
+    assert enabled == [False] * len(ParsePipeline.STAGES)
+    assert gc.isenabled()
+    assert frozen == ([True] if gc_mode == "freeze" else [])
+
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    with pytest.raises(InvalidRAMLError):
+        ParsePipeline(raml_file, setup_config(), gc_mode=gc_mode).run()
+    assert gc.isenabled()
+
+    with pytest.raises(ValueError):
+        ParsePipeline(raml_file, config, gc_mode="off")
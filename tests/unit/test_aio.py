@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+import ramlfications
+from ramlfications import aio
+from ramlfications.errors import (
+    IncludeCountError, InvalidRAMLError, LoadRAMLError
+)
+from ramlfications.limits import Limits
+
+from tests.base import RAML_08, VALIDATE_08
+
+
+CONFIG_FILE = os.path.join(RAML_08, "test-config.ini")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize("raml_file", [
+    "nested-includes.raml",
+    "json_includes.raml",
+    "md_includes.raml",
+    "xsd_includes.raml",
+])
+def test_load(raml_file):
+    raml_file = os.path.join(RAML_08, raml_file)
+    loaded = run(aio.load(raml_file))
+    expected = ramlfications.load(raml_file)
+    assert repr(loaded) == repr(expected)
+    assert loaded._raml_version == expected._raml_version
+    assert loaded._raml_includes == expected._raml_includes
+
+
+def test_load_file_object():
+    raml_file = os.path.join(RAML_08, "nested-includes.raml")
+    with open(raml_file) as f:
+        loaded = run(aio.load(f))
+    assert repr(loaded) == repr(ramlfications.load(raml_file))
+
+
+def test_loads():
+    loaded = run(aio.loads("#%RAML 0.8\ntitle: Foo API\n"))
+    assert loaded == {"title": "Foo API"}
+
+
+def test_load_errors(tmpdir):
+    with pytest.raises(LoadRAMLError):
+        run(aio.load(str(tmpdir.join("missing.raml"))))
+    with pytest.raises(LoadRAMLError):
+        run(aio.load(None))
+
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write("#%RAML 0.8\ntitle: !include missing.yaml\n")
+    with pytest.raises(LoadRAMLError):
+        run(aio.load(str(raml_file)))
+
+
+def test_prefetch():
+    raml_file = os.path.abspath(os.path.join(RAML_08, "json_includes.raml"))
+    files = run(aio._prefetch(raml_file, None))
+    expected = ramlfications.load(raml_file)
+    deps = set(os.path.abspath(f) for deps in
+               expected._raml_includes.values() for f in deps)
+    assert deps.issubset(files)
+    assert raml_file in files
+
+
+def test_parse():
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    root = run(aio.parse(raml_file, CONFIG_FILE))
+    expected = ramlfications.parse(raml_file, CONFIG_FILE)
+    assert root.title == expected.title
+    assert repr(root.resources) == repr(expected.resources)
+
+
+def test_parse_concurrently():
+    raml_files = [os.path.join(RAML_08, f) for f in
+                  ("complete-valid-example.raml", "resources.raml",
+                   "traits.raml")]
+
+    async def parse_all():
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        roots = await asyncio.gather(
+            *[aio.parse(f, CONFIG_FILE) for f in raml_files])
+        ticker.cancel()
+        return roots, ticks
+
+    roots, ticks = run(parse_all())
+    assert [r.title for r in roots] == \
+        [ramlfications.parse(f, CONFIG_FILE).title for f in raml_files]
+    # the event loop kept running while parsing
+    assert len(ticks) > len(raml_files)
+
+
+def test_parse_invalid():
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    with pytest.raises(InvalidRAMLError):
+        run(aio.parse(raml_file))
+
+
+def test_parse_timeout():
+    raml_file = os.path.join(RAML_08, "github.raml")
+    config_file = os.path.join(RAML_08, "github-config.ini")
+    with pytest.raises(asyncio.TimeoutError):
+        run(aio.parse(raml_file, config_file, timeout=0.001))
+
+    raml_file = os.path.join(RAML_08, "resources.raml")
+    root = run(aio.parse(raml_file, CONFIG_FILE, timeout=60))
+    assert root.title == "Example Web API"
+
+
+def test_cancelled_loader():
+    raml_file = os.path.abspath(os.path.join(RAML_08,
+                                             "nested-includes.raml"))
+    files = run(aio._prefetch(raml_file, None))
+    cancelled = threading.Event()
+    cancelled.set()
+    with pytest.raises(LoadRAMLError) as e:
+        aio._load_prefetched(raml_file, files, cancelled=cancelled)
+    assert "cancelled" in str(e.value)
+
+
+def test_limits(tmpdir):
+    tmpdir.join("api.raml").write(
+        "#%RAML 0.8\n" + "".join("k{0}: !include {0}.yaml\n".format(i)
+                                 for i in range(4)))
+    for i in range(4):
+        tmpdir.join("{0}.yaml".format(i)).write("foo: bar\n")
+    raml_file = str(tmpdir.join("api.raml"))
+    # checked while prefetching already
+    with pytest.raises(IncludeCountError):
+        run(aio.load(raml_file, limits=Limits(max_includes=3)))
+    with pytest.raises(IncludeCountError):
+        run(aio.parse(raml_file, limits=Limits(max_includes=3)))
+    assert run(aio._prefetch(raml_file, None, limits=Limits(max_includes=4)))
+
+
+def test_parses_leave_threads_to_io(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    running = []
+    most = []
+    release = threading.Event()
+
+    def parse_job(*args, **kwargs):
+        running.append(None)
+        most.append(len(running))
+        release.wait(5)
+        running.pop()
+        return "parsed"
+    monkeypatch.setattr(aio, "_parse_prefetched", parse_job)
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    async def parse_all():
+        parses = asyncio.gather(*[
+            aio.parse(raml_file, CONFIG_FILE, executor=executor)
+            for _ in range(4)])
+        # all parses are submitted or waiting by then
+        while not running:
+            await asyncio.sleep(0.01)
+        loop = asyncio.get_running_loop()
+        io_done = await asyncio.wait_for(
+            loop.run_in_executor(executor, lambda: "read"), 5)
+        release.set()
+        return io_done, await parses
+
+    try:
+        io_done, roots = run(parse_all())
+    finally:
+        release.set()
+        executor.shutdown()
+    assert io_done == "read"
+    assert roots == ["parsed"] * 4
+    # parse jobs ran in one thread at a time
+    assert max(most) == 1
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+
+import pytest
+
+from ramlfications.batch import IncludeGraph, find_raml_files, validate_files
+
+from tests.base import RAML_08, VALIDATE_08
+
+
+def test_find_raml_files(tmpdir):
+    tmpdir.join("b.raml").write("")
+    tmpdir.join("a.raml").write("")
+    tmpdir.join("notes.txt").write("")
+    tmpdir.mkdir("sub").join("c.raml").write("")
+    root = str(tmpdir)
+    extra = os.path.join(root, "notes.txt")
+
+    found = find_raml_files([extra, root, os.path.join(root, "a.raml")])
+    assert found == [
+        extra,
+        os.path.join(root, "a.raml"),
+        os.path.join(root, "b.raml"),
+        os.path.join(root, "sub", "c.raml"),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_files(jobs):
+    valid_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    invalid_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    # the parser fails on this one with an AssertionError
+    broken_file = os.path.join(VALIDATE_08, "docs-not-list.raml")
+
+    results = validate_files([valid_file, invalid_file, broken_file],
+                             jobs=jobs)
+    results = dict((r.raml_file, r) for r in results)
+    assert len(results) == 3
+    assert results[valid_file].valid
+    assert results[valid_file].errors == []
+    assert results[invalid_file].errors == [
+        ("InvalidRootNodeError", "RAML File does not define the baseUri."),
+        ("InvalidRootNodeError", "RAML File does not define an API title."),
+    ]
+    assert results[broken_file].errors[0][0] == "AssertionError"
+    assert results[invalid_file].to_dict() == {
+        "file": invalid_file,
+        "valid": False,
+        "errors": [
+            {"type": "InvalidRootNodeError",
+             "message": "RAML File does not define the baseUri."},
+            {"type": "InvalidRootNodeError",
+             "message": "RAML File does not define an API title."},
+        ],
+    }
+
+
+def test_validate_files_fail_fast():
+    invalid_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    for fast in (False, True):
+        result, = validate_files([invalid_file], fast=fast, fail_fast=True)
+        assert len(result.errors) == 1
+
+
+@pytest.fixture
+def specs(tmpdir):
+    specs = tmpdir.mkdir("specs")
+    specs.join("title.txt").write("Example API")
+    specs.join("a.raml").write("#%RAML 0.8\ntitle: !include title.txt\n"
+                               "baseUri: http://a.com\n/a:\n  get:\n")
+    specs.join("b.raml").write("#%RAML 0.8\ntitle: B\n"
+                               "baseUri: http://b.com\n/b:\n  get:\n")
+    specs.join("c.raml").write("#%RAML 0.8\ntitle: C\n/c:\n  get:\n")
+    return specs
+
+
+def _validated(specs, graph, changed):
+    results = validate_files([str(specs)], changed=changed, graph=graph)
+    return sorted(os.path.basename(r.raml_file) for r in results)
+
+
+def test_include_graph(specs, tmpdir):
+    graph_file = str(tmpdir.join("graph.json"))
+    graph = IncludeGraph(graph_file)
+    # files not in the graph yet are always validated
+    assert _validated(specs, graph, []) == ["a.raml", "b.raml", "c.raml"]
+    graph.save()
+
+    with open(graph_file) as f:
+        saved = json.load(f)["dependencies"]
+    # paths are relative to the graph file; the invalid c.raml is left out
+    assert saved == {
+        os.path.join("specs", "a.raml"): [
+            os.path.join("specs", "a.raml"),
+            os.path.join("specs", "title.txt"),
+        ],
+        os.path.join("specs", "b.raml"): [os.path.join("specs", "b.raml")],
+    }
+
+    graph = IncludeGraph(graph_file)
+    assert _validated(specs, graph, []) == ["c.raml"]
+    changed = [str(specs.join("title.txt"))]
+    assert _validated(specs, graph, changed) == ["a.raml", "c.raml"]
+    changed = [str(specs.join("b.raml")), str(specs.join("gone.raml"))]
+    assert _validated(specs, graph, changed) == ["b.raml", "c.raml"]
+
+    specs.join("b.raml").remove()
+    graph.save()
+    assert len(IncludeGraph(graph_file).dependencies) == 1
+
+
+def test_include_graph_broken_file(tmpdir):
+    graph_file = tmpdir.join("graph.json")
+    graph_file.write("{not json")
+    assert IncludeGraph(str(graph_file)).dependencies == {}
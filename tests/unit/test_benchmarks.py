@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from benchmarks.generate import generate
+from benchmarks.suite import compare, config, measure, measure_package
+from ramlfications.parser import parse_raml
+from ramlfications.utils import load_file
+
+
+def _parse(tmpdir, **scale):
+    return parse_raml(load_file(generate(str(tmpdir), **scale)), config())
+
+
+def test_generate(tmpdir):
+    api = _parse(tmpdir, resources=3, depth=2, traits=2, trait_params=4,
+                 type_depth=3, includes=2)
+    assert api.raml_version == "0.8"
+    # 3 resources, nested twice, with a GET and a POST each
+    assert len(api.resources) == 3 * 3 * 2
+    assert len(api.traits) == 2
+    assert len(api.resource_types) == 3
+    get = api.resources.filter_by(method="get")[-1]
+    assert len(get.query_params) == 2 * 4
+    assert get.uri_params[-1].name == "id1"
+    # headers inherited through all resource types
+    top = api.resources.filter_by(method="get")[0]
+    assert sorted(h.name for h in top.headers) == [
+        "X-Type0", "X-Type1", "X-Type2"]
+
+
+def test_generate_data_types(tmpdir):
+    api = _parse(tmpdir, resources=1, depth=0, data_types=4)
+    assert api.raml_version == "1.0"
+    assert [t.name for t in api.types] == [
+        "Type0", "Type1", "Type2", "Type3"]
+
+
+def test_generate_unknown_axis(tmpdir):
+    with pytest.raises(TypeError):
+        generate(str(tmpdir), endpoints=3)
+
+
+def test_measure(tmpdir):
+    raml_file = generate(str(tmpdir), resources=2, depth=1)
+    metrics = measure(raml_file, repeat=1)
+    assert list(metrics) == ["parse", "validate", "parse_peak", "payload"]
+    assert all(value > 0 for value in metrics.values())
+
+
+def test_measure_package():
+    metrics = measure_package(repeat=1)
+    assert list(metrics) == ["import", "import_parser", "source_size"]
+    assert all(value > 0 for value in metrics.values())
+    # importing the parser imports the package first
+    assert metrics["import_parser"] > metrics["import"]
+
+
+def test_compare():
+    baseline = {"default": {"parse": 1.0, "validate": 1.0}}
+    results = {"default": {"parse": 1.2, "validate": 1.3, "payload": 9.0},
+               "new": {"parse": 5.0}}
+    assert compare(results, baseline) == [("default", "validate", 1.0, 1.3)]
+    assert compare(results, baseline, threshold=0.1) == [
+        ("default", "parse", 1.0, 1.2), ("default", "validate", 1.0, 1.3)]
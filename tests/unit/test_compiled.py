@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+import pickle
+
+import pytest
+
+from ramlfications import compile_raml, load_compiled, parse
+from ramlfications import compiled
+from ramlfications.errors import InvalidParameterError, LoadRAMLError
+
+from tests.base import RAML_08
+
+
+@pytest.fixture(scope="session")
+def root():
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    return parse(raml_file, os.path.join(RAML_08, "test-config.ini"))
+
+
+@pytest.fixture(scope="session")
+def data(root):
+    return compiled.dumps_compiled(root)
+
+
+def test_header(data):
+    assert data.startswith(b"#%RAMLC 1\n")
+
+
+def test_roundtrip(root, data):
+    loaded = compiled.loads_compiled(data)
+    assert loaded.title == root.title
+    assert loaded.base_uri == root.base_uri
+    assert repr(loaded.resources) == repr(root.resources)
+    assert repr(loaded.traits) == repr(root.traits)
+    for resource, other in zip(loaded.resources, root.resources):
+        assert resource.root is loaded
+        assert resource.absolute_uri == other.absolute_uri
+        assert resource.query_params == other.query_params
+        assert resource.headers == other.headers
+        if other.parent is not None:
+            assert resource.parent in loaded.resources
+
+
+def test_strings_interned(data):
+    loaded = compiled.loads_compiled(data)
+    names = [p.name for r in loaded.resources for p in r.query_params or []]
+    by_name = {}
+    for name in names:
+        assert by_name.setdefault(name, name) is name
+
+
+def test_request_validator_rebuilt(root, data):
+    loaded = compiled.loads_compiled(data)
+    resource = loaded.resources.filter_by(path="/widgets", method="get").one()
+    assert resource.request_validator is None
+    errors = resource.validate_request({})
+    original = root.resources.filter_by(path="/widgets", method="get").one()
+    assert [str(e) for e in errors] == [
+        str(e) for e in original.validate_request({})
+    ]
+    assert callable(resource.request_validator)
+
+
+def test_file_roundtrip(tmpdir):
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    output = str(tmpdir.join("api.ramlc"))
+    compile_raml(raml_file, output, os.path.join(RAML_08, "test-config.ini"))
+    assert load_compiled(output).title == "Example Web API"
+
+    with open(output, "rb") as f:
+        assert load_compiled(f).title == "Example Web API"
+
+    stream = io.BytesIO()
+    compiled.dump_compiled(load_compiled(output), stream)
+    stream.seek(0)
+    assert load_compiled(stream).title == "Example Web API"
+
+
+def test_not_compiled():
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    with pytest.raises(LoadRAMLError) as e:
+        load_compiled(raml_file)
+    assert str(e.value) == "Not a compiled RAML file."
+
+
+def test_missing_file():
+    with pytest.raises(LoadRAMLError):
+        load_compiled("/tmp/non-existant-compiled-raml-file.ramlc")
+
+
+def test_format_version(data):
+    with pytest.raises(LoadRAMLError) as e:
+        compiled.loads_compiled(data.replace(b"#%RAMLC 1", b"#%RAMLC 2", 1))
+    assert "format version 2" in str(e.value)
+
+
+def test_ramlfications_version(data, monkeypatch):
+    monkeypatch.setattr(compiled, "_version", lambda: "0.0.1")
+    with pytest.raises(LoadRAMLError) as e:
+        compiled.loads_compiled(data)
+    assert "compile it again" in str(e.value)
+
+
+def test_corrupt(data):
+    with pytest.raises(LoadRAMLError):
+        compiled.loads_compiled(data[:-10])
+
+
+def test_invalid_parameter_error_pickle():
+    error = InvalidParameterError("Oops.", "limit")
+    loaded = pickle.loads(pickle.dumps(error))
+    assert loaded.args == ("Oops.",)
+    assert loaded.parameter == "limit"
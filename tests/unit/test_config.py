@@ -9,6 +9,7 @@ import pytest
 from six import iteritems
 
 from ramlfications.config import setup_config
+from ramlfications.limits import Limits
 from ramlfications.config import (
     AUTH_SCHEMES, HTTP_RESP_CODES, MEDIA_TYPES, PROTOCOLS, HTTP_METHODS,
     RAML_VERSIONS, PRIM_TYPES
@@ -33,6 +34,7 @@ def basic_config():
         "raml_versions": RAML_VERSIONS,
         "prim_types": PRIM_TYPES,
         "validate": True,
+        "limits": Limits(),
     }
     optional = [m + "?" for m in basic_conf["http_methods"]]
     basic_conf["http_optional"] = optional + basic_conf["http_methods"]
@@ -82,3 +84,11 @@ def test_no_config_file_found():
 
     msg = ("No such file or directory: '{0}'".format(config_file),)
     assert e.value.args == msg
+
+
+def test_config_limits(tmpdir):
+    config_file = tmpdir.join("config.ini")
+    config_file.write("[limits]\nmax_includes = 5\nmax_nodes = none\n"
+                      "timeout = 2.5\nfoo = 1\n")
+    limits = setup_config(str(config_file))["limits"]
+    assert limits == Limits(max_includes=5, max_nodes=None, timeout=2.5)
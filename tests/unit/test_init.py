@@ -2,6 +2,8 @@
 # Copyright (c) 2015 Spotify AB
 
 import os
+import subprocess
+import sys
 
 import pytest
 
@@ -67,3 +69,73 @@ def test_validate_nonexistant_file():
     raml_file = "/tmp/non-existant-raml-file.raml"
     with pytest.raises(LoadRAMLError):
         validate(raml_file)
+
+
+#####
+# Import time
+#####
+
+# Modules only needed by some RAML files, by the CLI, or to update the
+# MIME media types; none of them may be imported by ``import ramlfications``
+DEFERRED_MODULES = [
+    "markdown2", "inflect", "xmltodict", "jsonref", "termcolor", "click",
+    "requests", "numpy", "http.server", "logging", "ramlfications.parser",
+    "ramlfications.models",
+]
+
+# Cumulative import time of ``ramlfications`` in microseconds, as reported
+# by ``-X importtime``: the 50 ms target.  The import takes about 30 ms
+# here, overhead of ``-X importtime`` included, leaving slow CI machines
+# a margin of about two thirds.
+IMPORT_BUDGET_US = 50000
+
+
+def test_import_time():
+    code = "import sys, ramlfications; print(' '.join(sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True,
+    )
+    modules = set(proc.stdout.split())
+    assert [m for m in DEFERRED_MODULES if m in modules] == []
+
+    times = dict(
+        (line.split("|")[2].strip(), int(line.split("|")[1]))
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line and
+        line.split("|")[1].strip().isdigit()
+    )
+    assert times["ramlfications"] < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes():
+    import ramlfications
+    from ramlfications.parser import parse_raml
+
+    assert ramlfications.parse_raml is parse_raml
+    assert callable(ramlfications.setup_config)
+    with pytest.raises(AttributeError):
+        ramlfications.not_an_attribute
+
+
+def test_no_shadowed_modules():
+    # a ``foo.py`` next to a ``foo/`` package is dead code: the package
+    # always wins the import
+    import ramlfications
+
+    shadowed = []
+    for dirpath, dirnames, filenames in os.walk(
+            os.path.dirname(ramlfications.__file__)):
+        shadowed.extend(
+            os.path.join(dirpath, d) for d in dirnames
+            if d + ".py" in filenames
+        )
+    assert shadowed == []
+
+
+def test_helpers_shim():
+    from ramlfications import _helpers, utils
+
+    assert _helpers.load_file is utils.load_file
+    assert _helpers.load_string is utils.load_string
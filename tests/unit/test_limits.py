@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+import pickle
+
+import pytest
+
+from ramlfications import load, loads, parse
+from ramlfications.errors import (
+    AliasExpansionError, DocumentSizeError, IncludeCountError,
+    IncludeDepthError, LimitExceededError, LoadRAMLError, NodeCountError,
+    ParseTimeoutError, ResourceDepthError
+)
+from ramlfications.limits import Limits, read_limited
+
+from tests.base import RAML_08
+
+
+HEADER = "#%RAML 0.8\n"
+
+
+def nested_resources(depth):
+    lines = [HEADER, "title: Deep API\n", "baseUri: http://example.com\n"]
+    for level in range(depth):
+        lines.append("  " * level + "/level{0}:\n".format(level))
+        lines.append("  " * (level + 1) + "get:\n")
+    return "".join(lines)
+
+
+def billion_laughs(levels):
+    lines = [HEADER, "title: Laughs\n", "a0: &a0 [lol, lol, lol]\n"]
+    for level in range(1, levels + 1):
+        refs = ", ".join(["*a{0}".format(level - 1)] * 9)
+        lines.append("a{0}: &a{0} [{1}]\n".format(level, refs))
+    return "".join(lines)
+
+
+def test_errors_are_load_errors():
+    for error in (AliasExpansionError, DocumentSizeError, IncludeCountError,
+                  IncludeDepthError, NodeCountError, ParseTimeoutError,
+                  ResourceDepthError):
+        assert issubclass(error, LimitExceededError)
+        assert issubclass(error, LoadRAMLError)
+
+
+def test_cyclic_include(tmpdir):
+    tmpdir.join("api.raml").write(HEADER + "title: !include a.yaml\n")
+    tmpdir.join("a.yaml").write("foo: !include b.yaml\n")
+    tmpdir.join("b.yaml").write("bar: !include a.yaml\n")
+    with pytest.raises(IncludeDepthError) as e:
+        load(str(tmpdir.join("api.raml")))
+    msg = "Cyclic include: {0} -> {1} -> {0}".format(
+        tmpdir.join("a.yaml"), tmpdir.join("b.yaml"))
+    assert msg in str(e.value)
+
+
+def test_include_depth(tmpdir):
+    tmpdir.join("api.raml").write(HEADER + "title: !include 1.yaml\n")
+    for i in range(1, 5):
+        tmpdir.join("{0}.yaml".format(i)).write(
+            "foo: !include {0}.yaml\n".format(i + 1))
+    tmpdir.join("5.yaml").write("foo: bar\n")
+
+    loaded = load(str(tmpdir.join("api.raml")), Limits(max_include_depth=5))
+    assert loaded["title"]["foo"]["foo"]["foo"]["foo"]["foo"] == "bar"
+    with pytest.raises(IncludeDepthError):
+        load(str(tmpdir.join("api.raml")), Limits(max_include_depth=4))
+
+
+def test_include_count(tmpdir):
+    tmpdir.join("api.raml").write(
+        HEADER + "".join("k{0}: !include a.yaml\n".format(i)
+                         for i in range(4)))
+    tmpdir.join("a.yaml").write("foo: bar\n")
+    load(str(tmpdir.join("api.raml")), Limits(max_includes=4))
+    with pytest.raises(IncludeCountError):
+        load(str(tmpdir.join("api.raml")), Limits(max_includes=3))
+
+
+def test_document_size(tmpdir):
+    raml = HEADER + "title: Foo\n"
+    assert loads(raml, Limits(max_document_size=len(raml)))
+    with pytest.raises(DocumentSizeError):
+        loads(raml, Limits(max_document_size=len(raml) - 1))
+
+    tmpdir.join("api.raml").write(raml + "foo: !include a.yaml\n")
+    tmpdir.join("a.yaml").write("bar" * 100)
+    with pytest.raises(DocumentSizeError) as e:
+        load(str(tmpdir.join("api.raml")), Limits(max_document_size=100))
+    assert "a.yaml" in str(e.value)
+
+
+@pytest.mark.parametrize("size,expected", [
+    (-1, "abcdef"), (0, ""), (4, "abcd"), (100, "abcdef"),
+])
+def test_read_limited(monkeypatch, size, expected):
+    monkeypatch.setattr("ramlfications.limits.READ_CHUNK", 3)
+    assert read_limited(io.StringIO(u"abcdef"), size) == expected
+    assert read_limited(io.BytesIO(b"abcdef"), size) == expected.encode()
+
+
+def test_alias_expansion():
+    # 9 ** 8 lols, found out after a few thousand
+    with pytest.raises(AliasExpansionError):
+        loads(billion_laughs(8))
+
+    loaded = loads(billion_laughs(2), Limits(max_alias_expansion=1000))
+    assert loaded["a2"][0][0] == ["lol", "lol", "lol"]
+    with pytest.raises(AliasExpansionError):
+        loads(billion_laughs(2), Limits(max_alias_expansion=100))
+
+
+def test_resource_depth(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(nested_resources(10))
+    root = parse(str(raml_file), limits=Limits(max_resource_depth=10))
+    assert root.resources[-1].path == "".join(
+        "/level{0}".format(i) for i in range(10))
+    with pytest.raises(ResourceDepthError) as e:
+        parse(str(raml_file), limits=Limits(max_resource_depth=9))
+    assert "/level8/level9" in str(e.value)
+
+
+def test_nodes(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(nested_resources(10))
+    parse(str(raml_file), limits=Limits(max_nodes=10))
+    with pytest.raises(NodeCountError):
+        parse(str(raml_file), limits=Limits(max_nodes=9))
+
+
+def test_timeout():
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    with pytest.raises(ParseTimeoutError):
+        parse(raml_file, limits=Limits(timeout=0))
+
+
+def test_config_limits(tmpdir):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(nested_resources(3))
+    config_file = tmpdir.join("config.ini")
+    config_file.write("[limits]\nmax_resource_depth = 2\n")
+    with pytest.raises(ResourceDepthError):
+        parse(str(raml_file), str(config_file))
+
+
+def test_no_limits(tmpdir):
+    limits = Limits(None, None, None, None, None, None, None)
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(nested_resources(3))
+    assert len(parse(str(raml_file), limits=limits).resources) == 3
+
+
+def test_pickle():
+    limits = Limits(max_nodes=3)
+    assert pickle.loads(pickle.dumps(limits)) == limits
+    error = pickle.loads(pickle.dumps(NodeCountError("foo")))
+    assert str(error) == "foo"
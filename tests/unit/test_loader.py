@@ -324,3 +324,32 @@ def test_parse_ramlfragment_unknown_type():
     msg = ("Error parsing RAML fragment: garbage is not (yet) supported. "
            "Currently supported: DataType")
     assert msg in e.value.args[0]
+
+
+def test_include_graph():
+    raml_file = os.path.join(RAML_08, "nested-includes.raml")
+    raml_loader = loader.RAMLLoader()
+    with open(raml_file) as f:
+        raml = raml_loader.load(f)
+
+    includes = os.path.abspath(os.path.join(RAML_08, "includes"))
+    first = os.path.join(includes, "all-the-properties.raml")
+    assert raml._raml_includes is raml_loader.includes
+    assert raml_loader.includes[os.path.abspath(raml_file)] == [first]
+    deps = raml_loader.dependencies(raml_file)
+    assert deps[:2] == [os.path.abspath(raml_file), first]
+    assert len(deps) == len(set(deps)) > 2
+
+
+def test_include_graph_json_refs():
+    raml_file = os.path.join(JSONREF, "jsonref_relative_local.raml")
+    raml_loader = loader.RAMLLoader()
+    with open(raml_file) as f:
+        raml_loader.load(f)
+
+    schema = os.path.abspath(
+        os.path.join(JSONREF, "jsonref_relative_local.schema.json"))
+    artist = os.path.abspath(os.path.join(JSONREF, "artist.schema.json"))
+    assert raml_loader.dependencies(raml_file) == [
+        os.path.abspath(raml_file), schema, artist
+    ]
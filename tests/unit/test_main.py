@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright (c) 2015 Spotify AB
 
+import json
 import os
 from textwrap import dedent
 
@@ -9,6 +10,7 @@ import pytest
 import re
 
 from ramlfications import __main__ as main
+from ramlfications import load_compiled, load_mapped
 
 from tests.base import RAML_08, VALIDATE_08
 
@@ -16,7 +18,7 @@ from tests.base import RAML_08, VALIDATE_08
 MAIN_USAGE = 'Usage: main [OPTIONS] COMMAND [ARGS]...\n\n'
 TREE_USAGE = 'Usage: tree [OPTIONS] RAMLFILE\n\n'
 UPDATE_USAGE = 'Usage: update [OPTIONS]\n\n'
-VALIDATE_USAGE = 'Usage: validate [OPTIONS] RAMLFILE\n\n'
+VALIDATE_USAGE = 'Usage: validate [OPTIONS] PATHS...\n\n'
 
 MAIN_HELP = MAIN_USAGE + """\
   Yet Another RAML Parser
@@ -25,9 +27,11 @@ Options:
   -h, --help  Show this message and exit.
 
 Commands:
+  compile   Compile a RAML file for fast loading.
+  stats     Show what parsing a RAML file takes.
   tree      Visualize the RAML file as a tree.
   update    Update RAMLfications' supported MIME types from IANA.
-  validate  Validate a RAML file.
+  validate  Validate RAML files, and the *.raml files in directories.
 """
 
 TREE_HELP = TREE_USAGE + """\
@@ -50,11 +54,20 @@ Options:
 """
 
 VALIDATE_HELP = VALIDATE_USAGE + """\
-  Validate a RAML file.
+  Validate RAML files, and the *.raml files in directories.
 
 Options:
-  -c, --config PATH  Additionally supported items beyond RAML spec.
-  -h, --help         Show this message and exit.
+  -c, --config PATH     Additionally supported items beyond RAML spec.
+  --fast                Validate without building the API's objects.
+  -x, --fail-fast       Stop at the first error.
+  --max-errors INTEGER  Stop after this many errors.
+  -j, --jobs INTEGER    Files to validate in parallel (0: one per CPU).
+  --json                Print a JSON object per file.
+  --changed PATH        Only validate the RAML files including this file
+                        (repeatable).
+  --graph PATH          Include graph file to read and update (default with
+                        --changed: .ramlfications-includes.json).
+  -h, --help            Show this message and exit.
 """
 
 
@@ -140,9 +153,18 @@ def test_validate_bad_file_handling(runner):
     """
     The validate command handles bad file arguments.
     """
-    _handles_no_file(runner, VALIDATE_USAGE, main.validate)
-    _handles_nonexistent_file(runner, VALIDATE_USAGE, main.validate)
-    _handles_file_extra_arg(runner, VALIDATE_USAGE, main.validate)
+    result = runner.invoke(main.validate, [])
+    expected = (add_help_message(VALIDATE_USAGE) +
+                "Error: Missing argument 'PATHS...'.\n")
+    check_result(2, expected, result)
+
+    existing_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    for args in [['nonexistent'], [existing_file, 'nonexistent']]:
+        result = runner.invoke(main.validate, args)
+        expected = add_help_message(VALIDATE_USAGE) + (
+            "Error: Invalid value for 'PATHS...': "
+            "Path 'nonexistent' does not exist.\n")
+        check_result(2, expected, result)
 
 
 def test_validate(runner):
@@ -174,6 +196,177 @@ def test_validate_fail(runner):
     assert exp_msg_3 in result.output
 
 
+def test_validate_fast(runner):
+    """
+    Validate RAML files via CLI without building the API's objects.
+    """
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    exp_msg = "Success! Valid RAML file: {0}\n".format(raml_file)
+    result = runner.invoke(main.validate, [raml_file, "--fast"])
+    check_result(0, exp_msg, result)
+
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    result = runner.invoke(main.validate, [raml_file, "--fast"])
+    assert result.exit_code == 1
+    assert 'RAML File does not define an API title.' in result.output
+    assert 'RAML File does not define the baseUri.' in result.output
+
+
+def test_validate_fail_fast(runner):
+    """
+    Stop validating RAML files via CLI at the first error(s).
+    """
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    for args in (["--fail-fast"], ["-x", "--fast"], ["--max-errors", "1"]):
+        result = runner.invoke(main.validate, [raml_file] + args)
+        assert result.exit_code == 1
+        assert 'RAML File does not define the baseUri.' in result.output
+        assert 'API title' not in result.output
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_validate_many(runner, jobs):
+    """
+    Validate several RAML files and directories via CLI, as JSON lines.
+    """
+    valid_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    result = runner.invoke(main.validate, [
+        valid_file, VALIDATE_08, "--json", "--jobs", jobs])
+    assert result.exit_code == 1
+
+    results = [json.loads(line) for line in result.output.splitlines()]
+    files = [r["file"] for r in results]
+    assert sorted(files) == sorted(set(files))
+    assert valid_file in files
+    invalid = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    assert invalid in files
+    for r in results:
+        assert r["valid"] == (not r["errors"])
+        if r["file"] in (valid_file, invalid):
+            assert r["valid"] == (r["file"] == valid_file)
+
+    other_file = os.path.join(RAML_08, "resource_types.raml")
+    result = runner.invoke(main.validate, [valid_file, other_file,
+                                           "--jobs", jobs])
+    assert result.exit_code == 0
+    assert len(result.output.splitlines()) == 2
+
+
+def test_validate_changed(runner, tmpdir, monkeypatch):
+    """
+    Only validate the RAML files affected by changed files via CLI.
+    """
+    raml_file = os.path.join(RAML_08, "json_includes.raml")
+    other_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    graph = str(tmpdir.join("graph.json"))
+    args = [raml_file, other_file, "--json", "--graph", graph]
+
+    result = runner.invoke(main.validate, args)
+    assert result.exit_code == 0
+    assert len(result.output.splitlines()) == 2
+
+    result = runner.invoke(main.validate, args + ["--changed", other_file])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["file"] == other_file
+
+    with open(graph) as f:
+        deps = json.load(f)["dependencies"]
+    include = [d for d in deps[os.path.relpath(raml_file, str(tmpdir))]
+               if d.endswith(".json")][0]
+    include = os.path.join(str(tmpdir), include)
+    result = runner.invoke(main.validate, args + ["--changed", include])
+    assert json.loads(result.output)["file"] == raml_file
+
+    monkeypatch.chdir(str(tmpdir))
+    result = runner.invoke(main.validate, [other_file, "--changed", "x"])
+    assert result.exit_code == 0
+    assert tmpdir.join(".ramlfications-includes.json").check()
+
+
+def test_compile(runner, tmpdir):
+    """
+    Successfully compile a RAML file via CLI.
+    """
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    output = str(tmpdir.join("api.ramlc"))
+    result = runner.invoke(main.compile, [raml_file, "-o", output])
+    exp_msg = "Compiled {0} to {1}\n".format(raml_file, output)
+    check_result(0, exp_msg, result)
+
+    root = load_compiled(output)
+    assert root.title == "Example Web API"
+
+
+def test_compile_mapped(runner, tmpdir):
+    """
+    Write a memory-mapped API file via CLI.
+    """
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    output = str(tmpdir.join("api.map"))
+    result = runner.invoke(main.compile, [raml_file, "-o", output,
+                                          "--mapped"])
+    exp_msg = "Compiled {0} to {1}\n".format(raml_file, output)
+    check_result(0, exp_msg, result)
+
+    with load_mapped(output) as api:
+        assert api.title == "Example Web API"
+
+
+def test_stats(runner):
+    """
+    Print the time and memory parsing a RAML file takes via CLI.
+    """
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    result = runner.invoke(main.stats, [raml_file])
+    assert result.exit_code == 0
+    assert "resources" in result.output
+    assert "Retained by" not in result.output
+
+    result = runner.invoke(main.stats, [raml_file, "--memory"])
+    assert result.exit_code == 0
+    assert "Retained by" in result.output
+    assert "ResourceNode" in result.output
+    assert "\nraw " in result.output
+
+    result = runner.invoke(main.stats, [raml_file, "--memory", "--no-raw"])
+    assert result.exit_code == 0
+    assert "\nraw " not in result.output
+
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    result = runner.invoke(main.stats, [raml_file, "--memory"])
+    assert result.exit_code == 1
+
+
+def test_compile_fail(runner, tmpdir):
+    """
+    Raise error for invalid RAML file via CLI when compiling.
+    """
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    output = str(tmpdir.join("api.ramlc"))
+    result = runner.invoke(main.compile, [raml_file, "-o", output])
+    assert result.exit_code == 1
+    assert 'RAML File does not define an API title.' in result.output
+    assert not os.path.exists(output)
+
+
+def test_compile_bad_file_handling(runner):
+    """
+    The compile command handles bad file arguments.
+    """
+    # the usage text differs between click versions
+    result = runner.invoke(main.compile, [])
+    assert result.exit_code == 2
+    assert result.output.splitlines()[-1] == \
+        "Error: Missing argument 'RAMLFILE'."
+
+    for args in [['nonexistent'], ['nonexistent', 'extra']]:
+        result = runner.invoke(main.compile, args)
+        assert result.exit_code == 2
+        assert result.output.splitlines()[-1] == (
+            "Error: Invalid value for 'RAMLFILE': "
+            "Path 'nonexistent' does not exist.")
+
+
 @pytest.mark.parametrize('args', [['-h'], ['--help']])
 def test_tree_help(runner, args):
     """
@@ -245,7 +438,7 @@ def test_update(runner, mocker):
     """
     Successfully update supported mime types
     """
-    json_file = "ramlfications/data/supported_mime_types.json"
+    json_file = "ramlfications/data/supported_mime_types.txt"
     parent = os.path.dirname(os.path.pardir)
     json_path = os.path.join(parent, json_file)
 
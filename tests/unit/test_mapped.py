@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import struct
+
+import pytest
+
+from ramlfications import load_mapped, map_raml, parse
+from ramlfications import mapped
+from ramlfications.errors import LoadRAMLError
+
+from tests.base import RAML_08, RAML_10
+
+
+RAML_FILE = os.path.join(RAML_08, "complete-valid-example.raml")
+CONFIG_FILE = os.path.join(RAML_08, "test-config.ini")
+
+
+@pytest.fixture(scope="session")
+def root():
+    return parse(RAML_FILE, CONFIG_FILE)
+
+
+@pytest.fixture
+def api(root, tmpdir):
+    path = str(tmpdir.join("api.map"))
+    mapped.dump_mapped(root, path)
+    with load_mapped(path) as api:
+        yield api
+
+
+def test_root_fields(root, api):
+    assert api.title == root.title
+    assert api.version == root.version
+    assert api.raml_version == "0.8"
+    assert api.base_uri == root.base_uri
+    assert api.protocols == root.protocols
+    assert api.media_type == root.media_type
+    params = [p.name for p in api.base_uri_params]
+    assert params == [p.name for p in root.base_uri_params]
+    assert api.documentation[0].title == root.documentation[0].title.raw
+
+
+def test_resources(root, api):
+    assert len(api.resources) == len(root.resources)
+    for resource, other in zip(api.resources, root.resources):
+        assert resource.name == other.name
+        assert resource.path == other.path
+        assert resource.method == other.method
+        assert resource.absolute_uri == other.absolute_uri
+        assert resource.is_ == other.is_
+        assert resource.secured_by == other.secured_by
+        if other.parent is None:
+            assert resource.parent is None
+        else:
+            assert resource.parent.path == other.parent.path
+            assert resource.parent.method == other.parent.method
+
+
+def test_resource_params(root, api):
+    other = root.resources.filter_by(path="/widgets", method="get")[0]
+    resource = api.resources.filter_by(path="/widgets", method="get")[0]
+    assert resource == api.resources[root.resources.index(other)]
+    assert resource.description == other.description.raw
+
+    param = resource.query_params[0]
+    exp = other.query_params[0]
+    assert param.name == exp.name
+    assert param.type == exp.type
+    assert param.required == exp.required
+    assert param.enum == exp.enum
+    assert [h.name for h in resource.headers] == \
+        [h.name for h in other.headers]
+
+
+def test_responses_and_bodies(root, api):
+    others = [r for r in root.resources if r.responses]
+    resources = [r for r in api.resources if r.responses]
+    assert len(resources) == len(others)
+    for resource, other in zip(resources, others):
+        codes = [r.code for r in resource.responses]
+        assert codes == [r.code for r in other.responses]
+        for response, exp in zip(resource.responses, other.responses):
+            mime_types = [b.mime_type for b in response.body or []]
+            assert mime_types == [b.mime_type for b in exp.body or []]
+
+
+def test_examples(tmpdir):
+    root = parse(os.path.join(RAML_10, "examples.raml"),
+                 os.path.join(RAML_10, "test-config.ini"))
+    path = str(tmpdir.join("api.map"))
+    mapped.dump_mapped(root, path)
+    with load_mapped(path) as api:
+        resource = api.resources.filter_by(path="/with_header")[0]
+        headers = dict((h.name, h) for h in resource.headers)
+    assert headers["x-structured"].example == {
+        "name": None, "display_name": "just a parameter",
+        "description": None, "value": "just a string", "strict": True,
+    }
+    examples = headers["x-multiple"].examples
+    assert [e["name"] for e in examples] == [
+        "simple", "typical", "special", "broken"]
+    assert examples[1]["description"] == "This is what we expect."
+    assert examples[3]["strict"] is False
+
+
+def test_unknown_type(root, tmpdir):
+    # written as is, not as its ``str()``
+    param = root.resources[0].query_params[0]
+    default = param.default
+    param.default = object()
+    try:
+        with pytest.raises(TypeError):
+            mapped.dump_mapped(root, str(tmpdir.join("api.map")))
+    finally:
+        param.default = default
+
+
+def test_sequence(api):
+    resources = api.resources
+    assert resources[-1] == resources[len(resources) - 1]
+    assert resources[1:3] == [resources[1], resources[2]]
+    assert hash(resources[0]) == hash(resources[0])
+    assert resources[0] != resources[1]
+    with pytest.raises(IndexError):
+        resources[len(resources)]
+
+
+def test_unknown_field(api):
+    with pytest.raises(AttributeError):
+        api.resources[0].traits
+    with pytest.raises(AttributeError):
+        api.resources_by_name
+
+
+def test_map_raml(tmpdir):
+    path = str(tmpdir.join("api.map"))
+    map_raml(RAML_FILE, path, CONFIG_FILE)
+    with load_mapped(path) as api:
+        assert api.title == "Example Web API"
+
+
+def test_not_mapped(tmpdir):
+    path = tmpdir.join("api.map")
+    path.write_binary(b"#%RAML 0.8\ntitle: foo\n" * 2)
+    with pytest.raises(LoadRAMLError) as e:
+        load_mapped(str(path))
+    assert "Not a mapped RAML API file." in str(e.value)
+
+    path.write_binary(b"")
+    with pytest.raises(LoadRAMLError):
+        load_mapped(str(path))
+
+
+def test_format_version(root, tmpdir):
+    path = tmpdir.join("api.map")
+    mapped.dump_mapped(root, str(path))
+    data = path.read_binary()
+    version = struct.pack("<I", mapped.FORMAT_VERSION + 1)
+    path.write_binary(data[:8] + version + data[12:])
+    with pytest.raises(LoadRAMLError) as e:
+        load_mapped(str(path))
+    assert "format version" in str(e.value)
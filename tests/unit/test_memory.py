@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+import tracemalloc
+
+import pytest
+
+from ramlfications import parse
+from ramlfications.errors import InvalidRAMLError
+from ramlfications.memory import MemoryReport, retained_sizes
+from ramlfications.parser.pipeline import ParsePipeline
+
+from tests.base import RAML_08, VALIDATE_08
+
+
+@pytest.fixture(scope="session")
+def raml_file():
+    return os.path.join(RAML_08, "complete-valid-example.raml")
+
+
+def test_retained_sizes(raml_file):
+    api = parse(raml_file)
+    sizes = retained_sizes(api)
+    assert sizes["ResourceNode"][0] == len(api.resources)
+    assert sizes["TraitNode"][0] == len(api.traits)
+    assert sizes[type(api).__name__][0] == 1
+    for category in ("raw", "config", "request validators"):
+        assert sizes[category][1] > 0
+    # largest first
+    assert [s for _, s in sizes.values()] == sorted(
+        [s for _, s in sizes.values()], reverse=True)
+
+
+def test_report(raml_file):
+    report = MemoryReport()
+    api = parse(raml_file, memory=report)
+    assert api.title == "Example Web API"
+    assert [p.name for p in report.phases] == list(ParsePipeline.STAGES)
+    load = report.phases[0]
+    assert 0 < load.size <= load.peak
+    # reading a file does not take a buffer of max_document_size
+    assert load.peak < 2 ** 24
+    assert report.retained == retained_sizes(api)
+    assert not tracemalloc.is_tracing()
+
+    text = report.format()
+    for phase in report.phases:
+        assert phase.name in text
+    assert "ResourceNode" in text
+
+
+def test_report_invalid():
+    report = MemoryReport()
+    with pytest.raises(InvalidRAMLError):
+        parse(os.path.join(VALIDATE_08, "no-base-uri-no-title.raml"),
+              memory=report)
+    # errors are raised once all of the file was parsed
+    assert [p.name for p in report.phases] == list(ParsePipeline.STAGES[:-1])
+    assert not report.retained
+    assert not tracemalloc.is_tracing()
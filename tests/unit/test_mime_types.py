@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from ramlfications import mime_types
+from ramlfications.config import MEDIA_TYPES
+from ramlfications.mime_types import MediaTypeRegistry, structured_suffix
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("application/vnd.github.v3+json", "json"),
+    ("application/atom+XML", "xml"),
+    ("application/vnd.foo+zip", None),
+    ("application/json", None),
+    ("+json", None),
+    ("application/+json", None),
+])
+def test_structured_suffix(value, expected):
+    assert structured_suffix(value) == expected
+
+
+def test_default_registry():
+    registry = mime_types.default_registry()
+    assert mime_types.default_registry() is registry
+    assert isinstance(registry, frozenset)
+    assert "application/json" in registry
+    assert sorted(registry) == MEDIA_TYPES
+
+
+def test_supports():
+    registry = MediaTypeRegistry(["application/json", "text/plain"])
+    assert registry.supports("text/plain")
+    assert registry.supports("application/vnd.github.v3+json")
+    assert registry.supports("text/vnd.foo+xml")
+    assert "application/vnd.github.v3+json" not in registry
+    assert not registry.supports("application/vnd.github.v3")
+    assert not registry.supports("image/svg+xml")
+    assert registry.top_level_types == frozenset(["application", "text"])
+
+
+def test_save_load(tmpdir):
+    path = str(tmpdir.join("mime_types.txt"))
+    registry = MediaTypeRegistry(["text/plain", "application/json"])
+    registry.save(path)
+    with open(path) as f:
+        assert f.read() == "application/json\ntext/plain\n"
+    loaded = MediaTypeRegistry.load(path)
+    assert loaded == registry
+    assert isinstance(loaded, MediaTypeRegistry)
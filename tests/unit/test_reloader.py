@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import gc
+import os
+import time
+import weakref
+
+import pytest
+
+from ramlfications.errors import LoadRAMLError
+from ramlfications.reloader import RAMLReloader
+
+
+API = """#%RAML 0.8
+title: Example API
+baseUri: https://api.example.com
+/foo: !include foo.raml
+"""
+
+FOO = """displayName: {0}
+get:
+  description: Get foo
+"""
+
+
+def _write(path, data):
+    with open(path, "w") as f:
+        f.write(data)
+    # make sure the modification is seen, whatever the mtime resolution
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+
+@pytest.fixture
+def spec(tmpdir):
+    _write(str(tmpdir.join("foo.raml")), FOO.format("Foo"))
+    _write(str(tmpdir.join("api.raml")), API)
+    return tmpdir
+
+
+def _display_name(root):
+    return root.resources[0].display_name
+
+
+def test_reloader_watches_includes(spec):
+    reloader = RAMLReloader(str(spec.join("api.raml")))
+    assert _display_name(reloader.root) == "Foo"
+    assert sorted(reloader.files) == [
+        str(spec.join("api.raml")), str(spec.join("foo.raml"))
+    ]
+
+
+def test_reloader_unchanged(spec):
+    reloader = RAMLReloader(str(spec.join("api.raml")))
+    root = reloader.root
+    assert reloader.changed() == []
+    assert not reloader.check()
+    assert reloader.root is root
+
+
+def test_reloader_include_changed(spec):
+    reloaded = []
+    reloader = RAMLReloader(str(spec.join("api.raml")),
+                            on_reload=reloaded.append)
+    first = reloader.root
+    _write(str(spec.join("foo.raml")), FOO.format("Bar"))
+
+    assert reloader.changed() == [str(spec.join("foo.raml"))]
+    assert reloader.check()
+    assert reloader.root is not first
+    assert reloaded == [first, reloader.root]
+    assert _display_name(reloader.root) == "Bar"
+    assert _display_name(first) == "Foo"
+
+
+def test_reloader_keeps_root_on_error(spec):
+    reloader = RAMLReloader(str(spec.join("api.raml")))
+    first = reloader.root
+    os.remove(str(spec.join("foo.raml")))
+
+    assert not reloader.check()
+    assert reloader.root is first
+    assert isinstance(reloader.last_error, LoadRAMLError)
+    # nothing changed since the failed attempt
+    assert not reloader.check()
+
+    _write(str(spec.join("foo.raml")), FOO.format("Baz"))
+    assert reloader.check()
+    assert reloader.last_error is None
+    assert _display_name(reloader.root) == "Baz"
+
+
+def test_reloader_initial_error(tmpdir):
+    with pytest.raises(LoadRAMLError):
+        RAMLReloader(str(tmpdir.join("missing.raml")))
+
+
+def test_reloader_thread(spec):
+    reloader = RAMLReloader(str(spec.join("api.raml")), interval=0.01)
+    with reloader:
+        _write(str(spec.join("foo.raml")), FOO.format("Bar"))
+        deadline = time.time() + 5
+        while _display_name(reloader.root) != "Bar":
+            assert time.time() < deadline
+            time.sleep(0.01)
+    assert reloader._thread is None
+
+
+def test_reloader_weak_refs(spec):
+    reloader = RAMLReloader(str(spec.join("api.raml")), weak_refs=True)
+    old = weakref.ref(reloader.root)
+    _write(str(spec.join("foo.raml")), FOO.format("Bar"))
+    gc.disable()
+    try:
+        assert reloader.check()
+        # freed by reference counting, without the garbage collector
+        assert old() is None
+    finally:
+        gc.enable()
+    assert reloader.root.resources[0].root is reloader.root
@@ -193,8 +193,8 @@ def test_update_mime_types(
         'https://www.iana.org/assignments/media-types/media-types.xml')
 
     expected_save_path = os.path.realpath(os.path.join(
-        os.path.dirname(utils.__file__),
-        'data/supported_mime_types.json'))
+        os.path.dirname(os.path.dirname(utils.__file__)),
+        'data/supported_mime_types.txt'))
     mock_save_updated_mime_types.assert_called_once_with(
         expected_save_path,
         expected_data)
@@ -208,8 +208,7 @@ def test_save_updated_mime_types():
     utils._save_updated_mime_types(temp_output, content)
 
     result = open(temp_output, "r", encoding="UTF-8").read()
-    result = json.loads(result)
-    assert result == content
+    assert result == "bar/baz\nfoo/bar\n"
 
     os.remove(temp_output)
 
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from ramlfications import parse
+from ramlfications.errors import (
+    DataTypeValidationError, InvalidParameterError, UnknownDataTypeError
+)
+from ramlfications.models.data_types import ArrayDataType
+from ramlfications.validate.payload import (
+    compile_data_type, compile_request_validator, validate_batch
+)
+
+from tests.base import RAML_08, RAML_10
+
+
+@pytest.fixture(scope="session")
+def root():
+    raml_file = os.path.join(RAML_10, "data_types", "payload_types.raml")
+    conf_file = os.path.join(RAML_10, "test-config.ini")
+    return parse(raml_file, conf_file)
+
+
+@pytest.fixture(scope="session")
+def released_root():
+    raml_file = os.path.join(RAML_10, "data_types", "payload_types.raml")
+    conf_file = os.path.join(RAML_10, "test-config.ini")
+    return parse(raml_file, conf_file, keep_raw=False)
+
+
+def _validator(root, name):
+    return root.types.filter_by(name=name).one().compile_validator()
+
+
+def _messages(errors):
+    assert all(isinstance(e, DataTypeValidationError) for e in errors)
+    return [e.args[0] for e in errors]
+
+
+def test_compile_validator_returns_function(root):
+    data_type = root.types.filter_by(name="Code").one()
+    validate = compile_data_type(data_type)
+    assert validate("ABC") == []
+    assert _messages(data_type.compile_validator()("AB")) == [
+        "$: must be at least 3 characters, but got: 'AB'",
+        "$: must match pattern '^[A-Z]{3}$', but got: 'AB'",
+    ]
+
+
+def test_string_enum(root):
+    validate = _validator(root, "Status")
+    assert validate("active") == []
+    assert _messages(validate("gone")) == [
+        "$: must be one of ['active', 'retired'], but got: 'gone'"
+    ]
+    assert _messages(validate(1)) == ["$: expected a string, but got: 1"]
+
+
+def test_integer_bounds(root):
+    validate = _validator(root, "Age")
+    assert validate(42) == []
+    assert _messages(validate(-1)) == [
+        "$: must be greater than or equal to 0, but got: -1"
+    ]
+    assert _messages(validate(151)) == [
+        "$: must be less than or equal to 150, but got: 151"
+    ]
+    assert _messages(validate(1.5)) == [
+        "$: expected an integer, but got: 1.5"
+    ]
+    assert _messages(validate(True)) == [
+        "$: expected an integer, but got: True"
+    ]
+
+
+def test_number_multiple_of(root):
+    validate = _validator(root, "Price")
+    assert validate(2.5) == []
+    assert _messages(validate(2.25)) == [
+        "$: must be a multiple of 0.5, but got: 2.25"
+    ]
+
+
+def test_object_properties(root):
+    validate = _validator(root, "Person")
+    payload = {
+        "name": "Lynn",
+        "age": 30,
+        "code": "ABC",
+        "status": "active",
+        "address": {"street": "Main St", "zip": "12345"},
+        "tags": ["a", "b"],
+        "friends": [{"name": "Bob", "age": 40}],
+        "nickname": None,
+    }
+    assert validate(payload) == []
+
+    payload = {
+        "name": "",
+        "tags": ["a", 1],
+        "address": {"street": "Main St", "zip": "123", "city": "NYC"},
+        "friends": [{"name": "Bob", "age": -1}],
+        "nickname": 3,
+    }
+    assert _messages(validate(payload)) == [
+        "$.name: must be at least 1 characters, but got: ''",
+        "$.age: required property is missing, but got: None",
+        "$.address.zip: must match pattern '^[0-9]{5}$', but got: '123'",
+        "$.address.city: additional property not allowed, but got: 'NYC'",
+        "$.tags[1]: expected a string, but got: 1",
+        "$.friends[0].age: must be greater than or equal to 0, but got: -1",
+        "$.nickname: does not match any of 'string | nil', but got: 3",
+    ]
+    assert _messages(validate([])) == ["$: expected an object, but got: []"]
+
+
+def test_inherited_object(root):
+    validate = _validator(root, "Employee")
+    assert validate({"name": "Lynn", "age": 30, "id": 1}) == []
+    assert _messages(validate({"name": "Lynn", "age": 30})) == [
+        "$.id: required property is missing, but got: None"
+    ]
+
+
+def test_array_data_type(root):
+    data_type = ArrayDataType(
+        name="Codes", raw={}, raml_version="1.0", root=root, errors=[],
+        config={}, items="Code", unique_items=True, min_items=1,
+        max_items=2,
+    )
+    validate = data_type.compile_validator()
+    assert validate(["ABC", "DEF"]) == []
+    assert _messages(validate([])) == [
+        "$: must have at least 1 items, but got: []"
+    ]
+    assert _messages(validate(["ABC", "ABC", "x"])) == [
+        "$: must have at most 2 items, but got: ['ABC', 'ABC', 'x']",
+        "$: items must be unique, but got: ['ABC', 'ABC', 'x']",
+        "$[2]: must be at least 3 characters, but got: 'x'",
+        "$[2]: must match pattern '^[A-Z]{3}$', but got: 'x'",
+    ]
+
+
+def test_unknown_type(root):
+    data_type = ArrayDataType(
+        name="Things", raw={}, raml_version="1.0", root=root, errors=[],
+        config={}, items="Thing",
+    )
+    with pytest.raises(UnknownDataTypeError):
+        data_type.compile_validator()
+
+
+#####
+# validate_batch
+#####
+PERSON_FIELDS = [
+    "name", "age", "code", "status", "address", "tags", "friends",
+    "nickname", "*"
+]
+
+
+def test_validate_batch_records(root):
+    person = root.types.filter_by(name="Person").one()
+    records = [
+        {"name": "Lynn", "age": 30},
+        {"name": "", "age": -1, "code": "abc"},
+        {"age": 3, "address": {"street": "Main St", "zip": "1"}},
+        "not a record",
+    ]
+    result = validate_batch(person, records)
+    assert result.fields == PERSON_FIELDS
+    assert result.bitmap == [
+        0,
+        0b111,          # name, age, code
+        0b10001,        # name (missing), address
+        0b100000011,    # name & age missing, record
+    ]
+
+
+def test_validate_batch_records_match_compiled(root):
+    person = root.types.filter_by(name="Person").one()
+    validate = person.compile_validator()
+    records = [
+        {"name": "Lynn", "age": 30, "tags": ["a"], "nickname": None},
+        {"name": "Lynn", "age": 30, "tags": ["a", 1]},
+        {"name": "Lynn", "age": "30", "status": "retired"},
+        {"name": "Lynn", "age": 30, "friends": [{"name": "Bob"}]},
+    ]
+    result = validate_batch(person, records)
+    assert [bool(b) for b in result.bitmap] == [
+        bool(validate(r)) for r in records
+    ]
+
+
+def test_validate_batch_columnar(root):
+    person = root.types.filter_by(name="Person").one()
+    columns = {
+        "name": ["Lynn", "", None],
+        "age": [30, 200, 3],
+        "status": ["active", "gone", None],
+    }
+    result = validate_batch(person, columns)
+    assert result.bitmap == [0, 0b1011, 0b1]
+
+
+def test_validate_batch_columnar_closed(root):
+    address = root.types.filter_by(name="Address").one()
+    columns = {"street": ["Main St"], "zip": ["12345"], "city": ["NYC"]}
+    result = validate_batch(address, columns)
+    assert result.fields == ["street", "zip", "*"]
+    assert result.bitmap == [0b100]
+
+
+def test_validate_batch_uneven_columns(root):
+    person = root.types.filter_by(name="Person").one()
+    with pytest.raises(ValueError):
+        validate_batch(person, {"name": ["a"], "age": [1, 2]})
+
+
+def test_validate_batch_numpy(root):
+    numpy = pytest.importorskip("numpy")
+    person = root.types.filter_by(name="Person").one()
+    columns = {
+        "name": numpy.array(["Lynn", "", "Bob"]),
+        "age": numpy.array([30, 200, 3]),
+        "status": numpy.array(["active", "gone", "retired"]),
+        "code": numpy.array(["ABC", "abc", "AB"]),
+    }
+    result = validate_batch(person, columns)
+    assert result.bitmap == [0, 0b1111, 0b100]
+
+
+#####
+# compile_request_validator
+#####
+@pytest.fixture(scope="session")
+def params_api():
+    return parse(os.path.join(RAML_08, "request-params.raml"))
+
+
+def _param_messages(errors):
+    assert all(isinstance(e, InvalidParameterError) for e in errors)
+    return [e.args[0] for e in errors]
+
+
+def test_resource_has_request_validator(params_api):
+    for res in params_api.resources:
+        assert callable(res.request_validator)
+
+
+def test_validate_request_valid(params_api):
+    res = params_api.resources.filter_by(method="get").one()
+    request = {
+        "uri": {"itemId": "12"},
+        "headers": {"x-api-key": "deadbeef"},
+        "query": {"limit": "10", "order": "asc", "tag": ["a", "b"],
+                  "verbose": "true"},
+    }
+    assert res.validate_request(request) == []
+    # already typed values are accepted as well
+    request["query"] = {"limit": 10, "verbose": False}
+    assert res.validate_request(request) == []
+
+
+def test_validate_request_invalid(params_api):
+    res = params_api.resources.filter_by(method="get").one()
+    request = {
+        "uri": {"itemId": "0"},
+        "query": {"limit": "abc", "order": "up", "verbose": "yes"},
+    }
+    errors = res.validate_request(request)
+    assert _param_messages(errors) == [
+        "uri.itemId: must be greater than or equal to 1, but got: 0",
+        "query.limit: expected an integer, but got: 'abc'",
+        "query.order: must be one of ['asc', 'desc'], but got: 'up'",
+        "query.verbose: expected a boolean, but got: 'yes'",
+        "headers.X-Api-Key: required parameter is missing",
+    ]
+    assert [e.parameter for e in errors] == [
+        "itemId", "limit", "order", "verbose", "X-Api-Key"
+    ]
+
+
+def test_validate_request_headers(params_api):
+    res = params_api.resources.filter_by(method="get").one()
+    request = {"uri": {"itemId": 1}, "headers": {"X-API-KEY": "nothex!!"}}
+    assert _param_messages(res.validate_request(request)) == [
+        "headers.X-Api-Key: must match pattern '^[a-f0-9]{8}$', "
+        "but got: 'nothex!!'"
+    ]
+
+
+def test_validate_request_repeat(params_api):
+    res = params_api.resources.filter_by(method="get").one()
+    request = {
+        "uri": {"itemId": 1},
+        "headers": {"X-Api-Key": "deadbeef"},
+        "query": {"limit": ["1", "2"]},
+    }
+    assert _param_messages(res.validate_request(request)) == [
+        "query.limit: parameter can not be repeated, but got: ['1', '2']"
+    ]
+
+
+def test_validate_request_body_form_params(params_api):
+    res = params_api.resources.filter_by(method="post").one()
+    validate = compile_request_validator(res)
+    request = {"uri": {"itemId": 1}, "form": {"name": "x"}}
+    assert _param_messages(validate(request)) == [
+        "form.name: must be at least 2 characters, but got: 'x'",
+        "form.price: required parameter is missing",
+    ]
+
+
+def test_validate_request_data_type(root):
+    res = root.resources.filter_by(path="/people/{code}").one()
+    request = {"uri": {"code": "abc"}, "query": {"age": "200"}}
+    assert _param_messages(res.validate_request(request)) == [
+        "uri.code: must match pattern '^[A-Z]{3}$', but got: 'abc'",
+        "query.age: must be less than or equal to 150, but got: 200",
+    ]
+    request = {"uri": {"code": "ABC"}, "query": {"age": "20"}}
+    assert res.validate_request(request) == []
+
+
+@pytest.mark.parametrize("payload", [
+    {"name": "Jo"}, {"name": ""}, {"name": 1}, {},
+])
+def test_released_raw(root, released_root, payload):
+    # inline facets of properties are kept for the validators
+    assert released_root.types.filter_by(name="Person").one().raw
+    assert (_messages(_validator(released_root, "Person")(payload)) ==
+            _messages(_validator(root, "Person")(payload)))
+
+
+INVALID_PATTERN_08 = """#%RAML 0.8
+title: Invalid Pattern
+baseUri: https://api.example.com
+/foo:
+  get:
+    queryParameters:
+      q:
+        type: string
+        pattern: "[unclosed"
+"""
+
+INVALID_PATTERN_10 = """#%RAML 1.0
+title: Invalid Pattern
+baseUri: https://api.example.com
+types:
+  Person:
+    type: object
+    properties:
+      code:
+        type: string
+        pattern: "[unclosed"
+/foo:
+  get:
+    queryParameters:
+      q:
+        type: string
+        pattern: "[unclosed"
+"""
+
+
+@pytest.mark.parametrize("raml,conf_file", [
+    (INVALID_PATTERN_08, None),
+    (INVALID_PATTERN_10, os.path.join(RAML_10, "test-config.ini")),
+])
+def test_invalid_pattern(tmpdir, raml, conf_file):
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(raml)
+    api = parse(str(raml_file), conf_file)
+    # the pattern is not checked, the other facets still are
+    resource = api.resources[0]
+    assert resource.validate_request({"query": {"q": "["}}) == []
+    if api.types:
+        validate = _validator(api, "Person")
+        assert validate({"code": "["}) == []
+        assert _messages(validate({"code": 1})) == [
+            "$.code: expected a string, but got: 1"]
+
+
+REQUIRED_PROPERTIES = """#%RAML 1.0
+title: Required Properties
+types:
+  Point:
+    type: object
+    properties:
+      x: number
+      y?: number
+      z:
+        type: number
+      label?:
+        type: string
+        required: true
+  Shape:
+    type: object
+    properties:
+      inner:
+        type: object
+        properties:
+          x: number
+          y?: number
+          z:
+            type: number
+"""
+
+
+def test_required_properties(tmpdir):
+    # required unless the name ends in ``?``, named or inline alike
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(REQUIRED_PROPERTIES)
+    api = parse(str(raml_file), os.path.join(RAML_10, "test-config.ini"))
+
+    validate = _validator(api, "Point")
+    assert _messages(validate({})) == [
+        "$.x: required property is missing, but got: None",
+        "$.z: required property is missing, but got: None",
+        "$.label: required property is missing, but got: None",
+    ]
+    assert validate({"x": 1, "z": 2, "label": "a"}) == []
+    assert _messages(validate({"x": 1, "y": "a", "z": 2, "label": "a"})) == [
+        "$.y: expected a number, but got: 'a'"]
+
+    validate = _validator(api, "Shape")
+    assert _messages(validate({"inner": {}})) == [
+        "$.inner.x: required property is missing, but got: None",
+        "$.inner.z: required property is missing, but got: None",
+    ]
+    assert validate({"inner": {"x": 1, "z": 2}}) == []
+    assert _messages(validate({"inner": {"x": 1, "y": "a", "z": 2}})) == [
+        "$.inner.y: expected a number, but got: 'a'"]
+
+    point = api.types.filter_by(name="Point").one()
+    result = validate_batch(point, [{}, {"x": 1, "z": 2, "label": "a"}])
+    assert result.fields == ["x", "y", "z", "label", "*"]
+    assert result.bitmap == [0b1101, 0]
+
+
+IMPLICIT_OBJECT = """#%RAML 1.0
+title: Implicit Object
+types:
+  Place:
+    type: object
+    properties:
+      loc:
+        properties:
+          lat: number
+"""
+
+
+def test_validate_batch_implicit_object(tmpdir):
+    # a property with ``properties`` but no ``type`` is an object
+    raml_file = tmpdir.join("api.raml")
+    raml_file.write(IMPLICIT_OBJECT)
+    api = parse(str(raml_file), os.path.join(RAML_10, "test-config.ini"))
+    place = api.types.filter_by(name="Place").one()
+    validate = place.compile_validator()
+    records = [{"loc": {"lat": 1}}, {"loc": {"lat": "a"}}, {"loc": "a"}]
+    result = validate_batch(place, records)
+    assert result.bitmap == [0, 1, 1]
+    assert [bool(b) for b in result.bitmap] == [
+        bool(validate(r)) for r in records
+    ]
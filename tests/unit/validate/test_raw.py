@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import glob
+import os
+
+import pytest
+
+from ramlfications import errors, validate
+from ramlfications.config import setup_config
+from ramlfications.models import ResourceNode
+from ramlfications.models.parameters import parameter_class, QueryParameter
+from ramlfications.parser import parse_raml
+from ramlfications.utils import load_file
+from ramlfications.validate.raw import validate_raw
+
+from tests.base import RAML_08, RAML_10, VALIDATE_08
+
+
+@pytest.fixture(scope="session")
+def config():
+    config = setup_config(os.path.join(VALIDATE_08, "valid-config.ini"))
+    config["validate"] = True
+    return config
+
+
+def _parse_errors(raml_file, config):
+    try:
+        parse_raml(load_file(raml_file), config)
+    except errors.InvalidRAMLError as e:
+        return e.errors
+    return []
+
+
+def _describe(error_list):
+    return [(type(e), e.args) for e in error_list]
+
+
+# files a parse fails on with other exceptions than InvalidRAMLError
+BROKEN = ("docs-not-list.raml", "empty-mapping-trait.raml",
+          "invalid-version.raml")
+
+
+@pytest.mark.parametrize("raml_file", [
+    f for f in sorted(glob.glob(os.path.join(VALIDATE_08, "*.raml")))
+    if os.path.basename(f) not in BROKEN
+] + [
+    os.path.join(RAML_08, "complete-valid-example.raml"),
+    os.path.join(RAML_08, "github.raml"),
+    os.path.join(RAML_08, "resource_types.raml"),
+])
+def test_same_errors_as_parse(raml_file, config):
+    expected = _describe(_parse_errors(raml_file, config))
+    assert _describe(validate_raw(load_file(raml_file), config)) == expected
+
+
+def test_raml_10():
+    raml_file = os.path.join(RAML_10, "validate", "data_types",
+                             "schema_and_type.raml")
+    config = setup_config(os.path.join(RAML_10, "test-config.ini"))
+    config["validate"] = True
+    expected = _describe(_parse_errors(raml_file, config))
+    assert expected
+    assert _describe(validate_raw(load_file(raml_file), config)) == expected
+
+    raml_file = os.path.join(RAML_10, "broken-example-with-examples.raml")
+    with pytest.raises(errors.InvalidRAMLStructureError):
+        validate_raw(load_file(raml_file), config)
+
+
+def test_builds_no_nodes(config, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("built a node")
+    monkeypatch.setattr(ResourceNode, "__init__", fail)
+    monkeypatch.setattr(parameter_class(QueryParameter, "0.8"), "__init__",
+                        fail)
+
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    assert validate_raw(load_file(raml_file), config) == []
+
+
+def test_invalid_version(config):
+    raml_file = os.path.join(VALIDATE_08, "invalid-version.raml")
+    with pytest.raises(errors.InvalidVersionError):
+        validate_raw(load_file(raml_file), config)
+
+
+def test_validate_fast():
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    with pytest.raises(errors.InvalidRAMLError) as e:
+        validate(raml_file, fast=True)
+    assert len(e.value.errors) == 2
+
+    validate(os.path.join(RAML_08, "complete-valid-example.raml"), fast=True)
+
+
+def test_fail_fast(config):
+    raml_file = os.path.join(VALIDATE_08, "no-base-uri-no-title.raml")
+    expected = _describe(_parse_errors(raml_file, config))
+    with pytest.raises(errors.InvalidRAMLError) as e:
+        validate_raw(load_file(raml_file), config, fail_fast=True)
+    assert _describe(e.value.errors) == expected[:1]
+
+    raml_file = os.path.join(RAML_08, "complete-valid-example.raml")
+    assert validate_raw(load_file(raml_file), config, fail_fast=1) == []
+
+
+def test_fail_fast_fragment(tmpdir):
+    raml_file = tmpdir.join("person.raml")
+    raml_file.write("#%RAML 1.0 DataType\n"
+                    "type: object\n"
+                    "properties:\n"
+                    "  name: string\n")
+    config = setup_config(os.path.join(RAML_10, "test-config.ini"))
+    config["validate"] = True
+    loaded = load_file(str(raml_file))
+    assert validate_raw(loaded, config) == []
+    assert validate_raw(loaded, config, fail_fast=True) == []
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2016 Spotify AB
+from __future__ import absolute_import, division, print_function
+
+import gc
+
+from ramlfications.config import setup_config
+from ramlfications.utils.common import OrderedDict
+from ramlfications.validate import utils
+
+
+def test_validate_mime_type():
+    assert utils.validate_mime_type("application/vnd.foo.json")
+    assert not utils.validate_mime_type("text/plain")
+
+
+def test_get_context_cached_per_config():
+    config = setup_config()
+    context = utils.get_context(config)
+    assert utils.get_context(config) is context
+    assert isinstance(context.media_types, frozenset)
+    assert 200 in context.resp_codes
+    assert "HTTPS" in context.protocols
+    assert "string" in context.prim_types
+
+    # the same lookup lists, e.g. the configurations of two parses
+    assert utils.get_context(setup_config()) is context
+
+    other = setup_config()
+    other["protocols"] = ["HTTPS"]
+    assert utils.get_context(other) is not context
+
+
+def test_get_context_keeps_recent():
+    configs = [setup_config() for _ in range(utils._MAX_CONTEXTS + 2)]
+    for i, config in enumerate(configs):
+        config["protocols"] = ["HTTP{0}".format(i)]
+        utils.get_context(config)
+    assert len(utils._CONTEXTS) == utils._MAX_CONTEXTS
+    assert len(utils._CONFIGS) == utils._MAX_CONTEXTS
+    # the configurations looked up last are kept, not the first ones
+    context = utils.get_context(configs[-1])
+    assert utils.get_context(configs[-1]) is context
+    assert id(configs[0]) not in utils._CONFIGS
+
+
+def test_get_context_rebuilt_when_lists_replaced():
+    config = setup_config()
+    context = utils.get_context(config)
+    assert not context.supported_media_type("foo/bar")
+
+    config["media_types"] = config["media_types"] + ["foo/bar"]
+    context = utils.get_context(config)
+    assert context.supported_media_type("foo/bar")
+    assert context.supported_media_type("application/json")
+    assert context.supported_media_type("application/vnd.api.xml")
+
+
+def test_declared_names_raml08():
+    raw = OrderedDict([
+        ("traits", [{"paged": {}}, {"secured": {}}]),
+        ("resourceTypes", [{"collection": {}}]),
+    ])
+    names = utils.declared_names(raw, "traits")
+    assert names == frozenset(["paged", "secured"])
+    assert utils.declared_names(raw, "traits") is names
+    assert utils.declared_names(raw, "resourceTypes") == frozenset(
+        ["collection"])
+
+
+def test_declared_names_raml10():
+    raw = OrderedDict([("traits", OrderedDict([("paged", {})]))])
+    assert utils.declared_names(raw, "traits") == frozenset(["paged"])
+    assert utils.declared_names(raw, "resourceTypes") == frozenset()
+
+
+def test_declared_names_dropped_with_raw():
+    raw = OrderedDict([("traits", [{"paged": {}}])])
+    utils.declared_names(raw, "traits")
+    key = (id(raw), "traits")
+    assert key in utils._NAMES
+    del raw
+    gc.collect()
+    assert key not in utils._NAMES
+
+
+def test_declared_names_plain_dict():
+    raw = {"traits": [{"paged": {}}]}
+    assert utils.declared_names(raw, "traits") == frozenset(["paged"])
+
+
+def test_context_structured_suffix():
+    context = utils.get_context(setup_config())
+    assert context.supported_media_type("application/vnd.github.v3+json")
+    assert context.supported_media_type("application/vnd.api+xml")
+    assert not context.supported_media_type("application/vnd.api+zip")
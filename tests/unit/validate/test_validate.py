@@ -79,7 +79,6 @@ def test_invalid_version_base_uri():
     assert _error_exists(e.value.errors, errors.InvalidRootNodeError, msg)
 
 
-@pytest.mark.skipif(1 == 1, reason="FIXME fool")
 def test_undefined_base_uri_and_title():
     raml = load_raml("no-base-uri-no-title.raml")
     config = load_config("valid-config.ini")